@@ -99,9 +99,7 @@ async def analyze_data_completeness(
                             2,
                         ),
                         is_half_day=vr.expected_candles == 210,
-                        missing_periods=[
-                            f"{start} to {end}" for start, end in vr.missing_periods
-                        ],
+                        missing_periods=vr.formatted_missing_periods(),
                         missing_periods_count=len(vr.missing_periods),
                         largest_gap_minutes=max(
                             [
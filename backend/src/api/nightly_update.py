@@ -27,6 +27,7 @@ from services.progress.nightly_update_progress_service import (
 )
 from services.validation.stock_market_validation_service import (
     StockMarketValidationService,
+    get_stock_market_validation_service,
 )
 from services.workflows.stock_market_nightly_update_service import (
     StockMarketNightlyUpdateService,
@@ -49,8 +50,8 @@ def get_nightly_update_service() -> StockMarketNightlyUpdateService:
 
 
 def get_validation_service() -> StockMarketValidationService:
-    """Dependency to get validation service instance."""
-    return StockMarketValidationService()
+    """Dependency to get the shared validation service instance."""
+    return get_stock_market_validation_service()
 
 
 def get_progress_service() -> NightlyUpdateProgressService:
@@ -267,6 +267,11 @@ class NightlyUpdateSettings(BaseModel):
     enable_auto_resampling: bool = Field(
         default=True, description="Enable automatic resampling after updates"
     )
+    hierarchical_resampling: bool = Field(
+        default=True,
+        description="Build longer timeframes from already resampled shorter ones "
+        "when their buckets nest, instead of from the source data",
+    )
 
 
 class ProjectSettings(BaseSettings):
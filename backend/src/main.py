@@ -14,6 +14,9 @@ from simutrador_core.utils import configure_third_party_loggers, setup_logger
 
 from api import data_analysis_router, simulation_router, trading_data_router
 from api.nightly_update import router as nightly_update_router
+from services.workflows.stock_market_nightly_update_service import (
+    shutdown_resample_executor,
+)
 
 # Configure standardized logging for the application
 logger = setup_logger(
@@ -36,7 +39,8 @@ async def lifespan(_app: FastAPI):  # noqa: ARG001
         "Available endpoints: /docs, /trading-data, /nightly-update, /data-analysis"
     )
     yield
-    # Shutdown (if needed)
+    # Shutdown: let in-flight resampling finish before the process exits
+    shutdown_resample_executor()
 
 
 # Create FastAPI application with metadata
@@ -6,6 +6,7 @@ enabling vendor-agnostic data fetching with consistent error handling and data f
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import date
 from types import TracebackType
 
@@ -65,6 +66,37 @@ class DataProviderInterface(ABC):
         """
         pass
 
+    async def iter_historical_data(
+        self,
+        symbol: str,
+        timeframe: str = "1min",
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> AsyncIterator[PriceDataSeries]:
+        """
+        Fetch historical price data as consecutive series, oldest first.
+
+        Providers that split long ranges into several requests override this to
+        yield each request's candles as soon as they arrive, so callers can store
+        them while the next request is in flight. The default yields the whole
+        fetch_historical_data result at once.
+
+        Args:
+            symbol: Trading symbol (e.g., "AAPL")
+            timeframe: Timeframe for data (e.g., "1min", "5min", "1day", "daily")
+            from_date: Start date for data
+            to_date: End date for data
+
+        Yields:
+            PriceDataSeries for consecutive parts of the date range
+
+        Raises:
+            DataProviderError: If API request fails
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit is exceeded
+        """
+        yield await self.fetch_historical_data(symbol, timeframe, from_date, to_date)
+
     @abstractmethod
     async def fetch_latest_data(
         self, symbol: str, timeframe: str = "1min"
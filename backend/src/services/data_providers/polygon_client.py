@@ -10,8 +10,10 @@ This service handles API calls to Polygon.io, including:
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from types import TracebackType
 from typing import Any, TypedDict, cast, override
 
@@ -30,6 +32,17 @@ from .data_provider_interface import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=65536, typed=True)
+def _to_decimal(value: float) -> Decimal:
+    """
+    Convert a price or volume from the API to Decimal.
+
+    Cached because prices repeat often across the candles of a fetch; typed so
+    that 100 and 100.0 keep their own string forms.
+    """
+    return Decimal(str(value))
+
+
 # API Response Type Definitions
 class PolygonCandle(TypedDict):
     """Type definition for Polygon API response candle."""
@@ -162,7 +175,8 @@ class PolygonClient(DataProviderInterface):
             timeout=30.0,
             limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
         )
-        self._last_request_time = 0.0
+        # Loop time of the next free request slot, shared by all concurrent callers
+        self._next_request_time = 0.0
         self._request_count = 0
 
     @override
@@ -181,8 +195,14 @@ class PolygonClient(DataProviderInterface):
         await self.client.aclose()
 
     async def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting based on API limits with conservative approach."""
-        current_time = asyncio.get_event_loop().time()
+        """
+        Enforce rate limiting based on API limits with conservative approach.
+
+        Each call reserves the next free request slot before sleeping, so
+        concurrent requests through one client are spaced out instead of all
+        seeing the same last request time and firing together.
+        """
+        current_time = asyncio.get_running_loop().time()
 
         # Use a more reasonable rate limit based on plan
         # Most paid plans can handle 50+ requests/second
@@ -190,14 +210,20 @@ class PolygonClient(DataProviderInterface):
             self.polygon_settings.rate_limit_requests_per_second, 50
         )
         min_interval = 1.0 / conservative_rate
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            await asyncio.sleep(min_interval - time_since_last)
 
-        self._last_request_time = asyncio.get_event_loop().time()
+        request_time = max(current_time, self._next_request_time)
+        self._next_request_time = request_time + min_interval
         self._request_count += 1
 
+        if request_time > current_time:
+            await asyncio.sleep(request_time - current_time)
+
+    def _back_off_rate_limit(self) -> None:
+        """Hold back every caller of this client for a second after a 429."""
+        self._next_request_time = max(
+            self._next_request_time, asyncio.get_running_loop().time() + 1.0
+        )
+
     async def _make_request(
         self, endpoint: str, params: dict[str, Any]
     ) -> PolygonResponse:
@@ -237,6 +263,7 @@ class PolygonClient(DataProviderInterface):
             if e.response.status_code == 401:
                 raise AuthenticationError("Invalid API key")
             elif e.response.status_code == 429:
+                self._back_off_rate_limit()
                 raise RateLimitError("Rate limit exceeded")
             else:
                 raise PolygonError(
@@ -249,6 +276,19 @@ class PolygonClient(DataProviderInterface):
                 error_details += f" (URL: {e.request.url})"
             raise PolygonError(error_details)
 
+    async def fetch_url(self, url: str) -> httpx.Response:
+        """
+        Fetch a prebuilt Polygon URL (e.g. from PolygonUrlGenerator).
+
+        The request goes through this client's connection pool and rate limiter;
+        the raw response is returned so callers keep their own status handling.
+        """
+        await self._enforce_rate_limit()
+        response = await self.client.get(url, follow_redirects=True)
+        if response.status_code == 429:
+            self._back_off_rate_limit()
+        return response
+
     def _get_polygon_timeframe(self, timeframe: str) -> tuple[int, str]:
         """
         Convert our timeframe format to Polygon API format.
@@ -419,11 +459,11 @@ class PolygonClient(DataProviderInterface):
 
                 candle = PriceCandle(
                     date=timestamp,
-                    open=Decimal(str(candle_data["o"])),
-                    high=Decimal(str(candle_data["h"])),
-                    low=Decimal(str(candle_data["l"])),  # Fixed: use 'l' not 'low'
-                    close=Decimal(str(candle_data["c"])),
-                    volume=Decimal(str(candle_data["v"])),
+                    open=_to_decimal(candle_data["o"]),
+                    high=_to_decimal(candle_data["h"]),
+                    low=_to_decimal(candle_data["l"]),  # Fixed: use 'l' not 'low'
+                    close=_to_decimal(candle_data["c"]),
+                    volume=_to_decimal(candle_data["v"]),
                 )
                 candles.append(candle)
             except (KeyError, ValueError) as e:
@@ -590,6 +630,54 @@ class PolygonClient(DataProviderInterface):
             symbol=symbol, timeframe=Timeframe(timeframe), candles=result.candles
         )
 
+    @override
+    async def iter_historical_data(
+        self,
+        symbol: str,
+        timeframe: str = "1min",
+        from_date: date | None = None,
+        to_date: date | None = None,
+    ) -> AsyncIterator[PriceDataSeries]:
+        """
+        Fetch historical price data batch by batch, yielding each batch's series.
+
+        Uses the same batches as fetch_historical_data, so no extra requests are
+        made; a batch that still fails after retries is logged and skipped there
+        too. Callers can store a batch while the next one downloads instead of
+        holding the whole range in memory.
+
+        Args:
+            symbol: Trading symbol (e.g., "AAPL")
+            timeframe: Timeframe for data (e.g., "1min", "5min", "1day", "daily")
+            from_date: Start date for data
+            to_date: End date for data
+
+        Yields:
+            PriceDataSeries for each batch, oldest first
+        """
+        if to_date is None:
+            to_date = date.today()
+        if from_date is None:
+            from_date = to_date - timedelta(days=1)
+
+        batch_size_days = self._calculate_batch_size(timeframe)
+        batch_start = from_date
+        while batch_start <= to_date:
+            batch_end = min(batch_start + timedelta(days=batch_size_days - 1), to_date)
+            try:
+                candles = await self._fetch_batch_with_retry(
+                    symbol, timeframe, batch_start, batch_end
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to fetch batch {batch_start} to {batch_end} for {symbol}: {e}"
+                )
+            else:
+                yield PriceDataSeries(
+                    symbol=symbol, timeframe=Timeframe(timeframe), candles=candles
+                )
+            batch_start = batch_end + timedelta(days=1)
+
     async def retry_failed_batches(self, fetch_result: FetchResult) -> FetchResult:
         """
         Retry only the failed batches from a previous fetch attempt.
@@ -822,6 +910,7 @@ class PolygonClient(DataProviderInterface):
             if e.response.status_code == 401:
                 raise AuthenticationError("Invalid API key")
             elif e.response.status_code == 429:
+                self._back_off_rate_limit()
                 raise RateLimitError("Rate limit exceeded")
             else:
                 raise PolygonError(f"HTTP error {e.response.status_code}: {e}")
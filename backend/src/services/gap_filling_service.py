@@ -5,8 +5,13 @@ This service attempts to recover missing candles by making targeted requests
 to data providers for specific time periods where gaps are detected.
 """
 
+import asyncio
 import logging
-from datetime import UTC, date, datetime, timedelta
+from collections.abc import AsyncIterator, Iterable
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+from typing import cast
 
 from simutrador_core.models.price_data import PriceCandle, PriceDataSeries, Timeframe
 
@@ -23,6 +28,9 @@ from .storage.data_storage_service import DataStorageService
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on gap fills in flight at once (each makes Polygon requests)
+MAX_CONCURRENT_PERIOD_FILLS = 4
+
 
 # Type definitions for Polygon API responses
 PolygonCandle = dict[str, int | float]
@@ -39,11 +47,23 @@ class GapFillingService:
         # Use the polygon provider for gap filling
         self.data_provider = DataProviderFactory.create_provider(DataProvider.POLYGON)
 
+    def open_polygon_client(self) -> PolygonClient:
+        """
+        Create a Polygon client to share across several gap fills.
+
+        Use it as an async context manager; every fill made with it shares one
+        connection pool and one rate limiter.
+        """
+        return cast(
+            PolygonClient, DataProviderFactory.create_provider(DataProvider.POLYGON)
+        )
+
     async def fill_gaps_for_periods(
         self,
         symbol: str,
         missing_periods: list[tuple[datetime, datetime]],
         max_attempts: int = 50,
+        client: PolygonClient | None = None,
     ) -> list[GapFillResult]:
         """
         Attempt to fill gaps for specific missing periods.
@@ -52,6 +72,8 @@ class GapFillingService:
             symbol: Trading symbol
             missing_periods: List of (start_time, end_time) tuples for missing periods
             max_attempts: Maximum number of gaps to attempt filling
+            client: Optional open client from open_polygon_client; a new client
+                is opened and closed for this call when omitted
 
         Returns:
             List of GapFillResult objects with results of gap filling attempts
@@ -59,22 +81,110 @@ class GapFillingService:
         results: list[GapFillResult] = []
 
         # Limit the number of attempts to prevent excessive API calls
-        periods_to_process = missing_periods[:max_attempts]
-
         if len(missing_periods) > max_attempts:
             logger.warning(
-                f"Limiting gap filling to {max_attempts} periods out of {len(missing_periods)} "
-                f"for symbol {symbol}"
+                "Limiting gap filling to %d periods out of %d for symbol %s",
+                max_attempts,
+                len(missing_periods),
+                symbol,
             )
 
-        for start_time, end_time in periods_to_process:
-            result = await self._fill_single_gap(symbol, start_time, end_time)
-            results.append(result)
+        async with (
+            nullcontext(client) if client is not None else self.open_polygon_client()
+        ) as polygon_client:
+            # Iterate the caller's list in place rather than copying a slice of it
+            for start_time, end_time in islice(missing_periods, max_attempts):
+                result = await self._fill_single_gap(
+                    symbol, start_time, end_time, polygon_client
+                )
+                results.append(result)
 
         return results
 
+    async def fill_gaps_stream(
+        self,
+        symbol: str,
+        missing_periods: Iterable[tuple[datetime, datetime]],
+        max_attempts: int = 50,
+        max_concurrent: int = MAX_CONCURRENT_PERIOD_FILLS,
+        client: PolygonClient | None = None,
+        fill_slots: asyncio.Semaphore | None = None,
+    ) -> AsyncIterator[GapFillResult]:
+        """
+        Fill gaps for missing periods concurrently, yielding results as they finish.
+
+        Periods are pulled from the iterable only when a slot frees up, so at
+        most max_concurrent fills are in flight and results arrive in completion
+        order rather than period order.
+
+        Args:
+            symbol: Trading symbol
+            missing_periods: Iterable of (start_time, end_time) tuples for missing periods
+            max_attempts: Maximum number of gaps to attempt filling
+            max_concurrent: Maximum number of gaps filled at the same time
+            client: Optional open client from open_polygon_client; a new client
+                is opened and closed for this stream when omitted
+            fill_slots: Optional semaphore shared by several concurrent streams,
+                so their fills together stay under one limit
+
+        Yields:
+            GapFillResult for each attempted period
+        """
+        if client is None:
+            async with self.open_polygon_client() as own_client:
+                async for result in self.fill_gaps_stream(
+                    symbol,
+                    missing_periods,
+                    max_attempts,
+                    max_concurrent,
+                    own_client,
+                    fill_slots,
+                ):
+                    yield result
+            return
+
+        slots = fill_slots or asyncio.Semaphore(max_concurrent)
+
+        async def fill(start_time: datetime, end_time: datetime) -> GapFillResult:
+            async with slots:
+                return await self._fill_single_gap(symbol, start_time, end_time, client)
+
+        periods = iter(missing_periods)
+        in_flight: set[asyncio.Task[GapFillResult]] = set()
+        try:
+            for start_time, end_time in islice(periods, max_attempts):
+                if len(in_flight) >= max_concurrent:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                in_flight.add(asyncio.create_task(fill(start_time, end_time)))
+
+            if next(periods, None) is not None:
+                logger.warning(
+                    "Limiting gap filling to %d periods for symbol %s",
+                    max_attempts,
+                    symbol,
+                )
+
+            while in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # Don't leave fills running if the consumer stops early
+            for task in in_flight:
+                task.cancel()
+
     async def _check_trading_activity(
-        self, symbol: str, start_time: datetime, end_time: datetime
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        client: PolygonClient | None = None,
     ) -> tuple[bool, str]:
         """
         Check if there was any trading activity during the gap period using trades endpoint.
@@ -83,14 +193,18 @@ class GapFillingService:
             symbol: Trading symbol
             start_time: Start of the gap
             end_time: End of the gap
+            client: Optional open client from open_polygon_client; a new client
+                is opened and closed for this check when omitted
 
         Returns:
             Tuple of (has_trading_activity, status_message)
         """
         try:
             # Use Polygon client to check for trades
-            async with DataProviderFactory.create_provider(
-                DataProvider.POLYGON
+            async with (
+                nullcontext(client)
+                if client is not None
+                else self.open_polygon_client()
             ) as client:
                 if isinstance(client, PolygonClient):
                     trades = await client.fetch_trades_data(
@@ -101,8 +215,11 @@ class GapFillingService:
                     )
                     has_activity = len(trades) > 0
                     logger.info(
-                        f"Trading activity check for {symbol} {start_time}-{end_time}: "
-                        f"{'Found' if has_activity else 'No'} trades"
+                        "Trading activity check for %s %s-%s: %s trades",
+                        symbol,
+                        start_time,
+                        end_time,
+                        "Found" if has_activity else "No",
                     )
                     return has_activity, "Trading activity check completed"
                 else:
@@ -112,7 +229,7 @@ class GapFillingService:
                     return False, "Non-Polygon provider, cannot check trading activity"
 
         except Exception as e:
-            logger.error(f"Error checking trading activity for {symbol}: {e}")
+            logger.error("Error checking trading activity for %s: %s", symbol, e)
             return False, f"Error checking trades: {str(e)}"
 
     def _generate_polygon_api_url(
@@ -135,11 +252,15 @@ class GapFillingService:
             return url_generator.generate_url_for_period(symbol, start_time, end_time)
 
         except Exception as e:
-            logger.error(f"Error generating Polygon URL for {symbol}: {e}")
+            logger.error("Error generating Polygon URL for %s: %s", symbol, e)
             return f"Error generating URL: {str(e)}"
 
     async def _fill_single_gap(
-        self, symbol: str, start_time: datetime, end_time: datetime
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        client: PolygonClient | None = None,
     ) -> GapFillResult:
         """
         Attempt to fill a single gap.
@@ -148,22 +269,30 @@ class GapFillingService:
             symbol: Trading symbol
             start_time: Start of the gap
             end_time: End of the gap
+            client: Optional open client from open_polygon_client; a new client
+                is opened and closed for this fill when omitted
 
         Returns:
             GapFillResult with the outcome of the gap filling attempt
         """
-        logger.info(f"Attempting to fill gap for {symbol}: {start_time} to {end_time}")
+        if client is None:
+            async with self.open_polygon_client() as own_client:
+                return await self._fill_single_gap(
+                    symbol, start_time, end_time, own_client
+                )
+
+        logger.info("Attempting to fill gap for %s: %s to %s", symbol, start_time, end_time)
 
         # Generate the Polygon API URLs for this gap
         polygon_url = self._generate_polygon_api_url(symbol, start_time, end_time)
-        logger.info(f"Polygon Aggregates API URL for gap: {polygon_url}")
+        logger.info("Polygon Aggregates API URL for gap: %s", polygon_url)
 
         # Generate Polygon Trades API URL for gap analysis (as requested)
         url_generator = PolygonUrlGenerator()
         trades_url = url_generator.generate_trades_url_for_period(
             symbol, start_time, end_time
         )
-        logger.info(f"Polygon Trades API URL for gap analysis: {trades_url}")
+        logger.info("Polygon Trades API URL for gap analysis: %s", trades_url)
 
         try:
             # Check if we should use trades endpoint based on plan configuration
@@ -173,89 +302,75 @@ class GapFillingService:
             if use_trades_endpoint:
                 # Use trades endpoint for gap filling (requires higher-tier plan)
                 logger.info(
-                    f"Making trades API call for gap filling: {symbol} from {start_time} to \
-                        {end_time}"
+                    "Making trades API call for gap filling: %s from %s to %s",
+                    symbol,
+                    start_time,
+                    end_time,
                 )
-                logger.info(f"Polygon Trades URL being used: {trades_url}")
-
-                # Use Polygon client to fetch trades data for gap filling
-                async with DataProviderFactory.create_provider(
-                    DataProvider.POLYGON
-                ) as client:
-                    if isinstance(client, PolygonClient):
-                        trades_data = await client.fetch_trades_data(
-                            symbol, start_time, end_time, limit=50000
-                        )
+                logger.info("Polygon Trades URL being used: %s", trades_url)
+
+                # Fetch trades data for gap filling through the shared client
+                trades_data = await client.fetch_trades_data(
+                    symbol, start_time, end_time, limit=50000
+                )
+                logger.info("Retrieved %d trades for gap filling", len(trades_data))
+
+                # Convert trades to OHLCV candles (this will need implementation)
+                # For now, we'll use the existing aggregates fallback
+                if len(trades_data) > 0:
+                    logger.info(
+                        "Trades data found, but OHLCV conversion not yet implemented"
+                    )
+                    # TODO: Implement trades-to-OHLCV conversion
+                    # For now, fall back to aggregates endpoint
+                    response = await client.fetch_url(polygon_url)
+                    if response.status_code == 200:
+                        polygon_data: PolygonApiResponse = response.json()
                         logger.info(
-                            f"Retrieved {len(trades_data)} trades for gap filling"
+                            "Fallback aggregates API response: %s - %s results",
+                            polygon_data.get("status"),
+                            polygon_data.get("resultsCount", 0),
                         )
-
-                        # Convert trades to OHLCV candles (this will need implementation)
-                        # For now, we'll use the existing aggregates fallback
-                        if len(trades_data) > 0:
-                            logger.info(
-                                "Trades data found, but OHLCV conversion not yet implemented"
-                            )
-                            # TODO: Implement trades-to-OHLCV conversion
-                            # For now, fall back to aggregates endpoint
-                            import httpx
-
-                            async with httpx.AsyncClient() as client_http:
-                                response = await client_http.get(polygon_url)
-                                if response.status_code == 200:
-                                    polygon_data: PolygonApiResponse = response.json()
-                                    logger.info(
-                                        f"Fallback aggregates API response: \
-                                            {polygon_data.get('status')} - "
-                                        f"{polygon_data.get('resultsCount', 0)} results"
-                                    )
-                                else:
-                                    logger.error(
-                                        f"Fallback aggregates API failed: {response.status_code}"
-                                    )
-                                    polygon_data: PolygonApiResponse = {
-                                        "results": [],
-                                        "status": "ERROR",
-                                    }
-                        else:
-                            logger.info("No trades found for gap period")
-                            polygon_data: PolygonApiResponse = {
-                                "results": [],
-                                "status": "OK",
-                            }
                     else:
                         logger.error(
-                            "Non-Polygon provider, cannot use trades endpoint for gap filling"
+                            "Fallback aggregates API failed: %s", response.status_code
                         )
                         polygon_data: PolygonApiResponse = {
                             "results": [],
                             "status": "ERROR",
                         }
+                else:
+                    logger.info("No trades found for gap period")
+                    polygon_data: PolygonApiResponse = {
+                        "results": [],
+                        "status": "OK",
+                    }
             else:
                 # Use aggregates endpoint for gap filling (available on all plans)
                 logger.info(
-                    f"Making aggregates API call for gap filling: \
-                        {symbol} from {start_time} to {end_time}"
+                    "Making aggregates API call for gap filling: %s from %s to %s",
+                    symbol,
+                    start_time,
+                    end_time,
                 )
-                logger.info(f"Polygon Aggregates URL being used: {polygon_url}")
-
-                # Make direct HTTP request to Polygon Aggregates API
-                import httpx
+                logger.info("Polygon Aggregates URL being used: %s", polygon_url)
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(polygon_url)
-                    if response.status_code == 200:
-                        polygon_data: PolygonApiResponse = response.json()
-                        logger.info(
-                            f"Aggregates API response: {polygon_data.get('status')} - "
-                            f"{polygon_data.get('resultsCount', 0)} results"
-                        )
-                    else:
-                        logger.error(f"Aggregates API failed: {response.status_code}")
-                        polygon_data: PolygonApiResponse = {
-                            "results": [],
-                            "status": "ERROR",
-                        }
+                # Request the Polygon Aggregates API through the shared client,
+                # so the fill counts against its rate limiter
+                response = await client.fetch_url(polygon_url)
+                if response.status_code == 200:
+                    polygon_data: PolygonApiResponse = response.json()
+                    logger.info(
+                        "Aggregates API response: %s - %s results",
+                        polygon_data.get("status"),
+                        polygon_data.get("resultsCount", 0),
+                    )
+                else:
+                    logger.error("Aggregates API failed: %s", response.status_code)
+                    polygon_data: PolygonApiResponse = {
+                        "results": [],
+                        "status": "ERROR",
+                    }
 
             # Convert Polygon response to our PriceCandle format
             candles: list[PriceCandle] = []
@@ -297,13 +412,16 @@ class GapFillingService:
                     )
                     candles.append(candle)
 
-            logger.info(f"Converted {len(candles)} Polygon results to PriceCandles")
+            logger.info("Converted %d Polygon results to PriceCandles", len(candles))
 
             # Filter candles to the exact time range we need
             relevant_candles: list[PriceCandle] = []
             if candles:
                 logger.info(
-                    f"Filtering {len(candles)} candles for time range {start_time} to {end_time}"
+                    "Filtering %d candles for time range %s to %s",
+                    len(candles),
+                    start_time,
+                    end_time,
                 )
                 for i, candle in enumerate(candles):
                     candle_time = candle.date
@@ -313,32 +431,35 @@ class GapFillingService:
                     # Log first few candles and any that might match our time range
                     if i < 5 or (start_time <= candle_time <= end_time):
                         logger.info(
-                            f"Candle {i}: {candle_time} | Range: {start_time} to {end_time} | "
-                            f"In range: {start_time <= candle_time < end_time}"
+                            "Candle %d: %s | Range: %s to %s | In range: %s",
+                            i,
+                            candle_time,
+                            start_time,
+                            end_time,
+                            start_time <= candle_time < end_time,
                         )
 
                     # Check if this candle falls within our missing period (inclusive end)
                     if start_time <= candle_time <= end_time:
                         relevant_candles.append(candle)
-                        logger.info(
-                            f"✅ Candle at {candle_time} matches missing period"
-                        )
+                        logger.info("✅ Candle at %s matches missing period", candle_time)
                     elif (
                         abs((candle_time - start_time).total_seconds()) < 300
                     ):  # Within 5 minutes
                         seconds_diff = (candle_time - start_time).total_seconds()
                         logger.info(
-                            f"🔍 Near-miss candle at {candle_time} "
-                            f"(outside range by {seconds_diff}s)"
+                            "🔍 Near-miss candle at %s (outside range by %ss)",
+                            candle_time,
+                            seconds_diff,
                         )
 
-            logger.info(f"Filtered to {len(relevant_candles)} relevant candles")
+            logger.info("Filtered to %d relevant candles", len(relevant_candles))
             success = len(relevant_candles) > 0
 
             if not success:
                 # Check if there was any trading activity during this period
                 has_activity, _ = await self._check_trading_activity(
-                    symbol, start_time, end_time
+                    symbol, start_time, end_time, client
                 )
 
                 return GapFillResult(
@@ -362,59 +483,33 @@ class GapFillingService:
                 # Store the recovered candles
                 if relevant_candles:
                     logger.info(
-                        f"Storing {len(relevant_candles)} recovered candles for {symbol}"
+                        "Storing %d recovered candles for %s",
+                        len(relevant_candles),
+                        symbol,
                     )
 
-                    # Group candles by date for storage
-                    candles_by_date: dict[date, list[PriceCandle]] = {}
-                    for candle in relevant_candles:
-                        candle_date = candle.date.date()
-                        if candle_date not in candles_by_date:
-                            candles_by_date[candle_date] = []
-                        candles_by_date[candle_date].append(candle)
-
-                    # Store candles for each date
-                    for candle_date, date_candles in candles_by_date.items():
-                        try:
-                            # Load existing data for the date
-                            existing_series = self.storage_service.load_data(
-                                symbol=symbol,
-                                timeframe="1min",
-                                start_date=candle_date,
-                                end_date=candle_date,
-                            )
-
-                            # Merge with existing candles
-                            all_candles: list[PriceCandle] = (
-                                list(existing_series.candles) if existing_series else []
-                            )
-
-                            # Add new candles (avoid duplicates)
-                            existing_times = {c.date for c in all_candles}
-                            for new_candle in date_candles:
-                                if new_candle.date not in existing_times:
-                                    all_candles.append(new_candle)
-
-                            # Sort by time
-                            all_candles.sort(key=lambda c: c.date)
-
-                            # Store updated data
-                            updated_series = PriceDataSeries(
+                    # One merge per day file, done in Arrow by the storage
+                    # service; candles already stored win over recovered ones
+                    try:
+                        self.storage_service.store_data(
+                            PriceDataSeries(
                                 symbol=symbol,
                                 timeframe=Timeframe.ONE_MIN,
-                                candles=all_candles,
-                            )
-
-                            self.storage_service.store_data(updated_series)
-
-                        except Exception as e:
-                            logger.error(
-                                f"Error storing recovered candles for {candle_date}: {e}"
-                            )
+                                candles=relevant_candles,
+                            ),
+                            keep_existing=True,
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "Error storing recovered candles for %s: %s", symbol, e
+                        )
 
                 logger.info(
-                    f"Successfully recovered {len(relevant_candles)} candles for {symbol} "
-                    f"in period {start_time} to {end_time}"
+                    "Successfully recovered %d candles for %s in period %s to %s",
+                    len(relevant_candles),
+                    symbol,
+                    start_time,
+                    end_time,
                 )
                 # For successful cases, we don't need to check trading activity
                 return GapFillResult(
@@ -430,12 +525,15 @@ class GapFillingService:
                 )
             else:
                 logger.warning(
-                    f"No candles recovered for {symbol} in period {start_time} to {end_time} "
-                    "- data may be unavailable from vendor"
+                    "No candles recovered for %s in period %s to %s "
+                    "- data may be unavailable from vendor",
+                    symbol,
+                    start_time,
+                    end_time,
                 )
                 # Check if there was any trading activity during this period
                 has_activity, _ = await self._check_trading_activity(
-                    symbol, start_time, end_time
+                    symbol, start_time, end_time, client
                 )
 
                 return GapFillResult(
@@ -456,7 +554,7 @@ class GapFillingService:
                 )
 
         except Exception as e:
-            logger.error(f"Error filling gap for {symbol}: {e}")
+            logger.error("Error filling gap for %s: %s", symbol, e)
             return GapFillResult(
                 start_time=start_time.isoformat(),
                 end_time=end_time.isoformat(),
@@ -512,12 +610,12 @@ class GapFillingService:
                                 total_candles += 1
 
                 except Exception as e:
-                    logger.debug(f"No data found for {symbol} on {current_date}: {e}")
+                    logger.debug("No data found for %s on %s: %s", symbol, current_date, e)
 
                 current_date += timedelta(days=1)
 
             return total_candles
 
         except Exception as e:
-            logger.error(f"Error counting recovered candles for {symbol}: {e}")
+            logger.error("Error counting recovered candles for %s: %s", symbol, e)
             return 0
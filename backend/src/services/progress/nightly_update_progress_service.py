@@ -44,11 +44,8 @@ class NightlyUpdateProgressService:
         error_message: str | None = None,
     ) -> None:
         """Update progress for a specific symbol."""
-        if (
-            request_id in self._progress_tracking
-            and symbol in self._progress_tracking[request_id]
-        ):
-            progress = self._progress_tracking[request_id][symbol]
+        progress = self._progress_tracking.get(request_id, {}).get(symbol)
+        if progress is not None:
             progress.status = status
             progress.progress_percentage = progress_percentage
             progress.current_step = current_step
@@ -56,7 +53,7 @@ class NightlyUpdateProgressService:
                 progress.error_message = error_message
             if status == "downloading" and not progress.started_at:
                 progress.started_at = datetime.now()
-            elif status in ["completed", "failed"]:
+            elif status in ("completed", "failed"):
                 progress.completed_at = datetime.now()
 
     def calculate_overall_progress(self, request_id: str) -> ProgressInfo:
@@ -0,0 +1,15 @@
+"""
+Storage module.
+
+This module contains services for data persistence, retrieval, and transformation.
+"""
+
+from .data_resampling_service import DataResamplingError, DataResamplingService
+from .data_storage_service import DataStorageError, DataStorageService
+
+__all__ = [
+    "DataStorageService",
+    "DataStorageError",
+    "DataResamplingService", 
+    "DataResamplingError",
+]
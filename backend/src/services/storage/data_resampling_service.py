@@ -0,0 +1,992 @@
+"""
+Data resampling service for converting trading data between different timeframes.
+
+This service:
+- Reads data from storage at any supported timeframe
+- Resamples to target timeframes using pandas
+- Stores the resampled data in appropriate Parquet files
+- Handles data validation and error cases
+- Supports flexible timeframe conversions (1min→5min, 5min→1h, etc.)
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from simutrador_core.models.asset_types import AssetType, get_resampling_offset
+from simutrador_core.models.price_data import PriceCandle, PriceDataSeries, Timeframe
+from simutrador_core.utils import (
+    get_default_logger,
+    get_pandas_frequency,
+    get_resampling_rules,
+    validate_timeframe_conversion,
+)
+
+from ..classification.asset_classification_service import (
+    AssetClassificationService,
+)
+from .data_storage_service import DataStorageError, DataStorageService
+
+logger = get_default_logger("data_resampling")
+
+# Candle fields carried through resampling, in DataFrame column order
+OHLCV_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+
+
+def _frequency_timedelta(frequency: str) -> pd.Timedelta:
+    """Length of a fixed pandas frequency such as "5min", "1h" or "D"."""
+    return pd.Timedelta(frequency if frequency[0].isdigit() else f"1{frequency}")
+
+
+def _aggregate_sorted_ohlcv(
+    df: pd.DataFrame, frequency: str, offset: str | None
+) -> pd.DataFrame:
+    """
+    Aggregate a date-sorted OHLCV frame into fixed-length buckets.
+
+    Each row's bucket is its timestamp floored to the frequency (shifted by the
+    offset), so a bucket is a contiguous run of rows. One reduceat pass per
+    column then gives open/close from the run ends, high/low from max/min and
+    volume from the sum. Only buckets that hold rows are returned, like
+    resample().agg() followed by dropping the empty periods.
+    """
+    shift = pd.Timedelta(offset or 0).as_unit(df.index.unit)  # type: ignore[attr-defined]
+    labels = (df.index - shift).floor(frequency) + shift
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)] - 1
+    return pd.DataFrame(
+        {
+            "open": df["open"].to_numpy()[starts],
+            "high": np.maximum.reduceat(df["high"].to_numpy(), starts),
+            "low": np.minimum.reduceat(df["low"].to_numpy(), starts),
+            "close": df["close"].to_numpy()[ends],
+            "volume": np.add.reduceat(df["volume"].to_numpy(), starts),
+        },
+        index=labels[starts],
+    )
+
+
+class DataResamplingError(Exception):
+    """Base exception for data resampling errors."""
+
+    pass
+
+
+class DataResamplingService:
+    """
+    Service for resampling trading data between different timeframes.
+
+    Supports flexible timeframe conversions:
+    - 1min → 5min, 15min, 30min, 1h, 2h, 4h, daily
+    - 5min → 15min, 30min, 1h, 2h, 4h, daily
+    - 1h → 2h, 4h, daily
+    - etc.
+    """
+
+    def __init__(self):
+        """Initialize the resampling service."""
+        self.storage_service = DataStorageService()
+        self.asset_classifier = AssetClassificationService()
+
+    def resample_data(
+        self,
+        symbol: str,
+        from_timeframe: str,
+        to_timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> PriceDataSeries:
+        """
+        Resample trading data from one timeframe to another.
+
+        Args:
+            symbol: Trading symbol
+            from_timeframe: Source timeframe (e.g., "1min", "5min", "1h")
+            to_timeframe: Target timeframe (e.g., "5min", "1h", "daily")
+            start_date: Optional start date for resampling
+            end_date: Optional end date for resampling
+
+        Returns:
+            PriceDataSeries with resampled candles
+
+        Raises:
+            DataResamplingError: If resampling fails or timeframes are invalid
+        """
+        try:
+            # Validate timeframe conversion
+            if not validate_timeframe_conversion(from_timeframe, to_timeframe):
+                raise DataResamplingError(
+                    f"Invalid timeframe conversion: {from_timeframe} → {to_timeframe}. "
+                    f"Target timeframe must represent a longer period than source timeframe."
+                )
+
+            logger.info(f"Resampling {symbol} from {from_timeframe} to {to_timeframe}")
+
+            # Load source data
+            source_series = self.storage_service.load_data(
+                symbol=symbol,
+                timeframe=from_timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            if not source_series.candles:
+                logger.warning(f"No {from_timeframe} data found for {symbol}")
+                target_timeframe_enum = self._get_timeframe_enum(to_timeframe)
+                return PriceDataSeries(
+                    symbol=symbol, timeframe=target_timeframe_enum, candles=[]
+                )
+
+            # Convert to DataFrame for resampling
+            df = self._candles_to_dataframe(source_series.candles)
+
+            if df.empty:
+                target_timeframe_enum = self._get_timeframe_enum(to_timeframe)
+                return PriceDataSeries(
+                    symbol=symbol, timeframe=target_timeframe_enum, candles=[]
+                )
+
+            # Resample to target timeframe
+            resampled_df = self._resample_dataframe(df, to_timeframe, symbol)
+
+            # Convert back to candles
+            resampled_candles = self._dataframe_to_candles(resampled_df, to_timeframe)
+
+            logger.info(
+                f"Resampled {len(source_series.candles)} {from_timeframe} candles to "
+                f"{len(resampled_candles)} {to_timeframe} candles for {symbol}"
+            )
+
+            target_timeframe_enum = self._get_timeframe_enum(to_timeframe)
+            return PriceDataSeries(
+                symbol=symbol,
+                timeframe=target_timeframe_enum,
+                candles=resampled_candles,
+            )
+
+        except Exception as e:
+            raise DataResamplingError(
+                f"Failed to resample {symbol} from {from_timeframe} to {to_timeframe}: {str(e)}"
+            )
+
+    def resample_data_with_provider_alignment(
+        self,
+        symbol: str,
+        from_timeframe: str,
+        to_timeframe: str,
+        provider_metadata: dict[str, str],
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> PriceDataSeries:
+        """
+        Resample data using provider-specific alignment strategy.
+
+        This method adjusts the resampling logic based on how the data provider
+        natively aggregates data, ensuring our resampled data matches the provider's
+        native aggregates.
+
+        Args:
+            symbol: Trading symbol
+            from_timeframe: Source timeframe
+            to_timeframe: Target timeframe
+            provider_metadata: Provider-specific alignment metadata
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+
+        Returns:
+            Resampled PriceDataSeries
+        """
+        try:
+            # Load source data
+            source_series = self.storage_service.load_data(
+                symbol=symbol,
+                timeframe=from_timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            if not source_series.candles:
+                logger.warning(f"No {from_timeframe} data found for {symbol}")
+                target_timeframe_enum = self._get_timeframe_enum(to_timeframe)
+                return PriceDataSeries(
+                    symbol=symbol, timeframe=target_timeframe_enum, candles=[]
+                )
+
+            # Convert to DataFrame
+            df = self._candles_to_dataframe(source_series.candles)
+
+            # Apply provider-specific resampling
+            resampled_df = self._resample_dataframe_with_provider_alignment(
+                df, to_timeframe, symbol, provider_metadata
+            )
+
+            # Convert back to candles
+            resampled_candles = self._dataframe_to_candles(resampled_df, to_timeframe)
+
+            logger.info(
+                f"Resampled {len(source_series.candles)} {from_timeframe} candles to "
+                f"{len(resampled_candles)} {to_timeframe} candles for {symbol} "
+                f"using {provider_metadata.get('alignment_strategy', 'default')} alignment"
+            )
+
+            target_timeframe_enum = self._get_timeframe_enum(to_timeframe)
+            return PriceDataSeries(
+                symbol=symbol,
+                timeframe=target_timeframe_enum,
+                candles=resampled_candles,
+            )
+
+        except Exception as e:
+            raise DataResamplingError(
+                f"Failed to resample {symbol} from {from_timeframe} to {to_timeframe} "
+                f"with provider alignment: {str(e)}"
+            )
+
+    def resample_to_daily(
+        self,
+        symbol: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        source_timeframe: str = "1min",
+    ) -> PriceDataSeries:
+        """
+        Resample intraday data to daily candles.
+
+        Args:
+            symbol: Trading symbol
+            start_date: Optional start date for resampling
+            end_date: Optional end date for resampling
+            source_timeframe: Source timeframe (default: "1min")
+
+        Returns:
+            PriceDataSeries with daily candles
+
+        Raises:
+            DataResamplingError: If resampling fails
+        """
+        try:
+            logger.info(f"Resampling {symbol} from {source_timeframe} to daily")
+
+            # Load source data
+            source_series = self.storage_service.load_data(
+                symbol=symbol,
+                timeframe=source_timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            if not source_series.candles:
+                logger.warning(f"No {source_timeframe} data found for {symbol}")
+                return PriceDataSeries(
+                    symbol=symbol, timeframe=Timeframe.DAILY, candles=[]
+                )
+
+            # Convert to DataFrame for resampling
+            df = self._candles_to_dataframe(source_series.candles)
+
+            if df.empty:
+                return PriceDataSeries(
+                    symbol=symbol, timeframe=Timeframe.DAILY, candles=[]
+                )
+
+            # Resample to daily
+            daily_df = self._resample_to_daily_df(df)
+
+            # Convert back to candles
+            daily_candles = self._dataframe_to_candles(daily_df, "daily")
+
+            logger.info(
+                f"Resampled {len(source_series.candles)} {source_timeframe} candles to "
+                f"{len(daily_candles)} daily candles for {symbol}"
+            )
+
+            return PriceDataSeries(
+                symbol=symbol, timeframe=Timeframe.DAILY, candles=daily_candles
+            )
+
+        except Exception as e:
+            raise DataResamplingError(f"Failed to resample {symbol} to daily: {str(e)}")
+
+    def _candles_to_dataframe(self, candles: list[PriceCandle]) -> pd.DataFrame:
+        """Convert list of PriceCandle objects to pandas DataFrame."""
+        if not candles:
+            return pd.DataFrame()
+
+        # Build the frame column by column rather than from one dict per candle
+        df = pd.DataFrame(
+            {
+                column: [getattr(candle, column) for candle in candles]
+                for column in OHLCV_COLUMNS
+            }
+        )
+        df["date"] = pd.to_datetime(df["date"])
+        df = df.set_index("date").sort_index()
+        return df
+
+    def _resample_to_daily_df(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Resample DataFrame to daily frequency.
+
+        Args:
+            df: DataFrame with datetime index and OHLCV columns
+
+        Returns:
+            DataFrame resampled to daily frequency
+        """
+        # Define aggregation rules for OHLCV data
+        agg_rules = {
+            "open": "first",  # First value of the day
+            "high": "max",  # Maximum value of the day
+            "low": "min",  # Minimum value of the day
+            "close": "last",  # Last value of the day
+            "volume": "sum",  # Sum of all volumes
+        }
+
+        # Resample to daily frequency using standard UTC alignment
+        # This will be adjusted per asset type in the main resample_data method
+        daily_df = df.resample("D").agg(agg_rules)  # type: ignore[arg-type]
+
+        # Remove rows where all OHLC values are NaN (no data for that day)
+        daily_df = daily_df.dropna(subset=["open", "high", "low", "close"])  # type: ignore[reportUnknownMemberType]
+
+        # Reset index to make date a column again
+        daily_df = daily_df.reset_index()
+
+        return daily_df
+
+    def resample_and_store_daily(
+        self,
+        symbol: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        source_timeframe: str = "1min",
+    ) -> int:
+        """
+        Resample intraday data to daily and store the result.
+
+        Args:
+            symbol: Trading symbol
+            start_date: Optional start date
+            end_date: Optional end date
+            source_timeframe: Source timeframe
+
+        Returns:
+            Number of daily candles created and stored
+
+        Raises:
+            DataResamplingError: If resampling or storage fails
+        """
+        try:
+            # Resample to daily
+            daily_series = self.resample_to_daily(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                source_timeframe=source_timeframe,
+            )
+
+            if not daily_series.candles:
+                logger.info(f"No daily candles to store for {symbol}")
+                return 0
+
+            # Store the daily data
+            self.storage_service.store_data(daily_series)
+
+            logger.info(
+                f"Successfully resampled and stored {len(daily_series.candles)} "
+                f"daily candles for {symbol}"
+            )
+            return len(daily_series.candles)
+
+        except DataStorageError as e:
+            raise DataResamplingError(
+                f"Failed to store daily data for {symbol}: {str(e)}"
+            )
+
+    def bulk_resample_to_daily(
+        self,
+        symbols: list[str],
+        start_date: date | None = None,
+        end_date: date | None = None,
+        source_timeframe: str = "1min",
+    ) -> dict[str, int]:
+        """
+        Resample multiple symbols to daily candles.
+
+        Args:
+            symbols: List of trading symbols
+            start_date: Optional start date
+            end_date: Optional end date
+            source_timeframe: Source timeframe
+
+        Returns:
+            Dictionary mapping symbol to number of daily candles created
+        """
+        results: dict[str, int] = {}
+
+        for symbol in symbols:
+            try:
+                count = self.resample_and_store_daily(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    source_timeframe=source_timeframe,
+                )
+                results[symbol] = count
+                logger.info(f"Completed daily resampling for {symbol}: {count} candles")
+            except DataResamplingError as e:
+                logger.error(f"Failed to resample {symbol} to daily: {e}")
+                results[symbol] = 0
+
+        total_candles = sum(results.values())  # type: ignore[reportUnknownArgumentType]
+        successful_symbols = sum(1 for count in results.values() if count > 0)  # type: ignore[reportUnknownVariableType]
+
+        logger.info(
+            f"Bulk daily resampling completed: {successful_symbols}/{len(symbols)} "
+            f"symbols successful, {total_candles} total daily candles created"
+        )
+
+        return results  # type: ignore[reportUnknownVariableType]
+
+    def update_daily_from_recent_data(
+        self, symbol: str, days_back: int = 7, source_timeframe: str = "1min"
+    ) -> int:
+        """
+        Update daily candles from recent intraday data.
+
+        This is useful for keeping daily data up-to-date as new intraday data arrives.
+
+        Args:
+            symbol: Trading symbol
+            days_back: Number of days back to resample (default: 7)
+            source_timeframe: Source timeframe
+
+        Returns:
+            Number of daily candles updated
+        """
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days_back)
+
+        return self.resample_and_store_daily(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            source_timeframe=source_timeframe,
+        )
+
+    def get_resampling_candidates(self, source_timeframe: str = "1min") -> list[str]:
+        """
+        Get list of symbols that have source data available for resampling.
+
+        Args:
+            source_timeframe: Source timeframe to check
+
+        Returns:
+            List of symbol names that have source data
+        """
+        return self.storage_service.list_stored_symbols(source_timeframe)
+
+    def _resample_dataframe(
+        self, df: pd.DataFrame, to_timeframe: str, symbol: str = ""
+    ) -> pd.DataFrame:
+        """
+        Resample DataFrame to target timeframe using pandas with asset-type-aware alignment.
+
+        Args:
+            df: Source DataFrame with OHLCV data
+            to_timeframe: Target timeframe string
+            symbol: Trading symbol for asset type classification
+
+        Returns:
+            Resampled DataFrame
+
+        Raises:
+            DataResamplingError: If resampling fails
+        """
+        try:
+            # Get pandas frequency string
+            frequency = get_pandas_frequency(to_timeframe)
+            if frequency is None:
+                raise DataResamplingError(
+                    f"Unsupported target timeframe: {to_timeframe}"
+                )
+
+            # Get aggregation rules
+            agg_rules = get_resampling_rules()
+
+            # Determine asset type and appropriate resampling strategy
+            asset_type = (
+                self.asset_classifier.classify_symbol(symbol)
+                if symbol
+                else AssetType.UNKNOWN
+            )
+
+            # Apply asset-type-aware resampling alignment
+            offset = self._resampling_offset(to_timeframe, asset_type)
+            if (
+                to_timeframe != "daily"
+                and not df.empty
+                and df.index.is_monotonic_increasing
+            ):
+                # Intraday periods divide a day, so flooring against the epoch
+                # gives the same buckets as pandas' start-of-day origin
+                return _aggregate_sorted_ohlcv(df, frequency, offset).reset_index()
+            if offset:
+                logger.debug(
+                    f"Resampling {symbol} ({asset_type}) to {to_timeframe} "
+                    f"with offset={offset}"
+                )
+                resampled_df = df.resample(frequency, offset=offset).agg(agg_rules)  # type: ignore[arg-type]
+            else:
+                logger.debug(
+                    f"Resampling {symbol} ({asset_type}) to {to_timeframe} with standard "
+                    f"UTC alignment"
+                )
+                resampled_df = df.resample(frequency).agg(agg_rules)  # type: ignore[arg-type]
+
+            # Remove rows where all OHLC values are NaN (no data for that period)
+            resampled_df = resampled_df.dropna(subset=["open", "high", "low", "close"])  # type: ignore[reportUnknownMemberType]
+
+            # Reset index to make date a column again
+            resampled_df = resampled_df.reset_index()
+
+            return resampled_df
+
+        except Exception as e:
+            raise DataResamplingError(
+                f"Failed to resample DataFrame to {to_timeframe}: {str(e)}"
+            )
+
+    def _resampling_offset(self, to_timeframe: str, asset_type: AssetType) -> str | None:
+        """
+        Get the bucket offset used when resampling to a timeframe.
+
+        Session alignment only applies to short intraday timeframes. Longer
+        timeframes (1h+) use standard UTC alignment even for US equities to match
+        Polygon. Daily buckets are UTC calendar days for every asset type, which
+        hold a whole US session (13:30-21:00 UTC); US equity candles are then
+        stamped at the 20:00 UTC close when converted (see _dataframe_to_candles).
+
+        Args:
+            to_timeframe: Target timeframe string
+            asset_type: Asset type of the symbol being resampled
+
+        Returns:
+            Pandas offset string, or None for standard UTC alignment
+        """
+        if to_timeframe in ["5min", "15min", "30min"]:
+            # Asset-specific offset (e.g., US equity: 13h30min, Forex: 8h00min)
+            return get_resampling_offset(asset_type) or None
+        return None
+
+    def can_resample_from(
+        self, symbol: str, from_timeframe: str, to_timeframe: str
+    ) -> bool:
+        """
+        Check whether resampled from_timeframe candles can build to_timeframe.
+
+        That holds when every to_timeframe bucket is an exact union of
+        from_timeframe buckets; first/last/max/min/sum then give the same
+        candles as resampling the original source data.
+
+        Args:
+            symbol: Trading symbol, for asset-type-aware alignment
+            from_timeframe: Timeframe of the already resampled data
+            to_timeframe: Target timeframe
+
+        Returns:
+            True if to_timeframe buckets nest exactly into from_timeframe buckets
+        """
+        from_frequency = get_pandas_frequency(from_timeframe)
+        to_frequency = get_pandas_frequency(to_timeframe)
+        if not from_frequency or not to_frequency:
+            return False
+
+        asset_type = self.asset_classifier.classify_symbol(symbol)
+        from_period = _frequency_timedelta(from_frequency)
+        to_period = _frequency_timedelta(to_frequency)
+        offset_gap = pd.Timedelta(
+            self._resampling_offset(to_timeframe, asset_type) or 0
+        ) - pd.Timedelta(self._resampling_offset(from_timeframe, asset_type) or 0)
+
+        return to_period % from_period == pd.Timedelta(0) and (
+            offset_gap % from_period == pd.Timedelta(0)
+        )
+
+    def _resample_dataframe_with_provider_alignment(
+        self,
+        df: pd.DataFrame,
+        to_timeframe: str,
+        symbol: str,
+        provider_metadata: dict[str, str],
+    ) -> pd.DataFrame:
+        """
+        Resample DataFrame using provider-specific alignment strategy.
+
+        Args:
+            df: Source DataFrame with OHLCV data
+            to_timeframe: Target timeframe
+            symbol: Trading symbol
+            provider_metadata: Provider alignment metadata
+
+        Returns:
+            Resampled DataFrame
+        """
+        try:
+            # Get pandas frequency
+            frequency = get_pandas_frequency(to_timeframe)
+            if not frequency:
+                raise DataResamplingError(f"Unsupported timeframe: {to_timeframe}")
+
+            # Get aggregation rules
+            agg_rules = get_resampling_rules()
+
+            # Determine alignment strategy based on provider metadata
+            alignment_strategy = provider_metadata.get(
+                "alignment_strategy", "market_session"
+            )
+
+            # Classify asset type for context
+            asset_type = self.asset_classifier.classify_symbol(symbol)
+
+            if alignment_strategy == "utc_aligned":
+                # Provider uses UTC alignment (like Polygon)
+                if to_timeframe == "daily":
+                    # UTC calendar days; the asset-specific close time (20:00
+                    # UTC for US stocks) is stamped when candles are built
+                    resampled_df = df.resample(frequency).agg(agg_rules)  # type: ignore[arg-type]
+                else:
+                    # Intraday: always UTC aligned for this provider
+                    resampled_df = df.resample(frequency).agg(agg_rules)  # type: ignore[arg-type]
+
+            else:
+                # Provider uses market session alignment (like Financial Modeling Prep)
+                # Fall back to existing asset-type-aware logic
+                if to_timeframe in ["5min", "15min", "30min"]:
+                    offset = get_resampling_offset(asset_type)
+                    if offset:
+                        resampled_df = df.resample(frequency, offset=offset).agg(agg_rules)  # type: ignore[arg-type]
+                    else:
+                        resampled_df = df.resample(frequency).agg(agg_rules)  # type: ignore[arg-type]
+                elif to_timeframe == "daily":
+                    # UTC calendar days, as in the UTC-aligned branch above
+                    resampled_df = df.resample(frequency).agg(agg_rules)  # type: ignore[arg-type]
+                else:
+                    # Standard UTC for longer timeframes
+                    resampled_df = df.resample(frequency).agg(agg_rules)  # type: ignore[arg-type]
+
+            # Remove rows where all OHLC values are NaN
+            resampled_df = resampled_df.dropna(subset=["open", "high", "low", "close"])  # type: ignore[reportUnknownMemberType]
+
+            # Reset index to make date a column again
+            resampled_df = resampled_df.reset_index()
+
+            return resampled_df
+
+        except Exception as e:
+            raise DataResamplingError(
+                f"Failed to resample DataFrame with provider alignment: {str(e)}"
+            )
+
+    def _get_timeframe_enum(self, timeframe: str) -> Timeframe:
+        """
+        Convert timeframe string to Timeframe enum.
+
+        Args:
+            timeframe: Timeframe string
+
+        Returns:
+            Timeframe enum value
+
+        Raises:
+            DataResamplingError: If timeframe is not supported
+        """
+        timeframe_map = {
+            "1min": Timeframe.ONE_MIN,
+            "5min": Timeframe.FIVE_MIN,
+            "15min": Timeframe.FIFTEEN_MIN,
+            "30min": Timeframe.THIRTY_MIN,
+            "1h": Timeframe.ONE_HOUR,
+            "2h": Timeframe.TWO_HOUR,
+            "4h": Timeframe.FOUR_HOUR,
+            "daily": Timeframe.DAILY,
+        }
+
+        enum_value = timeframe_map.get(timeframe)
+        if enum_value is None:
+            raise DataResamplingError(f"Unsupported timeframe: {timeframe}")
+
+        return enum_value
+
+    def _dataframe_to_candles(
+        self, df: pd.DataFrame, timeframe: str
+    ) -> list[PriceCandle]:
+        """
+        Convert pandas DataFrame to list of PriceCandle objects.
+
+        Args:
+            df: DataFrame with OHLCV data
+            timeframe: Target timeframe for setting appropriate datetime
+
+        Returns:
+            List of PriceCandle objects
+        """
+        if df.empty:
+            return []
+
+        candles: list[PriceCandle] = []
+        # Walk the columns together instead of building a Series per row
+        for candle_date, open_, high, low, close, volume in zip(
+            *(df[column].tolist() for column in OHLCV_COLUMNS), strict=True
+        ):
+            try:
+                # Handle datetime based on timeframe
+                if timeframe == "daily":
+                    # For daily candles, use the appropriate boundary time based on asset type
+                    # US stocks: 20:00 UTC (market close), Crypto/Forex: 00:00 UTC (midnight)
+                    # For now, we'll use 20:00 UTC as the default since most daily data is for
+                    # US stocks
+                    if hasattr(candle_date, "date"):
+                        # If it's already a datetime, extract the date and set time to 20:00 UTC
+                        candle_datetime = datetime.combine(
+                            candle_date.date(), datetime.min.time().replace(hour=20)
+                        ).replace(tzinfo=UTC)
+                    else:
+                        # If it's a date, convert to datetime at 20:00 UTC
+                        candle_datetime = datetime.combine(
+                            candle_date, datetime.min.time().replace(hour=20)
+                        ).replace(tzinfo=UTC)
+                else:
+                    # For intraday timeframes, use the timestamp as-is
+                    candle_datetime = (
+                        candle_date
+                        if isinstance(candle_date, datetime)
+                        else datetime.combine(candle_date, datetime.min.time())
+                    )
+
+                candle = PriceCandle(
+                    date=candle_datetime,
+                    open=Decimal(str(open_)),
+                    high=Decimal(str(high)),
+                    low=Decimal(str(low)),
+                    close=Decimal(str(close)),
+                    volume=Decimal(str(volume)),
+                )
+                candles.append(candle)
+            except ValueError as e:
+                row = dict(
+                    zip(
+                        OHLCV_COLUMNS,
+                        (candle_date, open_, high, low, close, volume),
+                        strict=True,
+                    )
+                )
+                logger.warning(
+                    f"Skipping invalid {timeframe} candle: {row}, error: {e}"
+                )
+                continue
+
+        return candles
+
+    def resample_and_store(
+        self,
+        symbol: str,
+        from_timeframe: str,
+        to_timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> int:
+        """
+        Resample data and store the result.
+
+        Args:
+            symbol: Trading symbol
+            from_timeframe: Source timeframe
+            to_timeframe: Target timeframe
+            start_date: Optional start date
+            end_date: Optional end date
+
+        Returns:
+            Number of candles created and stored
+
+        Raises:
+            DataResamplingError: If resampling or storage fails
+        """
+        try:
+            # Resample data
+            resampled_series = self.resample_data(
+                symbol=symbol,
+                from_timeframe=from_timeframe,
+                to_timeframe=to_timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+            if not resampled_series.candles:
+                logger.info(f"No {to_timeframe} candles to store for {symbol}")
+                return 0
+
+            # Store the resampled data
+            self.storage_service.store_data(resampled_series)
+
+            logger.info(
+                f"Successfully resampled and stored {len(resampled_series.candles)} "
+                f"{to_timeframe} candles for {symbol}"
+            )
+            return len(resampled_series.candles)
+
+        except DataStorageError as e:
+            raise DataResamplingError(
+                f"Failed to store {to_timeframe} data for {symbol}: {str(e)}"
+            )
+
+    def load_source_frame(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> pd.DataFrame:
+        """
+        Load stored candles as a date-indexed OHLCV DataFrame.
+
+        Lets a caller resample one source load to several target timeframes
+        with resample_frame_and_store.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Source timeframe to load
+            start_date: Optional start date
+            end_date: Optional end date
+
+        Returns:
+            DataFrame sorted by date; empty if no data is stored
+
+        Raises:
+            DataResamplingError: If the source data cannot be loaded
+        """
+        try:
+            source_series = self.storage_service.load_data(
+                symbol=symbol,
+                timeframe=timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            if not source_series.candles:
+                logger.warning(f"No {timeframe} data found for {symbol}")
+            return self._candles_to_dataframe(source_series.candles)
+
+        except Exception as e:
+            raise DataResamplingError(
+                f"Failed to load {timeframe} data for {symbol}: {str(e)}"
+            )
+
+    def resample_frame_and_store(
+        self,
+        symbol: str,
+        source_df: pd.DataFrame,
+        from_timeframe: str,
+        to_timeframe: str,
+    ) -> tuple[int, pd.DataFrame]:
+        """
+        Resample an already loaded source frame and store the result.
+
+        Args:
+            symbol: Trading symbol
+            source_df: Date-indexed OHLCV frame from load_source_frame, or a
+                frame returned by this method for a shorter timeframe
+            from_timeframe: Timeframe of source_df
+            to_timeframe: Target timeframe
+
+        Returns:
+            Tuple of (number of candles created and stored, date-indexed
+            resampled frame)
+
+        Raises:
+            DataResamplingError: If resampling or storage fails
+        """
+        try:
+            if not validate_timeframe_conversion(from_timeframe, to_timeframe):
+                raise DataResamplingError(
+                    f"Invalid timeframe conversion: {from_timeframe} → {to_timeframe}. "
+                    f"Target timeframe must represent a longer period than source timeframe."
+                )
+
+            if source_df.empty:
+                logger.info(f"No {to_timeframe} candles to store for {symbol}")
+                return 0, source_df
+
+            resampled_df = self._resample_dataframe(source_df, to_timeframe, symbol)
+            resampled_candles = self._dataframe_to_candles(resampled_df, to_timeframe)
+            resampled_df = resampled_df.set_index("date")
+            if not resampled_candles:
+                logger.info(f"No {to_timeframe} candles to store for {symbol}")
+                return 0, resampled_df
+
+            self.storage_service.store_data(
+                PriceDataSeries(
+                    symbol=symbol,
+                    timeframe=self._get_timeframe_enum(to_timeframe),
+                    candles=resampled_candles,
+                )
+            )
+
+            logger.info(
+                f"Successfully resampled and stored {len(resampled_candles)} "
+                f"{to_timeframe} candles for {symbol}"
+            )
+            return len(resampled_candles), resampled_df
+
+        except DataStorageError as e:
+            raise DataResamplingError(
+                f"Failed to store {to_timeframe} data for {symbol}: {str(e)}"
+            )
+        except DataResamplingError:
+            raise
+        except Exception as e:
+            raise DataResamplingError(
+                f"Failed to resample {symbol} from {from_timeframe} to {to_timeframe}: {str(e)}"
+            )
+
+    def bulk_resample(
+        self,
+        symbols: list[str],
+        from_timeframe: str,
+        to_timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, int]:
+        """
+        Resample multiple symbols from one timeframe to another.
+
+        Args:
+            symbols: List of trading symbols
+            from_timeframe: Source timeframe
+            to_timeframe: Target timeframe
+            start_date: Optional start date
+            end_date: Optional end date
+
+        Returns:
+            Dictionary mapping symbol to number of candles created
+        """
+        results: dict[str, int] = {}
+
+        for symbol in symbols:
+            try:
+                count = self.resample_and_store(
+                    symbol=symbol,
+                    from_timeframe=from_timeframe,
+                    to_timeframe=to_timeframe,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                results[symbol] = count
+                logger.info(
+                    f"Completed {to_timeframe} resampling for {symbol}: {count} candles"
+                )
+            except DataResamplingError as e:
+                logger.error(f"Failed to resample {symbol} to {to_timeframe}: {e}")
+                results[symbol] = 0
+
+        return results
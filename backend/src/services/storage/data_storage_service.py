@@ -0,0 +1,857 @@
+"""
+Data storage service for managing Parquet files.
+
+This service handles:
+- Storing price data in partitioned Parquet files
+- Reading existing data
+- Managing the folder structure: storage/candles/timeframe/symbol/date.parquet
+- Data deduplication and merging
+"""
+
+import os
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from simutrador_core.models.price_data import PriceCandle, PriceDataSeries, Timeframe
+from simutrador_core.utils import get_default_logger
+
+from core.settings import get_settings
+
+logger = get_default_logger("data_storage")
+
+# Constants
+PARQUET_SUFFIX = ".parquet"
+ROWCOUNT_CACHE_MAX_ENTRIES = 100_000
+
+# Parquet writer settings
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_DATA_PAGE_SIZE = 64 << 10
+# Timestamps rise by a near-constant step, so delta encoding stores them in a
+# few bits each; prices and volumes rarely repeat enough for dictionaries to pay
+PARQUET_COLUMN_ENCODING = {"date": "DELTA_BINARY_PACKED"}
+# Daily files hold a symbol's full history; one row group per trading year
+# keeps row-group statistics useful for date filtering
+DAILY_ROW_GROUP_SIZE = 252
+
+# Maximum threads used to write intraday day files concurrently
+MAX_WRITE_WORKERS = 8
+CANDLE_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+# Schema for candle files. Older files may store prices as decimal128 with
+# per-file precision, so reads and merges cast to this common schema.
+CANDLE_SCHEMA = pa.schema(
+    [
+        ("date", pa.timestamp("ns", tz="UTC")),
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+    ]
+)
+
+
+@lru_cache(maxsize=8)
+def _resolved_paths(base_path: str, candles_path: str) -> tuple[Path, Path]:
+    """
+    Resolve the storage paths and create the candles directory.
+
+    Cached per configured path pair, so the mkdir happens once per process
+    rather than on every service construction.
+    """
+    base = Path(base_path)
+    candles = base / candles_path
+    candles.mkdir(parents=True, exist_ok=True)
+    return base, candles
+
+
+def _iter_parquet(dir_path: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield the Parquet file entries of a directory using os.scandir."""
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(PARQUET_SUFFIX):
+                yield entry
+
+
+def _parse_filename_date(name: str) -> date:
+    """Parse a day-file name starting with YYYY-MM-DD without strptime."""
+    return date(int(name[0:4]), int(name[5:7]), int(name[8:10]))
+
+
+def _date_filters(
+    start_date: date | None, end_date: date | None
+) -> list[tuple[str, str, pd.Timestamp]]:
+    """
+    Build Parquet filters for an inclusive date range on the UTC "date" column.
+
+    Bounds are UTC timestamps (start inclusive, day after end exclusive), so the
+    comparison runs on the raw timestamps without materializing dates.
+    """
+    filters: list[tuple[str, str, pd.Timestamp]] = []
+    if start_date:
+        filters.append(("date", ">=", pd.Timestamp(start_date, tz="UTC")))
+    if end_date:
+        end_ts = pd.Timestamp(end_date, tz="UTC") + pd.Timedelta(days=1)
+        filters.append(("date", "<", end_ts))
+    return filters
+
+
+def _max_stored_date(file_path: Path) -> datetime | None:
+    """
+    Get the latest candle timestamp of a Parquet file as a UTC Timestamp.
+
+    Uses the row group statistics in the footer when they are present, and
+    falls back to reading only the date column otherwise.
+    """
+    metadata = pq.ParquetFile(file_path).metadata
+    if metadata.num_rows == 0:
+        return None
+    date_index = metadata.schema.to_arrow_schema().get_field_index("date")
+    maxima: list[datetime] = []
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(date_index).statistics
+        if stats is None or not stats.has_min_max:
+            dates = pd.read_parquet(file_path, columns=["date"])["date"]
+            return pd.to_datetime(dates, utc=True).max()
+        maxima.append(stats.max)
+    return pd.Timestamp(max(maxima)).tz_convert("UTC")
+
+
+@lru_cache(maxsize=ROWCOUNT_CACHE_MAX_ENTRIES)
+def _footer_row_count(path: str, mtime_ns: int, size: int) -> int:  # noqa: ARG001
+    """
+    Read a Parquet file's row count from its footer (cached).
+
+    The modification time and size are part of the key, so a file rewritten by
+    any service instance (or process) is re-read instead of served stale.
+    """
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+@lru_cache(maxsize=65536)
+def _to_decimal(value: float) -> Decimal:
+    """Convert a stored price or volume to Decimal (cached, values repeat often)."""
+    return Decimal(str(value))
+
+
+def _candle_columns(
+    df: pd.DataFrame,
+) -> tuple[
+    list[datetime], list[float], list[float], list[float], list[float], list[float]
+]:
+    """
+    Prepare a candle DataFrame's columns for PriceCandle construction.
+
+    All conversion happens column-wise in C: dates become UTC datetimes in one
+    pass and prices/volume are coerced to float64 (legacy decimal128 files load
+    as Decimal objects). The per-candle loop then only zips plain values.
+    """
+    dates = pd.DatetimeIndex(df["date"]).to_pydatetime().tolist()
+    opens, highs, lows, closes, volumes = (
+        df[column].to_numpy(dtype=np.float64).tolist() for column in CANDLE_COLUMNS[1:]
+    )
+    return dates, opens, highs, lows, closes, volumes
+
+
+class DataStorageError(Exception):
+    """Exception raised for data storage errors."""
+
+    pass
+
+
+class DataStorageService:
+    """Service for managing Parquet file storage of trading data."""
+
+    def __init__(self):
+        """Initialize the storage service."""
+        settings = get_settings()
+        self.base_path, self.candles_path = _resolved_paths(
+            settings.data_storage.base_path, settings.data_storage.candles_path
+        )
+        # Sorted day-file listings keyed by (symbol, timeframe), with dir mtime
+        self._dir_cache: dict[tuple[str, str], tuple[int, list[tuple[date, Path]]]] = {}
+
+    def _get_file_path(
+        self, symbol: str, timeframe: str, date_obj: date | None = None
+    ) -> Path:
+        """Get the file path for storing data."""
+        if timeframe == Timeframe.DAILY.value:
+            return self.candles_path / "daily" / f"{symbol}.parquet"
+        else:
+            if date_obj is None:
+                raise DataStorageError("Date is required for intraday data storage")
+            date_str = date_obj.strftime("%Y-%m-%d")
+            return self.candles_path / timeframe / symbol / f"{date_str}.parquet"
+
+    def _list_day_files(self, symbol: str, timeframe: str) -> list[tuple[date, Path]]:
+        """
+        List a symbol's intraday day files sorted by date (oldest first).
+
+        The listing is cached per (symbol, timeframe) and rebuilt only when the
+        directory's modification time changes. Callers must not mutate it.
+        """
+        key = (symbol, timeframe)
+        symbol_dir = self.candles_path / timeframe / symbol
+        try:
+            dir_mtime = symbol_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._dir_cache.pop(key, None)
+            return []
+
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        day_files = sorted(
+            (_parse_filename_date(entry.name), Path(entry.path))
+            for entry in _iter_parquet(symbol_dir)
+        )
+        self._dir_cache[key] = (dir_mtime, day_files)
+        return day_files
+
+    def _select_day_files(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: date | None,
+        end_date: date | None,
+    ) -> list[tuple[date, Path]]:
+        """Get the day files within an inclusive date range, oldest first."""
+        day_files = self._list_day_files(symbol, timeframe)
+        lo = bisect_left(day_files, start_date, key=lambda f: f[0]) if start_date else 0
+        hi = (
+            bisect_right(day_files, end_date, key=lambda f: f[0])
+            if end_date
+            else len(day_files)
+        )
+        return day_files[lo:hi]
+
+    def _get_row_count(self, file_path: Path) -> int:
+        """Get the row count of a day file from its Parquet footer."""
+        stat = file_path.stat()
+        return _footer_row_count(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def _candles_to_table(self, candles: list[PriceCandle]) -> pa.Table:
+        """Convert list of PriceCandle objects to an Arrow table."""
+        return pa.Table.from_pydict(
+            {
+                "date": [candle.date for candle in candles],
+                "open": [float(candle.open) for candle in candles],
+                "high": [float(candle.high) for candle in candles],
+                "low": [float(candle.low) for candle in candles],
+                "close": [float(candle.close) for candle in candles],
+                "volume": [float(candle.volume) for candle in candles],
+            },
+            schema=CANDLE_SCHEMA,
+        )
+
+    def _write_parquet(
+        self, table: pa.Table, file_path: Path, row_group_size: int | None = None
+    ) -> None:
+        """
+        Write a candle table to Parquet with the storage writer settings.
+
+        Intraday day files are written as a single row group by default.
+        """
+        pq.write_table(
+            table,
+            file_path,
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            use_dictionary=False,
+            column_encoding=PARQUET_COLUMN_ENCODING,
+            data_page_size=PARQUET_DATA_PAGE_SIZE,
+            row_group_size=row_group_size or max(table.num_rows, 1),
+        )
+
+    def _merge_and_write(
+        self,
+        file_path: Path,
+        new_table: pa.Table,
+        row_group_size: int | None = None,
+        keep_existing: bool = False,
+    ) -> None:
+        """
+        Merge new candles into a Parquet file and write it back.
+
+        The merge stays in Arrow: existing and new rows are concatenated,
+        duplicates are resolved by keeping the last row per date (new data wins,
+        or the first row with keep_existing), and the result is written sorted
+        by date. When the combined dates are already strictly increasing (a new
+        day file, or candles appended after the stored ones) the rows are unique
+        and sorted, so the deduplication and sort are skipped.
+        """
+        if file_path.exists():
+            existing_table = (
+                pq.read_table(file_path, columns=CANDLE_COLUMNS)
+                .replace_schema_metadata(None)
+                .cast(CANDLE_SCHEMA)
+            )
+            combined = pa.concat_tables([existing_table, new_table])
+        else:
+            combined = new_table
+
+        dates = combined["date"].to_numpy().view("int64")
+        if (dates[1:] > dates[:-1]).all():
+            self._write_parquet(combined, file_path, row_group_size)
+            return
+
+        # Keep the last (or first) occurrence of each date
+        combined = combined.append_column(
+            "_row", pa.array(np.arange(combined.num_rows))
+        )
+        row_aggregate = "min" if keep_existing else "max"
+        kept_rows = combined.group_by("date", use_threads=False).aggregate(
+            [("_row", row_aggregate)]
+        )
+        result = (
+            combined.take(kept_rows[f"_row_{row_aggregate}"])
+            .drop_columns(["_row"])
+            .sort_by("date")
+        )
+
+        self._write_parquet(result, file_path, row_group_size)
+
+    def _dataframe_to_candles(self, df: pd.DataFrame) -> list[PriceCandle]:
+        """Convert DataFrame to list of PriceCandle objects."""
+        if df.empty:
+            return []
+
+        # Convert each column once instead of building a Series per row
+        return [
+            PriceCandle(
+                date=candle_date,
+                open=_to_decimal(open_),
+                high=_to_decimal(high),
+                low=_to_decimal(low),
+                close=_to_decimal(close),
+                volume=_to_decimal(volume),
+            )
+            for candle_date, open_, high, low, close, volume in zip(
+                *_candle_columns(df)
+            )
+        ]
+
+    def store_data(self, series: PriceDataSeries, keep_existing: bool = False) -> None:
+        """
+        Store price data series to Parquet files.
+
+        Candles replace stored ones with the same date, unless keep_existing is
+        set, in which case only dates not stored yet are added.
+        """
+        if not series.candles:
+            logger.warning(
+                f"No candles to store for {series.symbol} {series.timeframe}"
+            )
+            return
+
+        try:
+            if series.timeframe == Timeframe.DAILY:
+                # Store daily data in one file
+                file_path = self._get_file_path(series.symbol, series.timeframe)
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+
+                new_table = self._candles_to_table(series.candles)
+                self._merge_and_write(
+                    file_path, new_table, DAILY_ROW_GROUP_SIZE, keep_existing
+                )
+                logger.info(
+                    f"Stored {new_table.num_rows} daily candles for {series.symbol}"
+                )
+
+            else:
+                # Convert once, then group rows by UTC date in a single
+                # vectorized pass (row order within a date is preserved)
+                new_table = self._candles_to_table(series.candles)
+                days = new_table["date"].to_numpy().astype("datetime64[D]")
+                tables_by_date = {
+                    day.date(): new_table.take(rows)
+                    for day, rows in pd.Series(days)
+                    .groupby(days, sort=False)
+                    .indices.items()
+                }
+
+                # Store each date separately. Every date is an independent
+                # read-merge-write on its own file, and Arrow releases the GIL
+                # during Parquet I/O, so threads overlap the work.
+                if len(tables_by_date) == 1:
+                    self._merge_and_write_one_day(
+                        series, *tables_by_date.popitem(), keep_existing
+                    )
+                else:
+                    with ThreadPoolExecutor(
+                        max_workers=min(MAX_WRITE_WORKERS, len(tables_by_date))
+                    ) as executor:
+                        list(
+                            executor.map(
+                                self._merge_and_write_one_day,
+                                repeat(series),
+                                tables_by_date.keys(),
+                                tables_by_date.values(),
+                                repeat(keep_existing),
+                            )
+                        )
+
+        except Exception as e:
+            raise DataStorageError(
+                f"Failed to store data for {series.symbol}: {str(e)}"
+            )
+
+    def _merge_and_write_one_day(
+        self,
+        series: PriceDataSeries,
+        date_obj: date,
+        new_table: pa.Table,
+        keep_existing: bool = False,
+    ) -> None:
+        """Merge one day's intraday candles into its day file."""
+        file_path = self._get_file_path(series.symbol, series.timeframe, date_obj)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._merge_and_write(file_path, new_table, keep_existing=keep_existing)
+        self._dir_cache.pop((series.symbol, series.timeframe.value), None)
+        logger.info(
+            f"Stored {new_table.num_rows} candles for {series.symbol} "
+            f"{series.timeframe} on {date_obj}"
+        )
+
+    def load_data(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        order_by: str = "desc",
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> PriceDataSeries:
+        """Load price data from Parquet files. Candle dates are timezone-aware UTC."""
+        try:
+            # Convert string timeframe to Timeframe enum for PriceDataSeries
+            timeframe_enum = (
+                Timeframe(timeframe)
+                if timeframe != Timeframe.DAILY.value
+                else Timeframe.DAILY
+            )
+
+            if timeframe == Timeframe.DAILY.value:
+                file_path = self._get_file_path(symbol, timeframe)
+                if not file_path.exists():
+                    return PriceDataSeries(
+                        symbol=symbol, timeframe=timeframe_enum, candles=[]
+                    )
+
+                # Push the date filter down to Parquet so row groups outside the
+                # range are skipped using their min/max statistics
+                table = pq.read_table(
+                    file_path,
+                    columns=CANDLE_COLUMNS,
+                    filters=_date_filters(start_date, end_date) or None,
+                )
+                # Ensure a consistent UTC schema for stored data
+                df = table.replace_schema_metadata(None).cast(CANDLE_SCHEMA).to_pandas()
+
+                # Sort by date according to order_by parameter
+                if not df.empty:
+                    ascending = order_by == "asc"
+                    df = df.sort_values("date", ascending=ascending)
+
+                    # Apply pagination if limit/offset provided
+                    if offset is not None and limit is not None:
+                        df = df.iloc[offset : offset + limit]
+                    elif limit is not None:
+                        df = df.head(limit)
+
+                candles = self._dataframe_to_candles(df)
+                return PriceDataSeries(
+                    symbol=symbol, timeframe=timeframe_enum, candles=candles
+                )
+
+            else:
+                # For intraday data, use optimized pagination approach
+                return self._load_intraday_data_paginated(
+                    symbol,
+                    timeframe,
+                    timeframe_enum,
+                    start_date,
+                    end_date,
+                    order_by,
+                    limit,
+                    offset,
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to load data for {symbol} {timeframe}: {e}")
+            # Fallback timeframe conversion for error case
+            fallback_timeframe = (
+                Timeframe(timeframe)
+                if timeframe != Timeframe.DAILY.value
+                else Timeframe.DAILY
+            )
+            return PriceDataSeries(
+                symbol=symbol, timeframe=fallback_timeframe, candles=[]
+            )
+
+    def load_data_multi(
+        self,
+        symbols: list[str],
+        timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, PriceDataSeries]:
+        """
+        Load the same timeframe and date range for several symbols in one scan.
+
+        All matching files are read through a single Arrow dataset scan; every
+        record batch is tagged with its source file, which maps it back to its
+        symbol. Candles are returned oldest first and symbols without stored
+        data map to an empty series.
+        """
+        timeframe_enum = Timeframe(timeframe)
+        try:
+            file_symbols: dict[str, str] = {}
+            row_filter: ds.Expression | None = None
+            if timeframe == Timeframe.DAILY.value:
+                for symbol in symbols:
+                    file_path = self._get_file_path(symbol, timeframe)
+                    if file_path.exists():
+                        file_symbols[str(file_path)] = symbol
+                filters = _date_filters(start_date, end_date)
+                if filters:
+                    row_filter = pq.filters_to_expression(filters)
+            else:
+                # Day files are already selected by date, so no row filter is needed
+                for symbol in symbols:
+                    for _, file_path in self._select_day_files(
+                        symbol, timeframe, start_date, end_date
+                    ):
+                        file_symbols[str(file_path)] = symbol
+
+            batches_by_symbol: dict[str, list[pa.RecordBatch]] = {
+                symbol: [] for symbol in symbols
+            }
+            if file_symbols:
+                dataset = ds.dataset(
+                    list(file_symbols), schema=CANDLE_SCHEMA, format="parquet"
+                )
+                scanner = dataset.scanner(columns=CANDLE_COLUMNS, filter=row_filter)
+                for tagged_batch in scanner.scan_batches():
+                    symbol = file_symbols[tagged_batch.fragment.path]
+                    batches_by_symbol[symbol].append(tagged_batch.record_batch)
+
+            result: dict[str, PriceDataSeries] = {}
+            for symbol, batches in batches_by_symbol.items():
+                candles: list[PriceCandle] = []
+                if batches:
+                    df = pa.Table.from_batches(batches).to_pandas()
+                    candles = self._dataframe_to_candles(df.sort_values("date"))
+                result[symbol] = PriceDataSeries(
+                    symbol=symbol, timeframe=timeframe_enum, candles=candles
+                )
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to load data for {len(symbols)} symbols {timeframe}: {e}")
+            return {
+                symbol: PriceDataSeries(symbol=symbol, timeframe=timeframe_enum, candles=[])
+                for symbol in symbols
+            }
+
+    def _load_intraday_data_paginated(
+        self,
+        symbol: str,
+        timeframe: str,
+        timeframe_enum: Timeframe,
+        start_date: date | None,
+        end_date: date | None,
+        order_by: str,
+        limit: int | None,
+        offset: int | None,
+    ) -> PriceDataSeries:
+        """
+        Load intraday data with efficient pagination.
+
+        This method optimizes loading by:
+        1. Loading files in date order (newest first for desc, oldest first for asc)
+        2. Stopping early when we have enough data for the requested page
+        3. Only loading the minimum number of files needed
+        """
+        # Get all matching files sorted by date
+        file_paths = self._select_day_files(symbol, timeframe, start_date, end_date)
+        if not file_paths:
+            return PriceDataSeries(symbol=symbol, timeframe=timeframe_enum, candles=[])
+
+        # Newest first for desc, oldest first for asc
+        ascending_files = order_by == "asc"
+        if not ascending_files:
+            file_paths.reverse()
+
+        # If no pagination requested, load all files (legacy behavior)
+        if limit is None and offset is None:
+            return self._load_all_intraday_files(
+                file_paths, symbol, timeframe_enum, order_by
+            )
+
+        # Calculate how many records to skip and take
+        skip_count = offset or 0
+        take_count = limit or 1000
+
+        records_to_skip = skip_count
+        remaining_needed = take_count
+
+        # Footer row counts let us skip whole files before the offset without
+        # reading them; only the rows inside the page are then decoded
+        page_tables: list[pa.Table] = []
+        for _file_date, file_path in file_paths:
+            row_count = self._get_row_count(file_path)
+            if records_to_skip >= row_count:
+                records_to_skip -= row_count
+                continue
+
+            take = min(row_count - records_to_skip, remaining_needed)
+            # Day files are sorted ascending, so a descending window maps to the
+            # mirrored ascending row range
+            start = (
+                records_to_skip
+                if ascending_files
+                else row_count - records_to_skip - take
+            )
+            page_tables.append(self._read_row_range(file_path, start, take, take_count))
+
+            records_to_skip = 0
+            remaining_needed -= take
+
+            # Stop if we have enough data
+            if remaining_needed <= 0:
+                break
+
+        if not page_tables:
+            return PriceDataSeries(symbol=symbol, timeframe=timeframe_enum, candles=[])
+
+        # Each slice is ascending; put files back in ascending order, decode once,
+        # then flip the whole page for descending requests
+        if not ascending_files:
+            page_tables.reverse()
+        combined_df = pa.concat_tables(page_tables).to_pandas()
+        if not ascending_files:
+            combined_df = combined_df.iloc[::-1]
+
+        candles = self._dataframe_to_candles(combined_df)
+        return PriceDataSeries(symbol=symbol, timeframe=timeframe_enum, candles=candles)
+
+    def _read_row_range(
+        self, file_path: Path, start: int, length: int, batch_size: int
+    ) -> pa.Table:
+        """
+        Read rows [start, start + length) of a day file.
+
+        Record batches are streamed and the read stops as soon as the range is
+        covered, so rows after the range are never decoded.
+        """
+        stop = start + length
+        batches: list[pa.RecordBatch] = []
+        position = 0
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(
+            batch_size=batch_size, columns=CANDLE_COLUMNS
+        ):
+            batch_end = position + batch.num_rows
+            if batch_end > start:
+                offset = max(start - position, 0)
+                batches.append(batch.slice(offset, min(batch_end, stop) - position - offset))
+            position = batch_end
+            if position >= stop:
+                break
+
+        table = pa.Table.from_batches(batches)
+        return table.replace_schema_metadata(None).cast(CANDLE_SCHEMA)
+
+    def _open_dataset(self, file_paths: list[tuple[date, Path]]) -> ds.Dataset:
+        """Open the given day files as a single Arrow dataset, preserving order."""
+        return ds.dataset(
+            [str(file_path) for _, file_path in file_paths],
+            schema=CANDLE_SCHEMA,
+            format="parquet",
+        )
+
+    def _load_all_intraday_files(
+        self,
+        file_paths: list[tuple[date, Path]],
+        symbol: str,
+        timeframe_enum: Timeframe,
+        order_by: str,
+    ) -> PriceDataSeries:
+        """Load all intraday files (legacy behavior for non-paginated requests)."""
+        ascending = order_by == "asc"
+
+        # One scan over every file instead of a read + concat per file
+        table = self._open_dataset(file_paths).to_table(columns=CANDLE_COLUMNS)
+        if table.num_rows == 0:
+            return PriceDataSeries(symbol=symbol, timeframe=timeframe_enum, candles=[])
+
+        combined_df = table.to_pandas()
+        combined_df = combined_df.sort_values("date", ascending=ascending)
+
+        candles = self._dataframe_to_candles(combined_df)
+        return PriceDataSeries(symbol=symbol, timeframe=timeframe_enum, candles=candles)
+
+    def get_total_count(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> int:
+        """
+        Get total count of records efficiently without loading all data.
+
+        This method counts records by reading only the row count from Parquet files
+        without loading the actual data into memory.
+        """
+        try:
+            if timeframe == Timeframe.DAILY.value:
+                file_path = self._get_file_path(symbol, timeframe)
+                if not file_path.exists():
+                    return 0
+
+                filters = _date_filters(start_date, end_date)
+                if not filters:
+                    # Row count straight from the footer metadata
+                    return pq.ParquetFile(file_path).metadata.num_rows
+
+                # Only the date column is read, filtered on raw timestamps
+                return pq.read_table(
+                    file_path, columns=["date"], filters=filters
+                ).num_rows
+
+            else:
+                # For intraday data, sum counts from matching files
+                total_count = 0
+                for _file_date, file_path in self._select_day_files(
+                    symbol, timeframe, start_date, end_date
+                ):
+                    # Read only the footer metadata to get row count
+                    total_count += self._get_row_count(file_path)
+
+                return total_count
+
+        except Exception as e:
+            logger.error(f"Failed to get total count for {symbol} {timeframe}: {e}")
+            return 0
+
+    def get_total_count_multi(
+        self,
+        symbols: list[str],
+        timeframe: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+    ) -> dict[str, int]:
+        """
+        Get record counts for several symbols over the same date range.
+
+        Intraday counts come from cached Parquet footers, so no candle data is
+        read. Symbols without stored data count as 0.
+        """
+        return {
+            symbol: self.get_total_count(symbol, timeframe, start_date, end_date)
+            for symbol in symbols
+        }
+
+    def get_last_update_date(self, symbol: str, timeframe: str) -> datetime | None:
+        """
+        Get the date of the last stored candle for a symbol and timeframe.
+
+        This method is optimized to avoid loading entire datasets into memory.
+        For intraday data, it finds the latest date file in the cached listing.
+        The max date is taken from the Parquet footer statistics when available.
+        """
+        try:
+            if timeframe == Timeframe.DAILY.value:
+                file_path = self._get_file_path(symbol, timeframe)
+                if not file_path.exists():
+                    return None
+                return _max_stored_date(file_path)
+
+            else:
+                # For intraday data: the latest day file is last in the listing
+                day_files = self._list_day_files(symbol, timeframe)
+                if not day_files:
+                    return None
+                _, latest_file = day_files[-1]
+                return _max_stored_date(latest_file)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to get last update date for {symbol} {timeframe}: {e}"
+            )
+            return None
+
+    def get_last_update_date_multi(
+        self, symbols: list[str], timeframe: str
+    ) -> dict[str, datetime | None]:
+        """
+        Get the date of the last stored candle for several symbols at once.
+
+        Daily files are found with a single directory scan instead of one
+        existence check per symbol; intraday listings come from the directory
+        cache. Symbols without stored data map to None.
+        """
+        if timeframe != Timeframe.DAILY.value:
+            return {
+                symbol: self.get_last_update_date(symbol, timeframe)
+                for symbol in symbols
+            }
+
+        daily_dir = self.candles_path / "daily"
+        try:
+            stored = {entry.name: Path(entry.path) for entry in _iter_parquet(daily_dir)}
+        except FileNotFoundError:
+            stored = {}
+
+        last_updates: dict[str, datetime | None] = {}
+        for symbol in symbols:
+            file_path = stored.get(f"{symbol}{PARQUET_SUFFIX}")
+            if file_path is None:
+                last_updates[symbol] = None
+                continue
+            try:
+                last_updates[symbol] = _max_stored_date(file_path)
+            except Exception as e:
+                logger.error(
+                    f"Failed to get last update date for {symbol} {timeframe}: {e}"
+                )
+                last_updates[symbol] = None
+        return last_updates
+
+    def list_stored_symbols(self, timeframe: str) -> list[str]:
+        """List all symbols that have stored data for a given timeframe."""
+        try:
+            if timeframe == Timeframe.DAILY.value:
+                daily_dir = self.candles_path / "daily"
+                if not daily_dir.exists():
+                    return []
+                return [
+                    entry.name[: -len(PARQUET_SUFFIX)]
+                    for entry in _iter_parquet(daily_dir)
+                ]
+            else:
+                timeframe_dir = self.candles_path / timeframe
+                if not timeframe_dir.exists():
+                    return []
+                with os.scandir(timeframe_dir) as entries:
+                    return [entry.name for entry in entries if entry.is_dir()]
+        except Exception as e:
+            logger.error(f"Failed to list symbols for {timeframe}: {e}")
+            return []
@@ -10,9 +10,19 @@ This service handles validation of stock market data including:
 All timestamps are handled in UTC to eliminate timezone conversion issues.
 """
 
+import asyncio
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from itertools import chain, repeat, starmap
+from operator import attrgetter
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from typing_extensions import override
 
@@ -42,16 +52,88 @@ except ImportError:
                     self.offset = offset
 
 
-from simutrador_core.models.price_data import PriceCandle, Timeframe
+from simutrador_core.models.price_data import PriceCandle, PriceDataSeries, Timeframe
 from simutrador_core.utils import get_default_logger
 
 from core.settings import get_settings
+from models.nightly_update_api import GapFillResult
 
+from ..data_providers.polygon_client import PolygonClient
+from ..gap_filling_service import GapFillingService
 from ..polygon_url_generator import PolygonUrlGenerator
 from ..storage.data_storage_service import DataStorageService
 
 logger = get_default_logger("stock_market_validation")
 
+# Upper bound on threads used to validate symbols concurrently
+MAX_VALIDATION_WORKERS = 8
+
+# Upper bound on gap fills in flight at once, shared by every symbol-day
+MAX_CONCURRENT_GAP_FILLS = 4
+
+# Days of calendar fetched at once when looking for the previous trading day
+PREVIOUS_TRADING_DAY_LOOKBACK_DAYS = 14
+
+# Maximum number of cached symbol summaries
+SUMMARY_CACHE_MAX_ENTRIES = 1024
+
+# Official session calendar saved under the storage base path between runs
+CALENDAR_CACHE_FILE = Path("cache") / "nyse_sessions.pickle"
+CALENDAR_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Regular session lengths in seconds: 6.5 hours, or 3.5 hours on a half day
+FULL_DAY_SESSION_SECONDS = 390 * 60
+HALF_DAY_SESSION_SECONDS = 210 * 60
+SECONDS_PER_DAY = 86_400
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+# OHLCV values of a candle as one tuple, read in C
+_candle_ohlcv = attrgetter("open", "high", "low", "close", "volume")
+
+# Bound str.format reused for every "start to end" missing-period label
+_format_period = "{} to {}".format
+
+
+@lru_cache(maxsize=65536)
+def _to_float(value: Decimal) -> float:
+    """Convert a candle price or volume to float (cached, values repeat often)."""
+    return float(value)
+
+
+def _candle_epoch_seconds(candles: list[PriceCandle]) -> np.ndarray:
+    """
+    Get candle timestamps as int64 UTC epoch seconds, normalized once per list.
+
+    Candles loaded from storage are already timezone-aware UTC; naive timestamps
+    are taken as UTC. Sub-second parts are truncated.
+    """
+    candle_times = pd.to_datetime([candle.date for candle in candles], utc=True)
+    return candle_times.as_unit("s").asi8
+
+
+def _day_start_timestamp(day: date) -> int:
+    """Get midnight UTC of a date as epoch seconds."""
+    return (day.toordinal() - _EPOCH_ORDINAL) * SECONDS_PER_DAY
+
+
+def _utc_datetime(timestamp: int) -> datetime:
+    """Convert UTC epoch seconds back to a timezone-aware datetime."""
+    return datetime.fromtimestamp(timestamp, UTC)
+
+
+def _rounded_percentage(part: int, whole: int) -> float:
+    """
+    Get part / whole as a percentage rounded to two decimals.
+
+    Rounds the exact ratio half to even in integer arithmetic, so the only float
+    operation is the final division and ties are not skewed by float error.
+    """
+    hundredths, remainder = divmod(part * 10000, whole)
+    if 2 * remainder > whole or (2 * remainder == whole and hundredths % 2):
+        hundredths += 1
+    return hundredths / 100
+
 
 # Only define custom calendar classes if pandas_market_calendars is not available
 if not _has_market_calendars:
@@ -127,6 +209,25 @@ if not _has_market_calendars:
         ]
 
 
+@lru_cache(maxsize=1)
+def _get_market_calendar() -> tuple[Any, bool]:
+    """
+    Build the market calendar once per process.
+
+    Returns:
+        Tuple of (calendar, use_official_calendar); prefers the official NYSE
+        calendar from pandas_market_calendars when available
+    """
+    if _has_market_calendars and mcal is not None:
+        # Use official NYSE calendar from pandas_market_calendars
+        logger.info("Using official NYSE calendar from pandas_market_calendars")
+        return mcal.get_calendar("NYSE"), True  # type: ignore
+
+    # Fallback to custom calendar
+    logger.warning("pandas_market_calendars not available, using custom calendar")
+    return USStockMarketCalendar(), False
+
+
 class ValidationError(Exception):
     """Exception raised for data validation errors."""
 
@@ -136,6 +237,20 @@ class ValidationError(Exception):
 class ValidationResult:
     """Result of data validation with detailed information."""
 
+    # Summaries hold thousands of these; slots drop the per-instance __dict__
+    __slots__ = (
+        "symbol",
+        "validation_date",
+        "is_valid",
+        "expected_candles",
+        "actual_candles",
+        "missing_periods",
+        "polygon_urls_for_missing_periods",
+        "errors",
+        "warnings",
+        "gap_fill_results",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -157,6 +272,8 @@ class ValidationResult:
         self.polygon_urls_for_missing_periods = polygon_urls_for_missing_periods or []
         self.errors = errors or []
         self.warnings = warnings or []
+        # Filled in by analyze_completeness_with_gap_filling
+        self.gap_fill_results: list[Any] = []
 
     @override
     def __str__(self) -> str:
@@ -166,6 +283,29 @@ class ValidationResult:
             f"{self.actual_candles}/{self.expected_candles} candles)"
         )
 
+    def formatted_missing_periods(self) -> list[str]:
+        """
+        Get the missing periods as "start to end" strings for API responses.
+
+        Returns:
+            List of formatted missing periods, in order
+        """
+        return list(starmap(_format_period, self.missing_periods))
+
+    def summary_figures(self) -> tuple[int, int, bool, int]:
+        """
+        Get the per-day figures that symbol summaries are computed from.
+
+        Returns:
+            Tuple of (expected candles, actual candles, is valid, missing periods)
+        """
+        return (
+            self.expected_candles,
+            self.actual_candles,
+            self.is_valid,
+            len(self.missing_periods),
+        )
+
 
 class StockMarketValidationService:
     """Service for validating stock market data completeness and integrity."""
@@ -177,19 +317,8 @@ class StockMarketValidationService:
         self.storage_service = DataStorageService()
         self.polygon_url_generator = PolygonUrlGenerator()
 
-        # Initialize market calendar - prefer pandas_market_calendars if available
-        if _has_market_calendars and mcal is not None:
-            # Use official NYSE calendar from pandas_market_calendars
-            self.market_calendar = mcal.get_calendar("NYSE")  # type: ignore
-            self.use_official_calendar = True
-            logger.info("Using official NYSE calendar from pandas_market_calendars")
-        else:
-            # Fallback to custom calendar
-            self.market_calendar = USStockMarketCalendar()
-            self.use_official_calendar = False
-            logger.warning(
-                "pandas_market_calendars not available, using custom calendar"
-            )
+        # Market calendar shared by all service instances
+        self.market_calendar, self.use_official_calendar = _get_market_calendar()
 
         # Market hours in UTC (eliminates timezone conversion issues)
         self.market_open_utc = time(
@@ -200,6 +329,38 @@ class StockMarketValidationService:
             self.nightly_settings.market_close_hour_utc,
             self.nightly_settings.market_close_minute_utc,
         )
+        # The same hours as second offsets from midnight UTC, for integer comparisons
+        self._market_open_offset = (
+            self.market_open_utc.hour * 3600 + self.market_open_utc.minute * 60
+        )
+        self._market_close_offset = (
+            self.market_close_utc.hour * 3600 + self.market_close_utc.minute * 60
+        )
+
+        # Per-date calendar lookups; each one otherwise builds a schedule or
+        # holiday index in pandas
+        self._trading_day_cache: dict[date, bool] = {}
+        self._market_holiday_cache: dict[date, bool] = {}
+        self._half_days_by_year: dict[int, frozenset[date]] = {}
+        self._expected_candles_cache: dict[date, int] = {}
+
+        # Symbol summary statistics keyed by the per-day figures they are built from
+        self._summary_cache: dict[
+            tuple[tuple[int, int, bool, int], ...], dict[str, Any]
+        ] = {}
+
+        # Official (trading days, early-close days) per year; loaded from the
+        # on-disk cache so a fresh process skips the schedule queries
+        self._calendar_cache_path = (
+            Path(self.settings.data_storage.base_path) / CALENDAR_CACHE_FILE
+        )
+        self._official_sessions_by_year: dict[
+            int, tuple[frozenset[date], frozenset[date]]
+        ] = (self._load_calendar_cache() if self.use_official_calendar else {})
+        self._sorted_sessions_by_year: dict[int, np.ndarray] = {}
+
+        # Created on first use; building it sets up storage and a data provider
+        self._gap_filling_service: GapFillingService | None = None
 
     def is_trading_day(self, check_date: date) -> bool:
         """
@@ -211,12 +372,18 @@ class StockMarketValidationService:
         Returns:
             True if it's a trading day, False otherwise
         """
+        is_trading = self._trading_day_cache.get(check_date)
+        if is_trading is None:
+            is_trading = self._compute_is_trading_day(check_date)
+            self._trading_day_cache[check_date] = is_trading
+        return is_trading
+
+    def _compute_is_trading_day(self, check_date: date) -> bool:
+        """Calendar lookup behind is_trading_day (uncached)."""
         if self.use_official_calendar:
             # Use pandas_market_calendars for official NYSE trading days
-            schedule = self.market_calendar.schedule(  # type: ignore
-                start_date=check_date, end_date=check_date
-            )
-            return len(schedule) > 0  # type: ignore
+            trading_days, _ = self._official_sessions_for_year(check_date.year)
+            return check_date in trading_days
         else:
             # Fallback to custom logic
             # Check if it's a weekday (Monday=0, Sunday=6)
@@ -236,6 +403,14 @@ class StockMarketValidationService:
         Returns:
             True if it's a market holiday, False otherwise
         """
+        is_holiday = self._market_holiday_cache.get(check_date)
+        if is_holiday is None:
+            is_holiday = self._compute_is_market_holiday(check_date)
+            self._market_holiday_cache[check_date] = is_holiday
+        return is_holiday
+
+    def _compute_is_market_holiday(self, check_date: date) -> bool:
+        """Calendar lookup behind _is_market_holiday (uncached)."""
         start_datetime = datetime.combine(check_date, time.min)
         end_datetime = datetime.combine(check_date, time.max)
         holidays = self.market_calendar.holidays(  # type: ignore
@@ -253,71 +428,225 @@ class StockMarketValidationService:
         Returns:
             True if it's a half trading day, False otherwise
         """
+        return check_date in self._half_days_for_year(check_date.year)
+
+    def _half_days_for_year(self, year: int) -> frozenset[date]:
+        """
+        Get all half trading days of a year, computed once per year.
+
+        Args:
+            year: Calendar year
+
+        Returns:
+            Frozen set of early-close dates in that year
+        """
+        half_days = self._half_days_by_year.get(year)
+        if half_days is None:
+            half_days = self._compute_half_days_for_year(year)
+            self._half_days_by_year[year] = half_days
+        return half_days
+
+    def _compute_half_days_for_year(self, year: int) -> frozenset[date]:
+        """Calendar lookup behind _half_days_for_year (uncached)."""
         if self.use_official_calendar:
             # Use pandas_market_calendars for official early close detection
             try:
-                schedule = self.market_calendar.schedule(  # type: ignore
-                    start_date=check_date, end_date=check_date
-                )
-                if len(schedule) > 0:  # type: ignore
-                    # Check if market close is earlier than normal (4:00 PM ET = 20:00 UTC)
-                    market_close = schedule.iloc[0]["market_close"]  # type: ignore
-                    # Convert to UTC if needed
-                    if hasattr(market_close, "tz") and market_close.tz is not None:  # type: ignore
-                        market_close_utc = market_close.tz_convert("UTC")  # type: ignore
-                    else:
-                        market_close_utc = market_close  # type: ignore
-
-                    # Normal close is 20:00 UTC, early close is typically 18:00 UTC (1:00 PM ET)
-                    normal_close_hour = 20
-                    actual_close_hour = market_close_utc.hour  # type: ignore
-
-                    return actual_close_hour < normal_close_hour  # type: ignore
-                return False
+                _, half_days = self._official_sessions_for_year(year)
+                return half_days
             except Exception as e:
                 logger.warning(
-                    f"Error checking early close with official calendar: {e}"
+                    "Error checking early close with official calendar: %s", e
                 )
                 # Fall back to custom logic below
 
         # Fallback to custom half-day logic
+        half_days: set[date] = set()
+
         # Day after Thanksgiving (Black Friday)
-        if check_date.month == 11:
-            # Find 4th Thursday of November (Thanksgiving)
-            first_day = check_date.replace(day=1)
-            # Find first Thursday
-            days_to_first_thursday = (3 - first_day.weekday()) % 7
-            first_thursday = first_day + timedelta(days=days_to_first_thursday)
-            # Get 4th Thursday
-            thanksgiving = first_thursday + timedelta(days=21)
-            # Day after Thanksgiving
-            black_friday = thanksgiving + timedelta(days=1)
-
-            if check_date == black_friday and black_friday.weekday() < 5:
-                return True
+        first_day = date(year, 11, 1)
+        # Find first Thursday
+        days_to_first_thursday = (3 - first_day.weekday()) % 7
+        first_thursday = first_day + timedelta(days=days_to_first_thursday)
+        # Get 4th Thursday (Thanksgiving), then the day after
+        black_friday = first_thursday + timedelta(days=22)
+        half_days.add(black_friday)
 
         # Christmas Eve (if it's a weekday and not a full holiday)
-        christmas_eve = date(check_date.year, 12, 24)
-        if (
-            check_date == christmas_eve
-            and christmas_eve.weekday() < 5
-            and not self._is_market_holiday(christmas_eve)
-        ):  # Only if it's not already a full holiday
-            return True
+        christmas_eve = date(year, 12, 24)
+        if christmas_eve.weekday() < 5 and not self._is_market_holiday(christmas_eve):
+            half_days.add(christmas_eve)
 
         # July 3rd (if July 4th falls on a weekday and July 3rd is a trading day)
-        july_3rd = date(check_date.year, 7, 3)
-        july_4th = date(check_date.year, 7, 4)
+        july_3rd = date(year, 7, 3)
+        july_4th = date(year, 7, 4)
         if (
-            check_date == july_3rd
-            and july_3rd.weekday() < 5  # July 3rd must be a weekday
-            and july_4th.weekday()
-            < 5  # July 4th must be a weekday (not observed on weekend)
+            july_3rd.weekday() < 5  # July 3rd must be a weekday
+            and july_4th.weekday() < 5  # July 4th must be a weekday (not observed on weekend)
             and not self._is_market_holiday(july_3rd)
         ):  # Only if July 3rd is not already a full holiday
-            return True
+            half_days.add(july_3rd)
+
+        return frozenset(half_days)
+
+    def _official_sessions_for_year(
+        self, year: int
+    ) -> tuple[frozenset[date], frozenset[date]]:
+        """
+        Get the official trading days and early-close days of a year.
+
+        Each year takes one schedule query and is then saved to the on-disk
+        calendar cache.
+
+        Args:
+            year: Calendar year
 
-        return False
+        Returns:
+            Tuple of (trading days, early-close days)
+        """
+        sessions = self._official_sessions_by_year.get(year)
+        if sessions is None:
+            schedule = self._build_schedule(date(year, 1, 1), date(year, 12, 31))
+            trading_days = schedule.index.date
+            # Normal close is 20:00 UTC, early close is typically 18:00 UTC (1:00 PM ET)
+            early_close_mask = (
+                schedule["market_close"].dt.tz_convert("UTC").dt.hour < 20
+            ).to_numpy()
+            sessions = (
+                frozenset(trading_days),
+                frozenset(trading_days[early_close_mask]),
+            )
+            self._official_sessions_by_year[year] = sessions
+            self._save_calendar_cache()
+        return sessions
+
+    def _sorted_sessions_for_year(self, year: int) -> np.ndarray:
+        """
+        Get the official trading days of a year as a sorted datetime64[D] array.
+
+        Args:
+            year: Calendar year
+
+        Returns:
+            Sorted array of the year's trading days, for binary searches
+        """
+        sessions = self._sorted_sessions_by_year.get(year)
+        if sessions is None:
+            trading_days, _ = self._official_sessions_for_year(year)
+            sessions = np.array(sorted(trading_days), dtype="datetime64[D]")
+            self._sorted_sessions_by_year[year] = sessions
+        return sessions
+
+    def _load_calendar_cache(
+        self,
+    ) -> dict[int, tuple[frozenset[date], frozenset[date]]]:
+        """
+        Load official sessions saved by an earlier run.
+
+        Returns:
+            Sessions per year, or an empty dictionary if the cache file is
+            missing, older than CALENDAR_CACHE_TTL_SECONDS or unreadable
+        """
+        try:
+            cache_age = (
+                datetime.now(UTC).timestamp()
+                - self._calendar_cache_path.stat().st_mtime
+            )
+            if cache_age > CALENDAR_CACHE_TTL_SECONDS:
+                return {}
+            with self._calendar_cache_path.open("rb") as cache_file:
+                sessions_by_year = pickle.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable calendar cache: %s", e)
+            return {}
+
+        return sessions_by_year if isinstance(sessions_by_year, dict) else {}
+
+    def _save_calendar_cache(self) -> None:
+        """Save the official sessions computed so far to the on-disk cache."""
+        try:
+            cache_dir = self._calendar_cache_path.parent
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial file
+            with tempfile.NamedTemporaryFile(
+                dir=cache_dir, suffix=".tmp", delete=False
+            ) as temp_file:
+                pickle.dump(dict(self._official_sessions_by_year), temp_file)
+            Path(temp_file.name).replace(self._calendar_cache_path)
+        except Exception as e:
+            logger.warning("Failed to save calendar cache: %s", e)
+
+    def _build_schedule(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        Get the official NYSE schedule for a whole date range in a single call.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            Schedule DataFrame indexed by trading date
+        """
+        return self.market_calendar.schedule(  # type: ignore
+            start_date=start_date, end_date=end_date
+        )
+
+    def _prime_calendar_cache(self, start_date: date, end_date: date) -> None:
+        """
+        Fill the calendar caches for a date range up front with as few calendar
+        queries as possible.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+        """
+        range_dates = pd.date_range(start_date, end_date).date
+        if len(range_dates) == 0:
+            return
+
+        if self.use_official_calendar:
+            # Whole years at a time, usually straight from the on-disk cache
+            for year in range(start_date.year, end_date.year + 1):
+                self._official_sessions_for_year(year)
+        else:
+            holidays = self.market_calendar.holidays(  # type: ignore
+                start_date=datetime.combine(start_date, time.min),
+                end_date=datetime.combine(end_date, time.max),
+            )
+            holiday_dates = set(holidays.date)  # type: ignore
+            for day in range_dates:
+                self._market_holiday_cache[day] = day in holiday_dates
+
+    def previous_trading_day(self, before_date: date) -> date:
+        """
+        Get the last trading day strictly before a given date.
+
+        Args:
+            before_date: Date to look back from
+
+        Returns:
+            The most recent trading day before before_date
+        """
+        if self.use_official_calendar:
+            # Binary search in the sorted sessions of this year, then last year
+            before = np.datetime64(before_date, "D")
+            for year in (before_date.year, before_date.year - 1):
+                sessions = self._sorted_sessions_for_year(year)
+                index = int(np.searchsorted(sessions, before)) - 1
+                if index >= 0:
+                    return sessions[index].item()
+
+        # One calendar query covers any weekend/holiday stretch in practice
+        self._prime_calendar_cache(
+            before_date - timedelta(days=PREVIOUS_TRADING_DAY_LOOKBACK_DAYS),
+            before_date - timedelta(days=1),
+        )
+
+        check_date = before_date - timedelta(days=1)
+        while not self.is_trading_day(check_date):
+            check_date -= timedelta(days=1)
+        return check_date
 
     def get_expected_candle_count(self, validation_date: date) -> int:
         """
@@ -329,6 +658,14 @@ class StockMarketValidationService:
         Returns:
             Expected number of candles (390 for full day, 210 for half day)
         """
+        expected_candles = self._expected_candles_cache.get(validation_date)
+        if expected_candles is None:
+            expected_candles = self._compute_expected_candle_count(validation_date)
+            self._expected_candles_cache[validation_date] = expected_candles
+        return expected_candles
+
+    def _compute_expected_candle_count(self, validation_date: date) -> int:
+        """Calendar lookup behind get_expected_candle_count (uncached)."""
         if not self.is_trading_day(validation_date):
             return 0
 
@@ -337,8 +674,38 @@ class StockMarketValidationService:
         else:
             return self.nightly_settings.expected_candles_per_day
 
+    def _expected_candles_by_date(
+        self, start_date: date, end_date: date
+    ) -> dict[date, int]:
+        """
+        Get expected 1-minute candle counts for every trading day in a date range.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            Dictionary mapping each trading day to its expected candle count
+        """
+        range_dates = pd.date_range(start_date, end_date).date
+
+        # Ranges already looked up (e.g. by an earlier summary) need no calendar query
+        if any(day not in self._expected_candles_cache for day in range_dates):
+            self._prime_calendar_cache(start_date, end_date)
+
+        expected_by_date: dict[date, int] = {}
+        for day in range_dates:
+            expected_candles = self.get_expected_candle_count(day)
+            if expected_candles > 0:
+                expected_by_date[day] = expected_candles
+        return expected_by_date
+
     def validate_trading_day_data(
-        self, symbol: str, validation_date: date
+        self,
+        symbol: str,
+        validation_date: date,
+        expected_candles: int | None = None,
+        series: PriceDataSeries | None = None,
     ) -> ValidationResult:
         """
         Validate 1-minute data for a specific symbol and trading day.
@@ -346,11 +713,16 @@ class StockMarketValidationService:
         Args:
             symbol: Trading symbol to validate
             validation_date: Date to validate
+            expected_candles: Precomputed expected candle count for the date
+                (looked up from the calendar if not provided)
+            series: Already loaded 1-minute data for the date, oldest first
+                (loaded from storage if not provided)
 
         Returns:
             ValidationResult with detailed validation information
         """
-        expected_candles = self.get_expected_candle_count(validation_date)
+        if expected_candles is None:
+            expected_candles = self.get_expected_candle_count(validation_date)
 
         # If not a trading day, return valid with 0 expected candles
         if expected_candles == 0:
@@ -365,29 +737,32 @@ class StockMarketValidationService:
 
         try:
             # Load 1-minute data for the specific date
-            series = self.storage_service.load_data(
-                symbol=symbol,
-                timeframe=Timeframe.ONE_MIN.value,
-                start_date=validation_date,
-                end_date=validation_date,
-            )
+            if series is None:
+                series = self.storage_service.load_data(
+                    symbol=symbol,
+                    timeframe=Timeframe.ONE_MIN.value,
+                    start_date=validation_date,
+                    end_date=validation_date,
+                    order_by="asc",
+                )
 
             # Filter candles to only include regular market hours if market hours check is enabled
             if self.nightly_settings.enable_market_hours_check:
                 regular_hours_candles = self._filter_regular_market_hours(
                     series.candles, validation_date
                 )
-                actual_candles = len(regular_hours_candles)
             else:
-                actual_candles = len(series.candles)
+                regular_hours_candles = series.candles
+            actual_candles = len(regular_hours_candles)
             errors: list[str] = []
             warnings: list[str] = []
             missing_periods: list[tuple[datetime, datetime]] = []
 
             # Find missing time periods FIRST (before early returns)
             if self.nightly_settings.enable_market_hours_check:
+                # Only in-hours candles can cover a session minute
                 missing_periods = self._find_missing_periods(
-                    series.candles, validation_date
+                    regular_hours_candles, validation_date
                 )
                 if missing_periods:
                     for start_time, end_time in missing_periods:
@@ -455,7 +830,7 @@ class StockMarketValidationService:
             )
 
         except Exception as e:
-            logger.error(f"Validation failed for {symbol} on {validation_date}: {e}")
+            logger.error("Validation failed for %s on %s: %s", symbol, validation_date, e)
             return ValidationResult(
                 symbol=symbol,
                 validation_date=validation_date,
@@ -480,30 +855,72 @@ class StockMarketValidationService:
         errors: list[str] = []
         warnings: list[str] = []
 
-        for i, candle in enumerate(candles):
-            # Validate OHLC relationships
-            if candle.high < candle.low:
-                errors.append(f"Candle {i}: High ({candle.high}) < Low ({candle.low})")
+        if not candles:
+            return errors, warnings
+
+        # OHLCV as parallel float64 columns, filled straight from the candles
+        opens, highs, lows, closes, volumes = (
+            np.fromiter(
+                map(_to_float, chain.from_iterable(map(_candle_ohlcv, candles))),
+                dtype=np.float64,
+                count=5 * len(candles),
+            )
+            .reshape(-1, 5)
+            .T
+        )
 
-            if candle.high < candle.open or candle.high < candle.close:
-                errors.append(f"Candle {i}: High ({candle.high}) < Open/Close")
+        # Fast path for the common all-valid case: low <= open/close <= high,
+        # a positive low (so every price is positive) and a positive volume
+        all_valid = (
+            (lows > 0)
+            & (volumes > 0)
+            & (lows <= np.minimum(opens, closes))
+            & (highs >= np.maximum(opens, closes))
+        )
+        if all_valid.all():
+            return errors, warnings
 
-            if candle.low > candle.open or candle.low > candle.close:
-                errors.append(f"Candle {i}: Low ({candle.low}) > Open/Close")
+        # Per-check masks are evaluated only for the candles the fast path rejected
+        suspect = np.flatnonzero(~all_valid)
+        opens, highs, lows, closes, volumes = (
+            column[suspect] for column in (opens, highs, lows, closes, volumes)
+        )
 
-            # Check for zero or negative prices
-            if (
-                candle.open <= 0
-                or candle.high <= 0
-                or candle.low <= 0
-                or candle.close <= 0
-            ):
+        # Validate OHLC relationships
+        high_below_low = highs < lows
+        high_below_open_close = (highs < opens) | (highs < closes)
+        low_above_open_close = (lows > opens) | (lows > closes)
+
+        # Check for zero or negative prices
+        non_positive_price = (opens <= 0) | (highs <= 0) | (lows <= 0) | (closes <= 0)
+
+        # Check for suspicious volume
+        negative_volume = volumes < 0
+        zero_volume = volumes == 0
+
+        # Messages are formatted last, only for failed checks, in candle order
+        for i, bad_high_low, bad_high, bad_low, bad_price, bad_volume, no_volume in zip(
+            suspect.tolist(),
+            high_below_low.tolist(),
+            high_below_open_close.tolist(),
+            low_above_open_close.tolist(),
+            non_positive_price.tolist(),
+            negative_volume.tolist(),
+            zero_volume.tolist(),
+            strict=True,
+        ):
+            candle = candles[i]
+            if bad_high_low:
+                errors.append(f"Candle {i}: High ({candle.high}) < Low ({candle.low})")
+            if bad_high:
+                errors.append(f"Candle {i}: High ({candle.high}) < Open/Close")
+            if bad_low:
+                errors.append(f"Candle {i}: Low ({candle.low}) > Open/Close")
+            if bad_price:
                 errors.append(f"Candle {i}: Invalid price (zero or negative)")
-
-            # Check for suspicious volume
-            if candle.volume < 0:
+            if bad_volume:
                 errors.append(f"Candle {i}: Negative volume ({candle.volume})")
-            elif candle.volume == 0:
+            elif no_volume:
                 warnings.append(f"Candle {i}: Zero volume")
 
         return errors, warnings
@@ -522,63 +939,55 @@ class StockMarketValidationService:
         Returns:
             List of (start_time, end_time) tuples for missing periods in UTC
         """
-        # Create expected time range for the trading day in UTC
-        market_open_utc = datetime.combine(
-            validation_date, self.market_open_utc
-        ).replace(tzinfo=UTC)
-
+        # Expected session for the trading day as UTC epoch seconds
+        market_open = _day_start_timestamp(validation_date) + self._market_open_offset
         if self.is_half_trading_day(validation_date):
             # Half day: 3.5 hours (210 minutes) - closes at 17:00 UTC (1:00 PM ET)
-            market_close_utc = market_open_utc + timedelta(hours=3, minutes=30)
+            market_close = market_open + HALF_DAY_SESSION_SECONDS
         else:
             # Full day: 6.5 hours (390 minutes) - closes at 20:00 UTC (4:00 PM ET)
-            market_close_utc = market_open_utc + timedelta(hours=6, minutes=30)
+            market_close = market_open + FULL_DAY_SESSION_SECONDS
 
         # If no candles at all, the entire trading session is missing
         if not candles:
-            return [(market_open_utc, market_close_utc)]
-
-        # Generate expected timestamps (every minute) in UTC
-        expected_times: set[datetime] = set()
-        current_time = market_open_utc
-        while current_time < market_close_utc:
-            expected_times.add(current_time)
-            current_time += timedelta(minutes=1)
-
-        # Get actual timestamps from candles, ensuring they're in UTC
-        actual_times: set[datetime] = set()
-        for candle in candles:
-            candle_time = candle.date.replace(second=0, microsecond=0)
-            # Ensure candle time is timezone-aware (assume UTC if naive)
-            if candle_time.tzinfo is None:
-                candle_time = candle_time.replace(tzinfo=UTC)
-            actual_times.add(candle_time)
-
-        # Find missing times
-        missing_times: list[datetime] = sorted(expected_times - actual_times)
-
-        # Group consecutive missing times into periods
-        missing_periods: list[tuple[datetime, datetime]] = []
-        if missing_times:
-            period_start: datetime = missing_times[0]
-            period_end: datetime = missing_times[0]
-
-            for missing_time in missing_times[1:]:
-                if missing_time == period_end + timedelta(minutes=1):
-                    # Consecutive missing time
-                    period_end = missing_time
-                else:
-                    # Gap in missing times, close current period and start new one
-                    missing_periods.append(
-                        (period_start, period_end + timedelta(minutes=1))
-                    )
-                    period_start = missing_time
-                    period_end = missing_time
+            return [(_utc_datetime(market_open), _utc_datetime(market_close))]
+
+        # Work in whole epoch minutes; flooring drops seconds
+        open_minute = market_open // 60
+        close_minute = market_close // 60
+        actual_minutes = _candle_epoch_seconds(candles) // 60
+
+        # Fast path for a complete session: exactly one candle per minute from the open
+        if (
+            len(actual_minutes) == close_minute - open_minute
+            and actual_minutes[0] == open_minute
+            and (np.diff(actual_minutes) == 1).all()
+        ):
+            return []
+
+        # Expected minutes of the session as a contiguous range
+        expected_minutes = np.arange(open_minute, close_minute, dtype=np.int64)
 
-            # Close the last period
-            missing_periods.append((period_start, period_end + timedelta(minutes=1)))
+        # Find missing minutes (setdiff1d returns them sorted)
+        missing_minutes = np.setdiff1d(expected_minutes, actual_minutes)
+        if len(missing_minutes) == 0:
+            return []
 
-        return missing_periods
+        # Group consecutive missing minutes into [start, end) periods: a run breaks
+        # wherever the step to the next missing minute is more than one minute
+        run_breaks = np.flatnonzero(np.diff(missing_minutes) != 1) + 1
+        period_starts = missing_minutes[np.concatenate(([0], run_breaks))] * 60
+        period_ends = (missing_minutes[np.concatenate((run_breaks - 1, [-1]))] + 1) * 60
+
+        # Only the emitted periods are converted back to datetimes, as one
+        # (N, 2) datetime64[s] array turned into naive datetimes in bulk
+        period_bounds = np.column_stack((period_starts, period_ends)).astype(
+            "datetime64[s]"
+        )
+        return [
+            (start_time.replace(tzinfo=UTC), end_time.replace(tzinfo=UTC))
+            for start_time, end_time in period_bounds.tolist()
+        ]
 
     def _filter_regular_market_hours(
         self, candles: list[PriceCandle], validation_date: date
@@ -600,36 +1009,35 @@ class StockMarketValidationService:
         if not candles:
             return []
 
-        # Create market hours boundaries in UTC
-        market_open_utc = datetime.combine(
-            validation_date, self.market_open_utc
-        ).replace(tzinfo=UTC)
-
-        market_close_utc = datetime.combine(
-            validation_date, self.market_close_utc
-        ).replace(tzinfo=UTC)
+        # Market hours boundaries as UTC epoch seconds
+        day_start = _day_start_timestamp(validation_date)
+        market_open = day_start + self._market_open_offset
+        market_close = day_start + self._market_close_offset
 
         # Adjust for half trading days
         if self.is_half_trading_day(validation_date):
             # Half day closes at 17:00 UTC (1:00 PM ET)
-            market_close_utc = market_open_utc + timedelta(hours=3, minutes=30)
+            market_close = market_open + HALF_DAY_SESSION_SECONDS
 
-        # Filter candles within market hours
-        regular_hours_candles: list[PriceCandle] = []
-        for candle in candles:
-            # Ensure candle datetime is timezone-aware (assume UTC if naive)
-            candle_time = candle.date
-            if candle_time.tzinfo is None:
-                candle_time = candle_time.replace(tzinfo=UTC)
+        candle_seconds = _candle_epoch_seconds(candles)
 
-            # Check if candle is within regular market hours
-            if market_open_utc <= candle_time < market_close_utc:
-                regular_hours_candles.append(candle)
+        # Stored candles arrive sorted: binary-search the two cut points and slice
+        if (np.diff(candle_seconds) >= 0).all():
+            first, stop = np.searchsorted(
+                candle_seconds, [market_open, market_close], side="left"
+            ).tolist()
+            return candles[first:stop]
 
-        return regular_hours_candles
+        # Otherwise filter candles within market hours with a single vectorized mask
+        in_hours = (candle_seconds >= market_open) & (candle_seconds < market_close)
+        return [candles[i] for i in np.flatnonzero(in_hours)]
 
     def validate_symbol_data_range(
-        self, symbol: str, start_date: date, end_date: date
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        expected_by_date: dict[date, int] | None = None,
     ) -> list[ValidationResult]:
         """
         Validate data for a symbol across a date range.
@@ -638,20 +1046,65 @@ class StockMarketValidationService:
             symbol: Trading symbol to validate
             start_date: Start date for validation
             end_date: End date for validation
+            expected_by_date: Precomputed expected candle counts per trading day,
+                as returned by _expected_candles_by_date for the same range
 
         Returns:
             List of ValidationResult objects for each trading day
         """
-        results: list[ValidationResult] = []
-        current_date = start_date
+        if expected_by_date is None:
+            # One calendar query for the whole range instead of one per date
+            expected_by_date = self._expected_candles_by_date(start_date, end_date)
+
+        return [
+            self.validate_trading_day_data(symbol, trading_date, expected_candles)
+            for trading_date, expected_candles in expected_by_date.items()
+        ]
+
+    def _validate_symbol_on_date(
+        self,
+        symbol: str,
+        validation_date: date,
+        expected_candles: int,
+        series: PriceDataSeries | None,
+    ) -> ValidationResult:
+        """
+        Validate one symbol for validate_multiple_symbols, logging failures.
 
-        while current_date <= end_date:
-            if self.is_trading_day(current_date):
-                result = self.validate_trading_day_data(symbol, current_date)
-                results.append(result)
-            current_date += timedelta(days=1)
+        Args:
+            symbol: Trading symbol to validate
+            validation_date: Date to validate
+            expected_candles: Expected candle count for the date
+            series: Preloaded 1-minute data for the date, if any
 
-        return results
+        Returns:
+            ValidationResult, or a failed result if validation raised
+        """
+        try:
+            result = self.validate_trading_day_data(
+                symbol, validation_date, expected_candles, series
+            )
+
+            if not result.is_valid:
+                logger.warning(
+                    "Validation failed for %s on %s: %s",
+                    symbol,
+                    validation_date,
+                    result.errors,
+                )
+
+            return result
+
+        except Exception as e:
+            logger.error("Failed to validate %s on %s: %s", symbol, validation_date, e)
+            return ValidationResult(
+                symbol=symbol,
+                validation_date=validation_date,
+                is_valid=False,
+                expected_candles=0,
+                actual_candles=0,
+                errors=[f"Validation exception: {str(e)}"],
+            )
 
     def validate_multiple_symbols(
         self, symbols: list[str], validation_date: date
@@ -659,6 +1112,9 @@ class StockMarketValidationService:
         """
         Validate data for multiple symbols on a specific date.
 
+        Symbols are validated concurrently; the work is dominated by Parquet
+        reads, which release the GIL.
+
         Args:
             symbols: List of trading symbols to validate
             validation_date: Date to validate
@@ -666,30 +1122,29 @@ class StockMarketValidationService:
         Returns:
             Dictionary mapping symbol to ValidationResult
         """
-        results: dict[str, ValidationResult] = {}
-
-        for symbol in symbols:
-            try:
-                result = self.validate_trading_day_data(symbol, validation_date)
-                results[symbol] = result
-
-                if not result.is_valid:
-                    logger.warning(
-                        f"Validation failed for {symbol} on {validation_date}: {result.errors}"
-                    )
+        expected_candles = self.get_expected_candle_count(validation_date)
 
-            except Exception as e:
-                logger.error(f"Failed to validate {symbol} on {validation_date}: {e}")
-                results[symbol] = ValidationResult(
-                    symbol=symbol,
-                    validation_date=validation_date,
-                    is_valid=False,
-                    expected_candles=0,
-                    actual_candles=0,
-                    errors=[f"Validation exception: {str(e)}"],
-                )
+        # Load every symbol's day in one storage scan (nothing to load on a non-trading day)
+        series_by_symbol: dict[str, PriceDataSeries] = {}
+        if expected_candles > 0:
+            series_by_symbol = self.storage_service.load_data_multi(
+                symbols,
+                Timeframe.ONE_MIN.value,
+                start_date=validation_date,
+                end_date=validation_date,
+            )
 
-        return results
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_VALIDATION_WORKERS, len(symbols)))
+        ) as executor:
+            results = executor.map(
+                self._validate_symbol_on_date,
+                symbols,
+                repeat(validation_date),
+                repeat(expected_candles),
+                [series_by_symbol.get(symbol) for symbol in symbols],
+            )
+            return dict(zip(symbols, results, strict=True))
 
     def get_data_completeness_summary(
         self, symbols: list[str], start_date: date, end_date: date
@@ -707,83 +1162,24 @@ class StockMarketValidationService:
         """
         summary: dict[str, dict[str, Any]] = {}
 
-        for symbol in symbols:
-            validation_results = self.validate_symbol_data_range(
-                symbol, start_date, end_date
-            )
-
-            total_trading_days = len(validation_results)
-            valid_days = sum(1 for result in validation_results if result.is_valid)
-            invalid_days = total_trading_days - valid_days
-
-            total_expected_candles = sum(
-                result.expected_candles for result in validation_results
-            )
-            total_actual_candles = sum(
-                result.actual_candles for result in validation_results
-            )
-
-            completeness_percentage = (
-                (total_actual_candles / total_expected_candles * 100)
-                if total_expected_candles > 0
-                else 0
-            )
-
-            # Calculate enhanced metrics
-            full_days_count = sum(
-                1 for result in validation_results if result.expected_candles == 390
-            )
-            half_days_count = sum(
-                1 for result in validation_results if result.expected_candles == 210
-            )
-            days_with_gaps = sum(
-                1
-                for result in validation_results
-                if result.actual_candles < result.expected_candles
-            )
-            total_missing_periods = sum(
-                len(result.missing_periods) for result in validation_results
-            )
-
-            # Calculate daily completeness percentages
-            daily_completeness = [
-                (
-                    (result.actual_candles / result.expected_candles * 100)
-                    if result.expected_candles > 0
-                    else 100.0
+        # Expected counts depend only on the date, so look them up once for all symbols
+        expected_by_date = self._expected_candles_by_date(start_date, end_date)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_VALIDATION_WORKERS, len(symbols)))
+        ) as executor:
+            results_by_symbol = list(
+                executor.map(
+                    self.validate_symbol_data_range,
+                    symbols,
+                    repeat(start_date),
+                    repeat(end_date),
+                    repeat(expected_by_date),
                 )
-                for result in validation_results
-            ]
-
-            average_daily_completeness = (
-                sum(daily_completeness) / len(daily_completeness)
-                if daily_completeness
-                else 0.0
-            )
-            worst_day_completeness = (
-                min(daily_completeness) if daily_completeness else 100.0
-            )
-            best_day_completeness = (
-                max(daily_completeness) if daily_completeness else 0.0
             )
 
-            summary[symbol] = {
-                "total_trading_days": total_trading_days,
-                "valid_days": valid_days,
-                "invalid_days": invalid_days,
-                "completeness_percentage": round(completeness_percentage, 2),
-                "total_expected_candles": total_expected_candles,
-                "total_actual_candles": total_actual_candles,
-                "missing_candles": total_expected_candles - total_actual_candles,
-                "full_days_count": full_days_count,
-                "half_days_count": half_days_count,
-                "days_with_gaps": days_with_gaps,
-                "total_missing_periods": total_missing_periods,
-                "average_daily_completeness": round(average_daily_completeness, 2),
-                "worst_day_completeness": round(worst_day_completeness, 2),
-                "best_day_completeness": round(best_day_completeness, 2),
-                "validation_results": validation_results,
-            }
+        for symbol, validation_results in zip(symbols, results_by_symbol, strict=True):
+            summary[symbol] = self._calculate_symbol_summary(symbol, validation_results)
 
         return summary
 
@@ -802,24 +1198,84 @@ class StockMarketValidationService:
         """
         if target_date is None:
             # Default to previous trading day
-            target_date = date.today() - timedelta(days=1)
-            while not self.is_trading_day(target_date):
-                target_date -= timedelta(days=1)
+            target_date = self.previous_trading_day(date.today())
+
+        expected_candles = self.get_expected_candle_count(target_date)
+
+        # Stored row counts come from file metadata alone. Fewer rows than
+        # expected already makes the day invalid, so only the remaining symbols
+        # need a full validation (for intraday gaps and integrity errors).
+        needs_update_by_symbol: dict[str, bool] = {}
+        symbols_to_validate = symbols
+        if expected_candles > 0:
+            row_counts = self.storage_service.get_total_count_multi(
+                symbols, Timeframe.ONE_MIN.value, target_date, target_date
+            )
+            symbols_to_validate = []
+            for symbol, row_count in row_counts.items():
+                if row_count < expected_candles:
+                    logger.info(
+                        "%s needs update for %s: %d of %d candles stored",
+                        symbol,
+                        target_date,
+                        row_count,
+                        expected_candles,
+                    )
+                    needs_update_by_symbol[symbol] = True
+                else:
+                    symbols_to_validate.append(symbol)
+
+        # Symbols are checked concurrently; map() keeps the input order
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_VALIDATION_WORKERS, len(symbols_to_validate)))
+        ) as executor:
+            needs_update_by_symbol.update(
+                zip(
+                    symbols_to_validate,
+                    executor.map(
+                        self._symbol_needs_update,
+                        symbols_to_validate,
+                        repeat(target_date),
+                        repeat(expected_candles),
+                    ),
+                    strict=True,
+                )
+            )
 
-        symbols_needing_update: list[str] = []
+        return [symbol for symbol in symbols if needs_update_by_symbol[symbol]]
 
-        for symbol in symbols:
-            try:
-                result = self.validate_trading_day_data(symbol, target_date)
-                if not result.is_valid or result.actual_candles == 0:
-                    symbols_needing_update.append(symbol)
-                    logger.info(f"{symbol} needs update for {target_date}: {result}")
+    def _symbol_needs_update(
+        self, symbol: str, target_date: date, expected_candles: int
+    ) -> bool:
+        """
+        Check one symbol for find_symbols_needing_update.
 
-            except Exception as e:
-                logger.error(f"Failed to check {symbol} for {target_date}: {e}")
-                symbols_needing_update.append(symbol)
+        Args:
+            symbol: Symbol to check
+            target_date: Date to check
+            expected_candles: Expected candle count for the date
 
-        return symbols_needing_update
+        Returns:
+            True if the symbol's data for the date is invalid, empty or unreadable
+        """
+        try:
+            result = self.validate_trading_day_data(
+                symbol, target_date, expected_candles
+            )
+            if not result.is_valid or result.actual_candles == 0:
+                logger.info("%s needs update for %s: %s", symbol, target_date, result)
+                return True
+            return False
+
+        except Exception as e:
+            logger.error("Failed to check %s for %s: %s", symbol, target_date, e)
+            return True
+
+    def _get_gap_filling_service(self) -> GapFillingService:
+        """Return the gap filling service, creating it on first use."""
+        if self._gap_filling_service is None:
+            self._gap_filling_service = GapFillingService()
+        return self._gap_filling_service
 
     async def analyze_completeness_with_gap_filling(
         self,
@@ -842,90 +1298,146 @@ class StockMarketValidationService:
         Returns:
             Dictionary with completeness analysis and gap filling results
         """
-        from services.gap_filling_service import GapFillingService
-
         # First, run the standard completeness analysis
         summary = self.get_data_completeness_summary(symbols, start_date, end_date)
 
         if not auto_fill_gaps:
             return summary
 
-        # Initialize gap filling service
-        gap_filling_service = GapFillingService()
+        gap_filling_service = self._get_gap_filling_service()
 
-        # Process each symbol for gap filling
-        for symbol in symbols:
-            if symbol not in summary:
-                continue
+        # Collect every day with gaps up front so the fills can run concurrently
+        pending: list[tuple[str, ValidationResult]] = [
+            (symbol, validation_result)
+            for symbol in symbols
+            if symbol in summary
+            for validation_result in summary[symbol].get("validation_results", [])
+            if validation_result.missing_periods
+        ]
 
-            symbol_data = summary[symbol]
-            validation_results = symbol_data.get("validation_results", [])
+        # Each task covers one symbol-day. Recovered candles are merged and
+        # stored without awaiting, so concurrent fills never interleave writes.
+        # All days share one client (and so its rate limiter) and one set of
+        # fill slots, so the vendor sees at most MAX_CONCURRENT_GAP_FILLS fills.
+        fill_slots = asyncio.Semaphore(MAX_CONCURRENT_GAP_FILLS)
+
+        async def fill_day(
+            client: PolygonClient, symbol: str, validation_result: ValidationResult
+        ) -> list[GapFillResult]:
+            logger.info(
+                "Attempting to fill %d gaps for %s on %s",
+                len(validation_result.missing_periods),
+                symbol,
+                validation_result.validation_date,
+            )
+            gap_fill_results = [
+                gap_result
+                async for gap_result in gap_filling_service.fill_gaps_stream(
+                    symbol,
+                    validation_result.missing_periods,
+                    max_gap_fill_attempts,
+                    client=client,
+                    fill_slots=fill_slots,
+                )
+            ]
+            # Results stream in completion order; report them by period
+            gap_fill_results.sort(key=attrgetter("start_time"))
+            return gap_fill_results
+
+        async with gap_filling_service.open_polygon_client() as polygon_client:
+            fill_results = await asyncio.gather(
+                *(
+                    fill_day(polygon_client, symbol, result)
+                    for symbol, result in pending
+                ),
+                return_exceptions=True,
+            )
 
-            total_gaps_found = 0
-            gaps_filled_successfully = 0
-            gaps_vendor_unavailable = 0
-            total_candles_recovered = 0
+        # Tally gap filling statistics per symbol
+        stats: dict[str, dict[str, Any]] = {
+            symbol: {
+                "gap_fill_attempted": True,
+                "total_gaps_found": 0,
+                "gaps_filled_successfully": 0,
+                "gaps_vendor_unavailable": 0,
+                "candles_recovered": 0,
+            }
+            for symbol in symbols
+            if symbol in summary
+        }
+        # Days per symbol where at least one gap was filled
+        affected_dates: dict[str, set[date]] = {}
+        for (symbol, validation_result), gap_fill_results in zip(
+            pending, fill_results, strict=True
+        ):
+            symbol_stats = stats[symbol]
+            symbol_stats["total_gaps_found"] += len(validation_result.missing_periods)
+
+            if isinstance(gap_fill_results, BaseException):
+                logger.error(
+                    "Gap filling failed for %s on %s: %s",
+                    symbol,
+                    validation_result.validation_date,
+                    gap_fill_results,
+                )
+                continue
 
-            # Process each day's validation results
-            for validation_result in validation_results:
-                if not validation_result.missing_periods:
-                    continue
+            filled = [gap_result for gap_result in gap_fill_results if gap_result.success]
+            symbol_stats["gaps_filled_successfully"] += len(filled)
+            symbol_stats["candles_recovered"] += sum(
+                gap_result.candles_recovered for gap_result in filled
+            )
+            symbol_stats["gaps_vendor_unavailable"] += sum(
+                not gap_result.success and gap_result.vendor_unavailable
+                for gap_result in gap_fill_results
+            )
+            if filled:
+                affected_dates.setdefault(symbol, set()).add(
+                    validation_result.validation_date
+                )
 
-                # Convert missing periods to datetime tuples
-                missing_periods: list[tuple[datetime, datetime]] = []
-                for start_time, end_time in validation_result.missing_periods:
-                    missing_periods.append((start_time, end_time))
+            # Store gap fill results in validation result
+            validation_result.gap_fill_results = gap_fill_results
 
-                total_gaps_found += len(missing_periods)
+        # Re-run validation after gap filling, only over the span of days that
+        # actually received data
+        for symbol in affected_dates:
+            logger.info(
+                "Re-validating %s after filling %d gaps",
+                symbol,
+                stats[symbol]["gaps_filled_successfully"],
+            )
 
-                if missing_periods:
-                    logger.info(
-                        f"Attempting to fill {len(missing_periods)} gaps for {symbol} "
-                        f"on {validation_result.validation_date}"
-                    )
+        updated_results_list = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.validate_symbol_data_range, symbol, min(dates), max(dates)
+                )
+                for symbol, dates in affected_dates.items()
+            )
+        )
 
-                    # Attempt to fill gaps
-                    gap_fill_results = await gap_filling_service.fill_gaps_for_periods(
-                        symbol, missing_periods, max_gap_fill_attempts
-                    )
+        updated_results_by_symbol = dict(
+            zip(affected_dates, updated_results_list, strict=True)
+        )
 
-                    # Update statistics
-                    for gap_result in gap_fill_results:
-                        if gap_result.success:
-                            gaps_filled_successfully += 1
-                            total_candles_recovered += gap_result.candles_recovered
-                        elif gap_result.vendor_unavailable:
-                            gaps_vendor_unavailable += 1
-
-                    # Store gap fill results in validation result
-                    validation_result.gap_fill_results = gap_fill_results
-
-            # Update symbol data with gap filling statistics
-            symbol_data.update(
-                {
-                    "gap_fill_attempted": True,
-                    "total_gaps_found": total_gaps_found,
-                    "gaps_filled_successfully": gaps_filled_successfully,
-                    "gaps_vendor_unavailable": gaps_vendor_unavailable,
-                    "candles_recovered": total_candles_recovered,
+        # Merge gap filling statistics and any recomputed summary in one step
+        for symbol, symbol_stats in stats.items():
+            symbol_data = summary[symbol]
+            updated_results = updated_results_by_symbol.get(symbol)
+            if updated_results is not None:
+                # Replace the re-validated days, keeping the original date order
+                results_by_date = {
+                    result.validation_date: result
+                    for result in symbol_data["validation_results"]
                 }
-            )
-
-            # Re-run validation after gap filling to get updated completeness
-            if gaps_filled_successfully > 0:
-                logger.info(
-                    f"Re-validating {symbol} after filling {gaps_filled_successfully} gaps"
+                results_by_date.update(
+                    (result.validation_date, result) for result in updated_results
                 )
-                updated_results = self.validate_symbol_data_range(
-                    symbol, start_date, end_date
+                symbol_stats |= self._calculate_symbol_summary(
+                    symbol, list(results_by_date.values())
                 )
-
-                # Update the summary with new validation results
-                updated_summary = self._calculate_symbol_summary(
-                    symbol, updated_results
-                )
-                symbol_data.update(updated_summary)
-                symbol_data["validation_results"] = updated_results
+            symbol_data |= symbol_stats
 
         return summary
 
@@ -942,64 +1454,72 @@ class StockMarketValidationService:
         Returns:
             Dictionary with summary statistics
         """
-        total_trading_days = len(validation_results)
-        valid_days = sum(1 for result in validation_results if result.is_valid)
+        # The statistics depend only on these per-day figures, so a repeated
+        # summary of unchanged results is served from the cache
+        key = tuple(map(ValidationResult.summary_figures, validation_results))
+        statistics = self._summary_cache.get(key)
+        if statistics is None:
+            statistics = self._compute_symbol_summary(key)
+            if len(self._summary_cache) >= SUMMARY_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._summary_cache[next(iter(self._summary_cache))]
+            self._summary_cache[key] = statistics
+
+        return {**statistics, "validation_results": validation_results}
+
+    def _compute_symbol_summary(
+        self, daily_figures: tuple[tuple[int, int, bool, int], ...]
+    ) -> dict[str, Any]:
+        """Statistics behind _calculate_symbol_summary (uncached)."""
+        total_trading_days = len(daily_figures)
+
+        # Per-day figures as one array, so every statistic is a vectorized reduction
+        figures = np.array(daily_figures, dtype=np.int64).reshape(-1, 4)
+        expected, actual, valid, missing_period_counts = figures.T
+
+        valid_days = int(valid.sum())
         invalid_days = total_trading_days - valid_days
 
-        total_expected_candles = sum(
-            result.expected_candles for result in validation_results
-        )
-        total_actual_candles = sum(
-            result.actual_candles for result in validation_results
-        )
+        total_expected_candles = int(expected.sum())
+        total_actual_candles = int(actual.sum())
 
         completeness_percentage = (
-            (total_actual_candles / total_expected_candles * 100)
+            _rounded_percentage(total_actual_candles, total_expected_candles)
             if total_expected_candles > 0
             else 0
         )
 
         # Calculate enhanced metrics
-        full_days_count = sum(
-            1 for result in validation_results if result.expected_candles == 390
-        )
-        half_days_count = sum(
-            1 for result in validation_results if result.expected_candles == 210
-        )
-        days_with_gaps = sum(
-            1
-            for result in validation_results
-            if result.actual_candles < result.expected_candles
-        )
-        total_missing_periods = sum(
-            len(result.missing_periods) for result in validation_results
-        )
-
-        # Calculate daily completeness percentages
-        daily_completeness = [
-            (
-                (result.actual_candles / result.expected_candles * 100)
-                if result.expected_candles > 0
-                else 100.0
-            )
-            for result in validation_results
-        ]
-
-        average_daily_completeness = (
-            sum(daily_completeness) / len(daily_completeness)
-            if daily_completeness
-            else 0.0
-        )
-        worst_day_completeness = (
-            min(daily_completeness) if daily_completeness else 100.0
-        )
-        best_day_completeness = max(daily_completeness) if daily_completeness else 0.0
+        full_days_count = int((expected == 390).sum())
+        half_days_count = int((expected == 210).sum())
+        days_with_gaps = int((actual < expected).sum())
+        total_missing_periods = int(missing_period_counts.sum())
+
+        if not total_trading_days:
+            average_daily_completeness = 0.0
+            worst_day_completeness = 100.0
+            best_day_completeness = 0.0
+        elif days_with_gaps == 0 and np.array_equal(actual, expected):
+            # Every day is complete (the common case), so every daily
+            # percentage is 100 and none need computing
+            average_daily_completeness = 100.0
+            worst_day_completeness = 100.0
+            best_day_completeness = 100.0
+        else:
+            # Calculate daily completeness percentages
+            with np.errstate(divide="ignore", invalid="ignore"):
+                daily_completeness = np.where(
+                    expected > 0, actual / expected * 100, 100.0
+                )
+            average_daily_completeness = float(daily_completeness.mean())
+            worst_day_completeness = float(daily_completeness.min())
+            best_day_completeness = float(daily_completeness.max())
 
         return {
             "total_trading_days": total_trading_days,
             "valid_days": valid_days,
             "invalid_days": invalid_days,
-            "completeness_percentage": round(completeness_percentage, 2),
+            "completeness_percentage": completeness_percentage,
             "total_expected_candles": total_expected_candles,
             "total_actual_candles": total_actual_candles,
             "missing_candles": total_expected_candles - total_actual_candles,
@@ -1010,5 +1530,14 @@ class StockMarketValidationService:
             "average_daily_completeness": round(average_daily_completeness, 2),
             "worst_day_completeness": round(worst_day_completeness, 2),
             "best_day_completeness": round(best_day_completeness, 2),
-            "validation_results": validation_results,
         }
+
+
+@lru_cache(maxsize=1)
+def get_stock_market_validation_service() -> StockMarketValidationService:
+    """
+    Get the shared validation service instance.
+
+    Sharing one instance keeps its calendar lookups cached across callers.
+    """
+    return StockMarketValidationService()
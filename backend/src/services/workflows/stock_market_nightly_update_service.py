@@ -10,8 +10,11 @@ This service orchestrates the complete nightly update process for stock market d
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
 from typing import override
 
 from simutrador_core.models.price_data import DataUpdateStatus, Timeframe
@@ -25,16 +28,18 @@ from models.nightly_update_api import (
     ValidationResultModel,
 )
 
+from ..data_providers.data_provider_interface import DataProviderInterface
 from ..progress.nightly_update_progress_service import (
     NightlyUpdateProgressService,
 )
 from ..storage.data_resampling_service import DataResamplingService
 from ..storage.data_storage_service import DataStorageService
 from ..validation.stock_market_validation_service import (
-    StockMarketValidationService,
     ValidationResult,
+    get_stock_market_validation_service,
 )
 from .stock_market_resampling_workflow import (
+    ResamplingWorkflowResult,
     StockMarketResamplingWorkflow,
 )
 from .trading_data_updating_service import TradingDataUpdatingService
@@ -42,9 +47,44 @@ from .trading_data_updating_service import TradingDataUpdatingService
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_resample_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool shared by all nightly updates for resampling.
+
+    Sized by the configured symbol concurrency, so concurrent update requests do
+    not resample more symbols at once than that.
+    """
+    return ThreadPoolExecutor(
+        max_workers=get_settings().nightly_update.max_concurrent_symbols,
+        thread_name_prefix="nightly-resample",
+    )
+
+
+def shutdown_resample_executor() -> None:
+    """Shut down the shared resampling pool, waiting for running work."""
+    if _get_resample_executor.cache_info().currsize:
+        _get_resample_executor().shutdown(wait=True)
+        _get_resample_executor.cache_clear()
+
+
 class NightlyUpdateResult:
     """Result of a nightly update operation."""
 
+    # One per symbol per run, mostly for symbols that are already current
+    __slots__ = (
+        "symbol",
+        "start_date",
+        "end_date",
+        "success",
+        "validation_results",
+        "update_statuses",
+        "resampling_results",
+        "error_message",
+        "_total_candles_updated",
+        "_total_resampled_candles",
+    )
+
     def __init__(
         self,
         symbol: str,
@@ -65,17 +105,45 @@ class NightlyUpdateResult:
         self.resampling_results = resampling_results or {}
         self.error_message = error_message
 
+        # Totals are read several times per symbol (summaries, API conversion,
+        # logging), so they are summed once here
+        self._total_candles_updated = sum(
+            status.records_updated for status in self.update_statuses if status.success
+        )
+        self._total_resampled_candles = sum(self.resampling_results.values())
+
+    @classmethod
+    def up_to_date(
+        cls, symbol: str, start_date: date, end_date: date
+    ) -> "NightlyUpdateResult":
+        """
+        Create the result for a symbol whose data is already current.
+
+        Args:
+            symbol: Trading symbol that needed no update
+            start_date: Start of the (empty) update range
+            end_date: End of the (empty) update range
+
+        Returns:
+            Successful NightlyUpdateResult with nothing updated
+        """
+        return cls(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            success=True,
+            error_message="No updates needed - data is current",
+        )
+
     @property
     def total_candles_updated(self) -> int:
         """Get total number of 1-minute candles updated."""
-        return sum(
-            status.records_updated for status in self.update_statuses if status.success
-        )
+        return self._total_candles_updated
 
     @property
     def total_resampled_candles(self) -> int:
         """Get total number of resampled candles across all timeframes."""
-        return sum(self.resampling_results.values())
+        return self._total_resampled_candles
 
     @override
     def __str__(self) -> str:
@@ -96,12 +164,17 @@ class StockMarketNightlyUpdateService:
         self.nightly_settings = self.settings.nightly_update
 
         # Initialize dependent services
-        self.validation_service = StockMarketValidationService()
+        self.validation_service = get_stock_market_validation_service()
         self.updating_service = TradingDataUpdatingService()
         self.resampling_service = DataResamplingService()
         self.resampling_workflow = StockMarketResamplingWorkflow()
         self.storage_service = DataStorageService()
 
+        # Trading-day adjusted (start, end) per requested range; most symbols of
+        # one run share a range, so the calendar walk is done once per range
+        self._trading_date_ranges: dict[tuple[date, date], tuple[date, date]] = {}
+        self._auto_resample_enabled = bool(self.nightly_settings.enable_auto_resampling)
+
     def get_default_symbols(self) -> list[str]:
         """
         Get the default list of symbols for nightly updates.
@@ -131,6 +204,8 @@ class StockMarketNightlyUpdateService:
         Returns:
             Tuple of (start_date, end_date) for updates
         """
+        today = date.today()
+
         # Use custom start date if provided, otherwise determine automatically
         if custom_start_date is not None:
             start_date = custom_start_date
@@ -142,7 +217,7 @@ class StockMarketNightlyUpdateService:
 
             if last_update is None:
                 # No existing data, start from 30 days ago (reasonable default)
-                start_date = date.today() - timedelta(days=30)
+                start_date = today - timedelta(days=30)
             else:
                 # Start from the last update date to prevent gaps from partial downloads
                 start_date = last_update.date()
@@ -152,7 +227,35 @@ class StockMarketNightlyUpdateService:
             end_date = custom_end_date
         else:
             # End date is yesterday (don't update today's incomplete data)
-            end_date = date.today() - timedelta(days=1)
+            end_date = today - timedelta(days=1)
+
+        return self._trading_date_range(start_date, end_date)
+
+    def _trading_date_range(self, start_date: date, end_date: date) -> tuple[date, date]:
+        """
+        Narrow a date range so it starts and ends on trading days.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+
+        Returns:
+            Tuple of (start_date, end_date); start_date > end_date when the range
+            holds no trading day
+        """
+        # Nothing to narrow once the data is current, and a single trading day
+        # (the usual nightly catch-up) needs just one calendar lookup
+        if start_date > end_date:
+            return start_date, end_date
+        if start_date == end_date and self.validation_service.is_trading_day(
+            start_date
+        ):
+            return start_date, end_date
+
+        key = (start_date, end_date)
+        cached = self._trading_date_ranges.get(key)
+        if cached is not None:
+            return cached
 
         # Ensure we only update trading days
         while start_date <= end_date and not self.validation_service.is_trading_day(
@@ -165,8 +268,79 @@ class StockMarketNightlyUpdateService:
         ):
             end_date -= timedelta(days=1)
 
+        self._trading_date_ranges[key] = (start_date, end_date)
         return start_date, end_date
 
+    async def _download_one_min_data(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        client: DataProviderInterface | None = None,
+    ) -> tuple[list[DataUpdateStatus], DataUpdateStatus | None]:
+        """
+        Download 1-minute data for a symbol.
+
+        Args:
+            symbol: Trading symbol to download
+            start_date: First date to download
+            end_date: Last date to download
+            client: Optional provider client shared with other symbols' downloads
+
+        Returns:
+            Tuple of (all update statuses, the 1-minute status or None)
+        """
+        update_statuses = await self.updating_service.update_symbol_data(
+            symbol=symbol,
+            timeframes=[Timeframe.ONE_MIN.value],
+            start_date=start_date,
+            end_date=end_date,
+            force_update=False,
+            client=client,
+        )
+        return update_statuses, update_statuses[0] if update_statuses else None
+
+    async def _resample_one_min_data(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> ResamplingWorkflowResult:
+        """
+        Resample 1-minute data to the configured target timeframes.
+
+        The workflow is synchronous pandas work, so it runs in the shared
+        resampling pool and leaves the event loop free for other symbols' downloads.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_resample_executor(),
+            partial(
+                self.resampling_workflow.resample_symbol_complete_workflow,
+                symbol=symbol,
+                source_timeframe=Timeframe.ONE_MIN.value,
+                target_timeframes=None,  # Use default configured timeframes
+                start_date=start_date,
+                end_date=end_date,
+                stop_on_error=False,
+            ),
+        )
+
+    def _should_resample(
+        self, one_min_status: DataUpdateStatus, enable_resampling: bool = True
+    ) -> bool:
+        """
+        Decide whether freshly downloaded 1-minute data gets resampled.
+
+        Args:
+            one_min_status: Status of the symbol's 1-minute download
+            enable_resampling: Whether the caller allows resampling
+
+        Returns:
+            True if auto resampling is on, allowed and new candles were stored
+        """
+        return (
+            self._auto_resample_enabled
+            and enable_resampling
+            and one_min_status.records_updated > 0
+        )
+
     async def update_symbol_data(
         self, symbol: str, force_validation: bool = True
     ) -> NightlyUpdateResult:
@@ -181,27 +355,21 @@ class StockMarketNightlyUpdateService:
             NightlyUpdateResult with detailed update information
         """
         try:
-            logger.info(f"Starting nightly update for {symbol}")
+            logger.debug("Starting nightly update for %s", symbol)
 
             # Determine update date range
             start_date, end_date = self.get_update_date_range(symbol)
 
             if start_date > end_date:
-                logger.info(f"{symbol} is up to date, no updates needed")
-                return NightlyUpdateResult(
-                    symbol=symbol,
-                    start_date=start_date,
-                    end_date=end_date,
-                    success=True,
-                    error_message="No updates needed - data is current",
-                )
+                logger.info("%s is up to date, no updates needed", symbol)
+                return NightlyUpdateResult.up_to_date(symbol, start_date, end_date)
 
-            logger.info(f"Updating {symbol} from {start_date} to {end_date}")
+            logger.info("Updating %s from %s to %s", symbol, start_date, end_date)
 
             # Step 1: Validate existing data if requested
             validation_results = []
             if force_validation and self.nightly_settings.enable_data_validation:
-                logger.info(f"Validating existing data for {symbol}")
+                logger.debug("Validating existing data for %s", symbol)
                 validation_results = self.validation_service.validate_symbol_data_range(
                     symbol, start_date, end_date
                 )
@@ -209,27 +377,22 @@ class StockMarketNightlyUpdateService:
                 invalid_days = [r for r in validation_results if not r.is_valid]
                 if invalid_days:
                     logger.warning(
-                        f"{symbol} has {len(invalid_days)} days with invalid data"
+                        "%s has %d days with invalid data", symbol, len(invalid_days)
                     )
 
             # Step 2: Update 1-minute data
-            logger.info(f"Updating 1-minute data for {symbol}")
-            update_statuses = await self.updating_service.update_symbol_data(
-                symbol=symbol,
-                timeframes=[Timeframe.ONE_MIN.value],
-                start_date=start_date,
-                end_date=end_date,
-                force_update=False,
+            logger.debug("Updating 1-minute data for %s", symbol)
+            update_statuses, one_min_status = await self._download_one_min_data(
+                symbol, start_date, end_date
             )
 
             # Check if 1-minute update was successful
-            one_min_status = update_statuses[0] if update_statuses else None
             if not one_min_status or not one_min_status.success:
                 error_msg = (
                     one_min_status.error_message if one_min_status else "Unknown error"
                 )
                 logger.error(
-                    f"Failed to update 1-minute data for {symbol}: {error_msg}"
+                    "Failed to update 1-minute data for %s: %s", symbol, error_msg
                 )
                 return NightlyUpdateResult(
                     symbol=symbol,
@@ -243,21 +406,11 @@ class StockMarketNightlyUpdateService:
 
             # Step 3: Resample to all target timeframes using workflow
             resampling_results = {}
-            if (
-                self.nightly_settings.enable_auto_resampling
-                and one_min_status.records_updated > 0
-            ):
-                logger.info(f"Resampling data for {symbol} to target timeframes")
-
-                workflow_result = (
-                    self.resampling_workflow.resample_symbol_complete_workflow(
-                        symbol=symbol,
-                        source_timeframe=Timeframe.ONE_MIN.value,
-                        target_timeframes=None,  # Use default configured timeframes
-                        start_date=start_date,
-                        end_date=end_date,
-                        stop_on_error=False,
-                    )
+            if self._should_resample(one_min_status):
+                logger.debug("Resampling data for %s to target timeframes", symbol)
+
+                workflow_result = await self._resample_one_min_data(
+                    symbol, start_date, end_date
                 )
 
                 resampling_results = workflow_result.results
@@ -265,11 +418,10 @@ class StockMarketNightlyUpdateService:
                 if workflow_result.errors:
                     for timeframe, error in workflow_result.errors.items():
                         logger.error(
-                            f"Failed to resample {symbol} to {timeframe}: {error}"
+                            "Failed to resample %s to %s: %s", symbol, timeframe, error
                         )
 
-            logger.info(f"Completed nightly update for {symbol}")
-            return NightlyUpdateResult(
+            result = NightlyUpdateResult(
                 symbol=symbol,
                 start_date=start_date,
                 end_date=end_date,
@@ -278,9 +430,16 @@ class StockMarketNightlyUpdateService:
                 update_statuses=update_statuses,
                 resampling_results=resampling_results,
             )
+            logger.info(
+                "Completed nightly update for %s: %d 1min candles, %d resampled candles",
+                symbol,
+                result.total_candles_updated,
+                result.total_resampled_candles,
+            )
+            return result
 
         except Exception as e:
-            logger.error(f"Nightly update failed for {symbol}: {e}")
+            logger.error("Nightly update failed for %s: %s", symbol, e)
             return NightlyUpdateResult(
                 symbol=symbol,
                 start_date=date.today(),
@@ -289,74 +448,93 @@ class StockMarketNightlyUpdateService:
                 error_message=f"Update failed: {str(e)}",
             )
 
-    async def update_multiple_symbols(
-        self, symbols: list[str] | None = None, max_concurrent: int | None = None
+    async def _run_symbol_updates(
+        self,
+        symbols: list[str],
+        update_symbol: Callable[[str], Awaitable[tuple[str, NightlyUpdateResult]]],
+        max_in_flight: int,
+        summary_label: str,
     ) -> dict[str, NightlyUpdateResult]:
         """
-        Update data for multiple symbols concurrently.
+        Run symbol updates in a task group and collect results as they finish.
+
+        Tasks are created only while fewer than max_in_flight are running, so
+        pending work stays proportional to the concurrency rather than to the
+        number of symbols. Summary totals are accumulated as each symbol completes.
 
         Args:
-            symbols: List of symbols to update (defaults to configured symbols)
-            max_concurrent: Maximum concurrent updates (defaults to configured value)
+            symbols: Symbols to update
+            update_symbol: Coroutine function returning (symbol, result)
+            max_in_flight: Maximum number of symbol tasks alive at once
+            summary_label: Prefix of the summary log message
 
         Returns:
-            Dictionary mapping symbol to NightlyUpdateResult
+            Dictionary mapping symbol to NightlyUpdateResult, in symbol order
         """
-        if symbols is None:
-            symbols = self.get_default_symbols()
+        completed: dict[str, NightlyUpdateResult] = {}
+        successful_updates = 0
+        total_candles = 0
+        total_resampled = 0
+        slots = asyncio.Semaphore(max_in_flight)
+
+        async def run_update(symbol: str) -> None:
+            nonlocal successful_updates, total_candles, total_resampled
+            try:
+                result_symbol, update_result = await update_symbol(symbol)
+            except Exception as e:
+                logger.error("Unexpected error during nightly update: %s", e)
+                return
+            finally:
+                slots.release()
+
+            completed[result_symbol] = update_result
+            successful_updates += update_result.success
+            total_candles += update_result.total_candles_updated
+            total_resampled += update_result.total_resampled_candles
+            logger.debug(
+                "%s finished (%d/%d symbols, %d successful)",
+                result_symbol,
+                len(completed),
+                len(symbols),
+                successful_updates,
+            )
 
-        if max_concurrent is None:
-            max_concurrent = self.nightly_settings.max_concurrent_symbols
+        async with asyncio.TaskGroup() as task_group:
+            for symbol in symbols:
+                await slots.acquire()
+                task_group.create_task(run_update(symbol))
 
         logger.info(
-            f"Starting nightly update for {len(symbols)} symbols "
-            f"with max_concurrent={max_concurrent}"
+            "%s: %d successful, %d failed, %d 1min candles, %d resampled candles",
+            summary_label,
+            successful_updates,
+            len(completed) - successful_updates,
+            total_candles,
+            total_resampled,
         )
 
-        # Create semaphore to limit concurrent updates
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def update_with_semaphore(symbol: str) -> tuple[str, NightlyUpdateResult]:
-            async with semaphore:
-                result = await self.update_symbol_data(symbol)
-                return symbol, result
-
-        # Execute updates concurrently
-        tasks = [update_with_semaphore(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        update_results: dict[str, NightlyUpdateResult] = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Unexpected error during nightly update: {result}")
-                continue
-
-            # result should be a tuple of (symbol, update_result)
-            if isinstance(result, tuple) and len(result) == 2:
-                symbol, update_result = result
-                update_results[symbol] = update_result
-            else:
-                logger.error(f"Unexpected result format: {result}")
+        # Report results in request order rather than completion order
+        return {symbol: completed[symbol] for symbol in symbols if symbol in completed}
 
-        # Log summary
-        successful_updates = sum(
-            1 for result in update_results.values() if result.success
-        )
-        failed_updates = len(update_results) - successful_updates
-        total_candles = sum(
-            result.total_candles_updated for result in update_results.values()
-        )
-        total_resampled = sum(
-            result.total_resampled_candles for result in update_results.values()
-        )
+    async def update_multiple_symbols(
+        self, symbols: list[str] | None = None, max_concurrent: int | None = None
+    ) -> dict[str, NightlyUpdateResult]:
+        """
+        Update data for multiple symbols concurrently.
 
-        logger.info(
-            f"Nightly update completed: {successful_updates} successful, {failed_updates} failed, "
-            f"{total_candles} 1min candles, {total_resampled} resampled candles"
-        )
+        Runs the same pipeline as update_multiple_symbols_with_progress, without
+        progress reporting.
 
-        return update_results
+        Args:
+            symbols: List of symbols to update (defaults to configured symbols)
+            max_concurrent: Maximum concurrent updates (defaults to configured value)
+
+        Returns:
+            Dictionary mapping symbol to NightlyUpdateResult
+        """
+        return await self.update_multiple_symbols_with_progress(
+            symbols=symbols, max_concurrent=max_concurrent
+        )
 
     async def update_multiple_symbols_with_progress(
         self,
@@ -394,22 +572,26 @@ class StockMarketNightlyUpdateService:
             max_concurrent = self.nightly_settings.max_concurrent_symbols
 
         logger.info(
-            f"Starting nightly update with progress tracking for {len(symbols)} symbols "
-            f"with max_concurrent={max_concurrent}"
+            "Starting nightly update with progress tracking for %d symbols "
+            "with max_concurrent=%d",
+            len(symbols),
+            max_concurrent,
         )
 
-        # Create semaphore to limit concurrent updates
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Downloads and resampling hold separate slots, so a symbol that moves on
+        # to resampling lets the next symbol start downloading
+        download_semaphore = asyncio.Semaphore(max_concurrent)
+        resample_semaphore = asyncio.Semaphore(max_concurrent)
 
         async def update_symbol_with_progress(
             symbol: str,
         ) -> tuple[str, NightlyUpdateResult]:
-            async with semaphore:
-                # Initialize dates to avoid unbound variable issues
-                start_date = date.today()
-                end_date = date.today()
+            # Initialize dates to avoid unbound variable issues
+            start_date = date.today()
+            end_date = date.today()
 
-                try:
+            try:
+                async with download_semaphore:
                     # Update progress: starting
                     if progress_callback and request_id:
                         progress_callback(
@@ -426,12 +608,8 @@ class StockMarketNightlyUpdateService:
                             progress_callback(
                                 symbol, "completed", 100.0, "No updates needed", None
                             )
-                        return symbol, NightlyUpdateResult(
-                            symbol=symbol,
-                            start_date=start_date,
-                            end_date=end_date,
-                            success=True,
-                            error_message="No updates needed - data is current",
+                        return symbol, NightlyUpdateResult.up_to_date(
+                            symbol, start_date, end_date
                         )
 
                     # Update progress: validation
@@ -452,6 +630,14 @@ class StockMarketNightlyUpdateService:
                             )
                         )
 
+                        invalid_days = [r for r in validation_results if not r.is_valid]
+                        if invalid_days:
+                            logger.warning(
+                                "%s has %d days with invalid data",
+                                symbol,
+                                len(invalid_days),
+                            )
+
                     # Update progress: downloading
                     if progress_callback and request_id:
                         progress_callback(
@@ -463,135 +649,103 @@ class StockMarketNightlyUpdateService:
                         )
 
                     # Update 1-minute data
-                    update_statuses = await self.updating_service.update_symbol_data(
-                        symbol=symbol,
-                        timeframes=[Timeframe.ONE_MIN.value],
-                        start_date=start_date,
-                        end_date=end_date,
-                        force_update=False,
+                    update_statuses, one_min_status = await self._download_one_min_data(
+                        symbol, start_date, end_date, provider_client
                     )
 
-                    # Check if 1-minute update was successful
-                    one_min_status = update_statuses[0] if update_statuses else None
-                    if not one_min_status or not one_min_status.success:
-                        error_msg = (
-                            one_min_status.error_message
-                            if one_min_status
-                            else "Unknown error"
-                        )
-                        if progress_callback and request_id:
-                            progress_callback(
-                                symbol,
-                                "failed",
-                                100.0,
-                                "Failed to download data",
-                                error_msg,
-                            )
-                        return symbol, NightlyUpdateResult(
-                            symbol=symbol,
-                            start_date=start_date,
-                            end_date=end_date,
-                            success=False,
-                            validation_results=validation_results,
-                            update_statuses=update_statuses,
-                            error_message=f"1-minute data update failed: {error_msg}",
-                        )
-
-                    # Update progress: resampling
-                    resampling_results = {}
-                    if (
-                        self.nightly_settings.enable_auto_resampling
-                        and enable_resampling
-                        and one_min_status.records_updated > 0
-                    ):
-                        if progress_callback and request_id:
-                            progress_callback(
-                                symbol,
-                                "resampling",
-                                70.0,
-                                "Resampling to other timeframes",
-                                None,
-                            )
-
-                        workflow_result = (
-                            self.resampling_workflow.resample_symbol_complete_workflow(
-                                symbol=symbol,
-                                source_timeframe=Timeframe.ONE_MIN.value,
-                                target_timeframes=None,
-                                start_date=start_date,
-                                end_date=end_date,
-                                stop_on_error=False,
-                            )
-                        )
-                        resampling_results = workflow_result.results
-
-                    # Update progress: completed
+                # Check if 1-minute update was successful
+                if not one_min_status or not one_min_status.success:
+                    error_msg = (
+                        one_min_status.error_message
+                        if one_min_status
+                        else "Unknown error"
+                    )
                     if progress_callback and request_id:
                         progress_callback(
-                            symbol, "completed", 100.0, "Processing completed", None
+                            symbol,
+                            "failed",
+                            100.0,
+                            "Failed to download data",
+                            error_msg,
                         )
-
                     return symbol, NightlyUpdateResult(
                         symbol=symbol,
                         start_date=start_date,
                         end_date=end_date,
-                        success=True,
+                        success=False,
                         validation_results=validation_results,
                         update_statuses=update_statuses,
-                        resampling_results=resampling_results,
+                        error_message=f"1-minute data update failed: {error_msg}",
                     )
 
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.error(f"Failed to update {symbol}: {error_msg}")
+                # Update progress: resampling
+                resampling_results = {}
+                if self._should_resample(one_min_status, enable_resampling):
                     if progress_callback and request_id:
                         progress_callback(
-                            symbol, "failed", 100.0, "Processing failed", error_msg
+                            symbol,
+                            "resampling",
+                            70.0,
+                            "Resampling to other timeframes",
+                            None,
                         )
-                    return symbol, NightlyUpdateResult(
-                        symbol=symbol,
-                        start_date=start_date,
-                        end_date=end_date,
-                        success=False,
-                        error_message=error_msg,
-                    )
 
-        # Execute updates concurrently
-        tasks = [update_symbol_with_progress(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+                    async with resample_semaphore:
+                        workflow_result = await self._resample_one_min_data(
+                            symbol, start_date, end_date
+                        )
+                    resampling_results = workflow_result.results
 
-        # Process results
-        update_results: dict[str, NightlyUpdateResult] = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Unexpected error during nightly update: {result}")
-                continue
+                    if workflow_result.errors:
+                        for timeframe, error in workflow_result.errors.items():
+                            logger.error(
+                                "Failed to resample %s to %s: %s",
+                                symbol,
+                                timeframe,
+                                error,
+                            )
 
-            if isinstance(result, tuple) and len(result) == 2:
-                symbol, update_result = result
-                update_results[symbol] = update_result
-            else:
-                logger.error(f"Unexpected result format: {result}")
+                # Update progress: completed
+                if progress_callback and request_id:
+                    progress_callback(
+                        symbol, "completed", 100.0, "Processing completed", None
+                    )
 
-        # Log summary
-        successful_updates = sum(
-            1 for result in update_results.values() if result.success
-        )
-        failed_updates = len(update_results) - successful_updates
-        total_candles = sum(
-            result.total_candles_updated for result in update_results.values()
-        )
-        total_resampled = sum(
-            result.total_resampled_candles for result in update_results.values()
-        )
+                return symbol, NightlyUpdateResult(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    success=True,
+                    validation_results=validation_results,
+                    update_statuses=update_statuses,
+                    resampling_results=resampling_results,
+                )
 
-        logger.info(
-            f"Nightly update with progress completed: {successful_updates} successful, "
-            f"{failed_updates} failed, {total_candles} 1min candles, {total_resampled} \
-                resampled candles"
-        )
+            except Exception as e:
+                error_msg = str(e)
+                logger.error("Failed to update %s: %s", symbol, error_msg)
+                if progress_callback and request_id:
+                    progress_callback(
+                        symbol, "failed", 100.0, "Processing failed", error_msg
+                    )
+                return symbol, NightlyUpdateResult(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    success=False,
+                    error_message=error_msg,
+                )
 
-        return update_results
+        # One provider client for the whole run, so every symbol's download
+        # reuses its connections and shares its rate limiter
+        async with self.updating_service.open_provider_client() as provider_client:
+            # Room for a full set of downloads plus a full set of resamples
+            return await self._run_symbol_updates(
+                symbols,
+                update_symbol_with_progress,
+                2 * max_concurrent,
+                "Nightly update with progress completed",
+            )
 
     async def execute_nightly_update(
         self,
@@ -623,27 +777,14 @@ class StockMarketNightlyUpdateService:
 
             start_time = datetime.now()
 
-            # Execute the update with progress tracking using the service method
-            def progress_callback(
-                symbol: str,
-                status: str,
-                progress_percentage: float,
-                current_step: str,
-                error_message: str | None,
-            ) -> None:
-                progress_service.update_symbol_progress(
-                    request_id,
-                    symbol,
-                    status,
-                    progress_percentage,
-                    current_step,
-                    error_message,
-                )
-
+            # Progress updates are in-memory writes, so they are applied inline;
+            # the callback is the bound service method with the request bound
             results = await self.update_multiple_symbols_with_progress(
                 symbols=request.symbols,
                 max_concurrent=request.max_concurrent,
-                progress_callback=progress_callback,
+                progress_callback=partial(
+                    progress_service.update_symbol_progress, request_id
+                ),
                 request_id=request_id,
                 custom_start_date=request.start_date,
                 custom_end_date=request.end_date,
@@ -654,82 +795,86 @@ class StockMarketNightlyUpdateService:
             end_time = datetime.now()
             duration = (end_time - start_time).total_seconds()
 
-            # Convert results to API models
+            # Convert results to API models, accumulating the run summary in the
+            # same pass
             symbol_results: dict[str, SymbolUpdateResult] = {}
+            successful_updates = 0
+            total_candles = 0
+            total_resampled = 0
+            resampling_summary: Counter[str] = Counter()
+            earliest_start_date = None
+            latest_end_date = None
+            symbols_with_validation_errors = 0
+            total_validation_errors = 0
             for symbol, result in results.items():
                 # Convert validation results
                 validation_models: list[ValidationResultModel] = []
+                valid_days = 0
+                total_errors = 0
+                total_warnings = 0
                 for val_result in result.validation_results:
+                    # Validation results are built internally with the right
+                    # types, so they skip pydantic's validators
                     validation_models.append(
-                        ValidationResultModel(
+                        ValidationResultModel.model_construct(
                             symbol=val_result.symbol,
                             validation_date=val_result.validation_date,
                             is_valid=val_result.is_valid,
                             expected_candles=val_result.expected_candles,
                             actual_candles=val_result.actual_candles,
-                            missing_periods=[
-                                f"{start} to {end}"
-                                for start, end in val_result.missing_periods
-                            ],
+                            missing_periods=val_result.formatted_missing_periods(),
                             errors=val_result.errors,
                             warnings=val_result.warnings,
                         )
                     )
+                    valid_days += val_result.is_valid
+                    total_errors += len(val_result.errors)
+                    total_warnings += len(val_result.warnings)
 
                 # Create validation summary
+                invalid_days = len(validation_models) - valid_days
                 validation_summary = {
                     "total_validations": len(validation_models),
-                    "valid_days": sum(1 for v in validation_models if v.is_valid),
-                    "invalid_days": sum(1 for v in validation_models if not v.is_valid),
-                    "total_errors": sum(len(v.errors) for v in validation_models),
-                    "total_warnings": sum(len(v.warnings) for v in validation_models),
+                    "valid_days": valid_days,
+                    "invalid_days": invalid_days,
+                    "total_errors": total_errors,
+                    "total_warnings": total_warnings,
                 }
 
+                candles_updated = result.total_candles_updated
+                resampled_candles = result.total_resampled_candles
                 symbol_results[symbol] = SymbolUpdateResult(
                     symbol=result.symbol,
                     start_date=result.start_date,
                     end_date=result.end_date,
                     success=result.success,
-                    candles_updated=result.total_candles_updated,
+                    candles_updated=candles_updated,
                     update_duration_seconds=None,  # Individual symbol duration not tracked
                     validation_results=validation_models,
                     validation_summary=validation_summary,
                     resampling_results=result.resampling_results,
-                    total_resampled_candles=result.total_resampled_candles,
+                    total_resampled_candles=resampled_candles,
                     error_message=result.error_message,
                 )
 
-            # Create summary
-            successful_updates = sum(1 for r in results.values() if r.success)
-            failed_updates = len(results) - successful_updates
-            total_candles = sum(r.total_candles_updated for r in results.values())
-            total_resampled = sum(r.total_resampled_candles for r in results.values())
-
-            # Calculate resampling summary
-            resampling_summary: dict[str, int] = {}
-            for result in results.values():
-                for timeframe, count in result.resampling_results.items():
-                    resampling_summary[timeframe] = (
-                        resampling_summary.get(timeframe, 0) + count
-                    )
+                successful_updates += result.success
+                total_candles += candles_updated
+                total_resampled += resampled_candles
 
-            # Calculate date range across all symbols
-            earliest_start_date = None
-            latest_end_date = None
-            if results:
-                earliest_start_date = min(r.start_date for r in results.values())
-                latest_end_date = max(r.end_date for r in results.values())
-
-            # Calculate validation statistics
-            symbols_with_validation_errors = sum(
-                1
-                for r in results.values()
-                if any(not val.is_valid for val in r.validation_results)
-            )
-            total_validation_errors = sum(
-                sum(len(val.errors) for val in r.validation_results)
-                for r in results.values()
-            )
+                # Calculate resampling summary
+                resampling_summary.update(result.resampling_results)
+
+                # Calculate date range across all symbols
+                if earliest_start_date is None or result.start_date < earliest_start_date:
+                    earliest_start_date = result.start_date
+                if latest_end_date is None or result.end_date > latest_end_date:
+                    latest_end_date = result.end_date
+
+                # Calculate validation statistics
+                symbols_with_validation_errors += invalid_days > 0
+                total_validation_errors += total_errors
+
+            failed_updates = len(results) - successful_updates
 
             summary = NightlyUpdateSummary(
                 total_symbols=len(results),
@@ -742,7 +887,7 @@ class StockMarketNightlyUpdateService:
                 latest_end_date=latest_end_date,
                 symbols_with_validation_errors=symbols_with_validation_errors,
                 total_validation_errors=total_validation_errors,
-                resampling_summary=resampling_summary,
+                resampling_summary=dict(resampling_summary),
             )
 
             # Create response
@@ -768,12 +913,14 @@ class StockMarketNightlyUpdateService:
             # In production, you might want to clean this up after some time
 
             logger.info(
-                f"Nightly update {request_id} completed: {successful_updates} successful, "
-                f"{failed_updates} failed"
+                "Nightly update %s completed: %d successful, %d failed",
+                request_id,
+                successful_updates,
+                failed_updates,
             )
 
         except Exception as e:
-            logger.error(f"Nightly update {request_id} failed: {e}")
+            logger.error("Nightly update %s failed: %s", request_id, e)
 
             # Update status with error
             active_update = progress_service.get_active_update(request_id)
@@ -6,9 +6,18 @@ ensuring all timeframes are properly generated with correct market session align
 """
 
 import logging
+import logging.handlers
+import multiprocessing
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import date
+from functools import partial
+from multiprocessing.queues import Queue
 from typing import Any, override
 
+import pandas as pd
 from simutrador_core.models.price_data import Timeframe
 
 from core.settings import get_settings
@@ -20,6 +29,10 @@ from ..storage.data_resampling_service import (
 
 logger = logging.getLogger(__name__)
 
+# Workers start from a fresh interpreter rather than a fork of a parent that
+# may have threads (event loop, thread pools) running
+WORKER_START_METHOD = "spawn"
+
 
 class ResamplingWorkflowResult:
     """Result of a complete resampling workflow."""
@@ -79,7 +92,7 @@ class StockMarketResamplingWorkflow:
         self.resampling_service = DataResamplingService()
 
         # Define the standard resampling order (from shortest to longest)
-        self.standard_timeframe_order = [
+        self.standard_timeframe_order = (
             Timeframe.FIVE_MIN.value,  # 5min
             Timeframe.FIFTEEN_MIN.value,  # 15min
             Timeframe.THIRTY_MIN.value,  # 30min
@@ -87,7 +100,17 @@ class StockMarketResamplingWorkflow:
             Timeframe.TWO_HOUR.value,  # 2h
             Timeframe.FOUR_HOUR.value,  # 4h
             Timeframe.DAILY.value,  # daily
-        ]
+        )
+
+        # Configured target timeframes don't change per process, order them once
+        self._configured_timeframes = self._order_timeframes(
+            self.nightly_settings.target_timeframes
+        )
+
+    def _order_timeframes(self, timeframes: list[str]) -> list[str]:
+        """Keep the standard timeframes present in timeframes, in resampling order."""
+        wanted = frozenset(timeframes)
+        return [tf for tf in self.standard_timeframe_order if tf in wanted]
 
     def get_target_timeframes(
         self, custom_timeframes: list[str] | None = None
@@ -103,19 +126,37 @@ class StockMarketResamplingWorkflow:
         """
         if custom_timeframes is not None:
             # Filter and order custom timeframes
-            ordered_timeframes: list[str] = []
-            for tf in self.standard_timeframe_order:
-                if tf in custom_timeframes:
-                    ordered_timeframes.append(tf)
-            return ordered_timeframes
-        else:
-            # Use configured target timeframes
-            configured_timeframes = self.nightly_settings.target_timeframes
-            ordered_timeframes = []
-            for tf in self.standard_timeframe_order:
-                if tf in configured_timeframes:
-                    ordered_timeframes.append(tf)
-            return ordered_timeframes
+            return self._order_timeframes(custom_timeframes)
+        # Use configured target timeframes (a copy, callers may keep the list)
+        return list(self._configured_timeframes)
+
+    def _chain_source_timeframe(
+        self, symbol: str, target_timeframe: str, frames: dict[str, pd.DataFrame]
+    ) -> str:
+        """
+        Pick the timeframe a target is resampled from.
+
+        Args:
+            symbol: Trading symbol being resampled
+            target_timeframe: Timeframe to build next
+            frames: Frames available so far, source timeframe first
+
+        Returns:
+            Longest available timeframe whose buckets nest into the target's,
+            or the source timeframe
+        """
+        source_timeframe = next(iter(frames))
+        if not self.nightly_settings.hierarchical_resampling:
+            return source_timeframe
+
+        for timeframe in reversed(frames):
+            if timeframe == source_timeframe:
+                break
+            if self.resampling_service.can_resample_from(
+                symbol, timeframe, target_timeframe
+            ):
+                return timeframe
+        return source_timeframe
 
     def resample_symbol_complete_workflow(
         self,
@@ -151,52 +192,81 @@ class StockMarketResamplingWorkflow:
         results: dict[str, int] = {}
         errors: dict[str, str] = {}
 
-        for target_timeframe in target_timeframes:
-            try:
-                logger.info(
-                    f"Resampling {symbol} from {source_timeframe} to {target_timeframe}"
-                )
-
-                candles_created = self.resampling_service.resample_and_store(
-                    symbol=symbol,
-                    from_timeframe=source_timeframe,
-                    to_timeframe=target_timeframe,
-                    start_date=start_date,
-                    end_date=end_date,
-                )
-
-                results[target_timeframe] = candles_created
-                logger.info(
-                    f"Successfully created {candles_created} {target_timeframe} candles "
-                    f"for {symbol}"
-                )
-
-            except DataResamplingError as e:
-                error_msg = str(e)
-                errors[target_timeframe] = error_msg
-                logger.error(
-                    f"Failed to resample {symbol} to {target_timeframe}: {error_msg}"
-                )
+        # Every target is resampled from the same source data, so it is read
+        # from storage and converted to a DataFrame once per symbol
+        try:
+            source_df = self.resampling_service.load_source_frame(
+                symbol=symbol,
+                timeframe=source_timeframe,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        except DataResamplingError as e:
+            error_msg = str(e)
+            logger.error(f"Failed to load source data for {symbol}: {error_msg}")
+            # Every target fails on the same load
+            failed_timeframes = target_timeframes[:1] if stop_on_error else target_timeframes
+            errors = dict.fromkeys(failed_timeframes, error_msg)
+        else:
+            # Frames resampled so far, shortest first; longer targets are built
+            # from the longest one whose buckets nest into theirs
+            frames = {source_timeframe: source_df}
+            for target_timeframe in target_timeframes:
+                try:
+                    from_timeframe = self._chain_source_timeframe(
+                        symbol, target_timeframe, frames
+                    )
+                    logger.info(
+                        "Resampling %s from %s to %s",
+                        symbol,
+                        from_timeframe,
+                        target_timeframe,
+                    )
 
-                if stop_on_error:
-                    logger.warning(
-                        f"Stopping resampling workflow for {symbol} due to error "
-                        f"in {target_timeframe}"
+                    candles_created, resampled_df = (
+                        self.resampling_service.resample_frame_and_store(
+                            symbol=symbol,
+                            source_df=frames[from_timeframe],
+                            from_timeframe=from_timeframe,
+                            to_timeframe=target_timeframe,
+                        )
+                    )
+                    frames[target_timeframe] = resampled_df
+
+                    results[target_timeframe] = candles_created
+                    logger.info(
+                        "Successfully created %d %s candles for %s",
+                        candles_created,
+                        target_timeframe,
+                        symbol,
                     )
-                    break
 
-            except Exception as e:
-                error_msg = f"Unexpected error: {str(e)}"
-                errors[target_timeframe] = error_msg
-                logger.error(
-                    f"Unexpected error resampling {symbol} to {target_timeframe}: {error_msg}"
-                )
+                except DataResamplingError as e:
+                    error_msg = str(e)
+                    errors[target_timeframe] = error_msg
+                    logger.error(
+                        f"Failed to resample {symbol} to {target_timeframe}: {error_msg}"
+                    )
 
-                if stop_on_error:
-                    logger.warning(
-                        f"Stopping resampling workflow for {symbol} due to unexpected error"
+                    if stop_on_error:
+                        logger.warning(
+                            f"Stopping resampling workflow for {symbol} due to error "
+                            f"in {target_timeframe}"
+                        )
+                        break
+
+                except Exception as e:
+                    error_msg = f"Unexpected error: {str(e)}"
+                    errors[target_timeframe] = error_msg
+                    logger.error(
+                        f"Unexpected error resampling {symbol} to {target_timeframe}: {error_msg}"
                     )
-                    break
+
+                    if stop_on_error:
+                        logger.warning(
+                            f"Stopping resampling workflow for {symbol} due to unexpected error"
+                        )
+                        break
 
         # Determine overall success
         success = not errors
@@ -210,7 +280,7 @@ class StockMarketResamplingWorkflow:
             errors=errors,
         )
 
-        logger.info(f"Completed resampling workflow for {symbol}: {workflow_result}")
+        logger.info("Completed resampling workflow for %s: %s", symbol, workflow_result)
         return workflow_result
 
     def resample_multiple_symbols_complete_workflow(
@@ -246,42 +316,75 @@ class StockMarketResamplingWorkflow:
 
         workflow_results: dict[str, ResamplingWorkflowResult] = {}
 
-        for symbol in symbols:
-            try:
-                result = self.resample_symbol_complete_workflow(
-                    symbol=symbol,
-                    source_timeframe=source_timeframe,
-                    target_timeframes=target_timeframes,
-                    start_date=start_date,
-                    end_date=end_date,
-                    stop_on_error=False,  # Don't stop on timeframe errors within a symbol
+        resample_args = (source_timeframe, target_timeframes, start_date, end_date)
+        max_workers = min(self.nightly_settings.max_concurrent_symbols, len(symbols))
+        with ExitStack() as stack:
+            outcomes: Iterator[Callable[[], ResamplingWorkflowResult]]
+            if max_workers > 1:
+                # Symbols are independent CPU-bound pandas work, so they run in
+                # worker processes; results are still collected in symbol order.
+                # Each worker gets a copy of this workflow, so its settings and
+                # services apply exactly as they do in-process. Worker log
+                # records are sent back and handled by this process's loggers.
+                mp_context = multiprocessing.get_context(WORKER_START_METHOD)
+                log_queue: Queue[logging.LogRecord] = mp_context.Queue()
+                log_listener = logging.handlers.QueueListener(
+                    log_queue, _WorkerLogHandler()
                 )
-
-                workflow_results[symbol] = result
-
-                if not result.success and stop_on_symbol_error:
-                    logger.warning(
-                        f"Stopping multi-symbol workflow due to errors in {symbol}"
+                log_listener.start()
+                # Registered first, so it drains the queue after the pool exits
+                stack.callback(log_listener.stop)
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        mp_context=mp_context,
+                        initializer=_init_worker,
+                        initargs=(self, log_queue, _logger_levels()),
                     )
-                    break
-
-            except Exception as e:
-                logger.error(f"Failed to process resampling workflow for {symbol}: {e}")
-
-                # Create error result
-                workflow_results[symbol] = ResamplingWorkflowResult(
-                    symbol=symbol,
-                    source_timeframe=source_timeframe,
-                    target_timeframes=target_timeframes,
-                    success=False,
-                    errors={"workflow": f"Workflow failed: {str(e)}"},
+                )
+                futures = [
+                    executor.submit(_resample_symbol_in_worker, symbol, *resample_args)
+                    for symbol in symbols
+                ]
+                # Drop symbols not started yet when stopping early
+                stack.callback(executor.shutdown, cancel_futures=True)
+                outcomes = (future.result for future in futures)
+            else:
+                outcomes = (
+                    partial(self.resample_symbol_complete_workflow, symbol, *resample_args)
+                    for symbol in symbols
                 )
 
-                if stop_on_symbol_error:
-                    logger.warning(
-                        f"Stopping multi-symbol workflow due to workflow error in {symbol}"
+            for symbol, outcome in zip(symbols, outcomes, strict=True):
+                try:
+                    # Don't stop on timeframe errors within a symbol
+                    result = outcome()
+
+                    workflow_results[symbol] = result
+
+                    if not result.success and stop_on_symbol_error:
+                        logger.warning(
+                            f"Stopping multi-symbol workflow due to errors in {symbol}"
+                        )
+                        break
+
+                except Exception as e:
+                    logger.error(f"Failed to process resampling workflow for {symbol}: {e}")
+
+                    # Create error result
+                    workflow_results[symbol] = ResamplingWorkflowResult(
+                        symbol=symbol,
+                        source_timeframe=source_timeframe,
+                        target_timeframes=target_timeframes,
+                        success=False,
+                        errors={"workflow": f"Workflow failed: {str(e)}"},
                     )
-                    break
+
+                    if stop_on_symbol_error:
+                        logger.warning(
+                            f"Stopping multi-symbol workflow due to workflow error in {symbol}"
+                        )
+                        break
 
         # Log summary
         successful_symbols = sum(
@@ -321,37 +424,26 @@ class StockMarketResamplingWorkflow:
                 "error_summary": {},
             }
 
-        successful_symbols = sum(
-            1 for result in workflow_results.values() if result.success
-        )
-        failed_symbols = len(workflow_results) - successful_symbols
-        total_candles = sum(
-            result.total_candles_created for result in workflow_results.values()
-        )
-
-        # Summarize by timeframe
-        timeframe_summary: dict[str, int] = {}
-        for result in workflow_results.values():
-            for timeframe, count in result.results.items():
-                timeframe_summary[timeframe] = (
-                    timeframe_summary.get(timeframe, 0) + count
-                )
-
-        # Summarize errors
-        error_summary: dict[str, list[str]] = {}
+        # One pass over the results for every aggregate
+        successful_symbols = 0
+        timeframe_summary: Counter[str] = Counter()
+        error_summary: defaultdict[str, list[str]] = defaultdict(list)
         for result in workflow_results.values():
+            successful_symbols += result.success
+            timeframe_summary.update(result.results)
             for timeframe, error in result.errors.items():
-                if timeframe not in error_summary:
-                    error_summary[timeframe] = []
                 error_summary[timeframe].append(f"{result.symbol}: {error}")
 
+        failed_symbols = len(workflow_results) - successful_symbols
+        total_candles = timeframe_summary.total()
+
         return {
             "total_symbols": len(workflow_results),
             "successful_symbols": successful_symbols,
             "failed_symbols": failed_symbols,
             "total_candles_created": total_candles,
-            "timeframe_summary": timeframe_summary,
-            "error_summary": error_summary,
+            "timeframe_summary": dict(timeframe_summary),
+            "error_summary": dict(error_summary),
         }
 
     def resample_daily_background(
@@ -399,3 +491,56 @@ class StockMarketResamplingWorkflow:
             logger.error(f"Background daily resampling failed: {e}")
             # Return empty results on failure to maintain consistent return type
             return dict.fromkeys(symbols, 0)
+
+
+class _WorkerLogHandler(logging.Handler):
+    """Hand log records from worker processes to this process's loggers."""
+
+    @override
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _logger_levels() -> dict[str, int]:
+    """Get the explicitly set log levels of this process, root logger as ""."""
+    levels = {"": logging.getLogger().level}
+    for name, item in logging.Logger.manager.loggerDict.items():
+        if isinstance(item, logging.Logger) and item.level != logging.NOTSET:
+            levels[name] = item.level
+    return levels
+
+
+# Workflow of a pool worker process, installed by _init_worker
+_worker_workflow: StockMarketResamplingWorkflow
+
+
+def _init_worker(
+    workflow: StockMarketResamplingWorkflow,
+    log_queue: Queue[logging.LogRecord],
+    log_levels: dict[str, int],
+) -> None:
+    """
+    Install the parent's workflow in a new worker process.
+
+    Logging mirrors the parent's levels, and every record is queued back to the
+    parent instead of going to the worker's unconfigured handlers.
+    """
+    global _worker_workflow
+    _worker_workflow = workflow
+
+    logging.getLogger().handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    for name, level in log_levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+def _resample_symbol_in_worker(
+    symbol: str,
+    source_timeframe: str,
+    target_timeframes: list[str],
+    start_date: date | None,
+    end_date: date | None,
+) -> ResamplingWorkflowResult:
+    """Run one symbol's complete resampling workflow in a worker process."""
+    return _worker_workflow.resample_symbol_complete_workflow(
+        symbol, source_timeframe, target_timeframes, start_date, end_date
+    )
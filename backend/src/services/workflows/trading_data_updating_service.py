@@ -8,9 +8,11 @@ This service orchestrates the fetching and storing of trading data:
 - Provides status tracking and error handling
 """
 
+import asyncio
+from contextlib import nullcontext
 from datetime import date, datetime, timedelta
 
-from simutrador_core.models.price_data import DataUpdateStatus
+from simutrador_core.models.price_data import DataUpdateStatus, PriceDataSeries
 from simutrador_core.utils import get_default_logger
 
 from ..data_providers.data_provider_factory import (
@@ -23,7 +25,7 @@ from ..data_providers.data_provider_interface import (
     DataProviderInterface,
     RateLimitError,
 )
-from ..storage.data_storage_service import DataStorageService
+from ..storage.data_storage_service import DataStorageError, DataStorageService
 
 logger = get_default_logger("trading_data_updating")
 
@@ -44,6 +46,15 @@ class TradingDataUpdatingService:
         self.storage_service = DataStorageService()
         self.provider_type = provider_type
 
+    def open_provider_client(self) -> DataProviderInterface:
+        """
+        Create a provider client to share across several update_symbol_data calls.
+
+        Use it as an async context manager; every call made with it shares one
+        connection pool and one rate limiter.
+        """
+        return DataProviderFactory.create_provider(self.provider_type)
+
     async def update_symbol_data(
         self,
         symbol: str,
@@ -51,6 +62,7 @@ class TradingDataUpdatingService:
         start_date: date | None = None,
         end_date: date | None = None,
         force_update: bool = False,
+        client: DataProviderInterface | None = None,
     ) -> list[DataUpdateStatus]:
         """
         Update data for a single symbol.
@@ -61,6 +73,8 @@ class TradingDataUpdatingService:
             start_date: Optional start date (defaults to last update date)
             end_date: Optional end date (defaults to today)
             force_update: If True, re-fetch all data regardless of existing data
+            client: Optional open provider client from open_provider_client; a
+                new client is opened and closed for this call when omitted
 
         Returns:
             List of DataUpdateStatus objects for each timeframe
@@ -71,88 +85,153 @@ class TradingDataUpdatingService:
         if end_date is None:
             end_date = date.today()
 
-        results: list[DataUpdateStatus] = []
-
-        async with DataProviderFactory.create_provider(self.provider_type) as client:
-            for timeframe in timeframes:
-                try:
-                    result = await self._update_symbol_timeframe(
-                        client, symbol, timeframe, start_date, end_date, force_update
-                    )
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to update {symbol} {timeframe}: {e}")
-                    results.append(
-                        DataUpdateStatus(
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            last_update=datetime.now(),
-                            records_updated=0,
-                            success=False,
-                            error_message=str(e),
-                        )
-                    )
-
-        return results
+        # Every timeframe of this call reports the same update time
+        updated_at = datetime.now()
 
-    async def _update_symbol_timeframe(
+        async def update_timeframe(
+            provider: DataProviderInterface, timeframe: str
+        ) -> DataUpdateStatus:
+            try:
+                return await self._update_symbol_timeframe(
+                    provider,
+                    symbol,
+                    timeframe,
+                    start_dates[timeframe],
+                    end_date,
+                    updated_at,
+                )
+            except Exception as e:
+                logger.error(f"Failed to update {symbol} {timeframe}: {e}")
+                return DataUpdateStatus(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    last_update=updated_at,
+                    records_updated=0,
+                    success=False,
+                    error_message=str(e),
+                )
+
+        # Resolve every timeframe's fetch range first, so a symbol that is
+        # already up to date never opens a provider client
+        start_dates = {
+            timeframe: self._fetch_start_date(
+                symbol, timeframe, start_date, end_date, force_update
+            )
+            for timeframe in timeframes
+        }
+        statuses = {
+            timeframe: self._up_to_date_status(symbol, timeframe, updated_at)
+            for timeframe, fetch_start in start_dates.items()
+            if fetch_start > end_date
+        }
+        stale_timeframes = [tf for tf in timeframes if tf not in statuses]
+        if stale_timeframes:
+            async with (
+                nullcontext(client)
+                if client is not None
+                else self.open_provider_client()
+            ) as client:
+                # Timeframes are independent downloads; the client's rate
+                # limiter paces their requests, so they are fetched concurrently
+                results = await asyncio.gather(
+                    *(update_timeframe(client, tf) for tf in stale_timeframes)
+                )
+            statuses.update(zip(stale_timeframes, results, strict=True))
+
+        return [statuses[timeframe] for timeframe in timeframes]
+
+    def _fetch_start_date(
         self,
-        client: DataProviderInterface,
         symbol: str,
         timeframe: str,
         start_date: date | None,
         end_date: date,
         force_update: bool,
+    ) -> date:
+        """
+        Get the first date to fetch for a symbol and timeframe.
+
+        An explicit start_date wins; otherwise fetching resumes the day after the
+        last stored candle, or covers the last 30 days when nothing is stored or
+        force_update is set. A result after end_date means nothing to fetch.
+        """
+        if start_date is not None:
+            return start_date
+        if not force_update:
+            last_update = self.storage_service.get_last_update_date(symbol, timeframe)
+            if last_update:
+                # Start from the day after the last update
+                return (last_update + timedelta(days=1)).date()
+        # No existing data (or a forced update), start from a reasonable default
+        return end_date - timedelta(days=30)  # Last 30 days
+
+    def _up_to_date_status(
+        self, symbol: str, timeframe: str, updated_at: datetime
+    ) -> DataUpdateStatus:
+        """Build the status of a timeframe that has no new data to fetch."""
+        logger.info(
+            f"No new data to fetch for {symbol} {timeframe} (already up to date)"
+        )
+        return DataUpdateStatus(
+            symbol=symbol,
+            timeframe=timeframe,
+            last_update=updated_at,
+            records_updated=0,
+            success=True,
+            error_message=None,
+        )
+
+    async def _update_symbol_timeframe(
+        self,
+        client: DataProviderInterface,
+        symbol: str,
+        timeframe: str,
+        start_date: date,
+        end_date: date,
+        updated_at: datetime,
     ) -> DataUpdateStatus:
-        """Update data for a specific symbol and timeframe."""
+        """
+        Update data for a specific symbol and timeframe.
+
+        start_date comes from _fetch_start_date and is not after end_date;
+        updated_at is the update time reported in the returned status. Batches
+        are stored as they arrive, so a failed status still reports the records
+        that earlier batches wrote.
+        """
         logger.info(f"Updating {symbol} {timeframe} data")
 
-        try:
-            # Determine the date range to fetch
-            if not force_update and start_date is None:
-                last_update = self.storage_service.get_last_update_date(
-                    symbol, timeframe
-                )
-                if last_update:
-                    # Start from the day after the last update
-                    start_date = (last_update + timedelta(days=1)).date()
-                else:
-                    # No existing data, start from a reasonable default
-                    start_date = end_date - timedelta(days=30)  # Last 30 days
-            elif start_date is None:
-                # Force update but no start date specified
-                start_date = end_date - timedelta(days=30)
-
-            # Skip if start_date is after end_date
-            if start_date and start_date > end_date:
-                logger.info(
-                    f"No new data to fetch for {symbol} {timeframe} (already up to date)"
-                )
-                return DataUpdateStatus(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    last_update=datetime.now(),
-                    records_updated=0,
-                    success=True,
-                    error_message=None,
-                )
+        async def store_batch(series: PriceDataSeries) -> int:
+            await asyncio.to_thread(self.storage_service.store_data, series)
+            return len(series.candles)
 
-            # Fetch data from API
+        # Records of the batches whose store has completed
+        records_updated = 0
+        try:
+            # Fetch data from API in the provider's batches; each batch is
+            # stored in a worker thread while the next one downloads
             logger.info(
                 f"Fetching {symbol} {timeframe} data from {start_date} to {end_date}"
             )
-            series = await client.fetch_historical_data(
-                symbol=symbol,
-                timeframe=timeframe,
-                from_date=start_date,
-                to_date=end_date,
-            )
+            store_task: asyncio.Task[int] | None = None
+            try:
+                async for series in client.iter_historical_data(
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    from_date=start_date,
+                    to_date=end_date,
+                ):
+                    if not series.candles:
+                        continue
+                    if store_task is not None:
+                        records_updated += await store_task
+                    store_task = asyncio.create_task(store_batch(series))
+            finally:
+                if store_task is not None:
+                    records_updated += await store_task
 
-            # Store the data
-            if series.candles:
-                self.storage_service.store_data(series)
+            if records_updated:
                 logger.info(
-                    f"Successfully updated {len(series.candles)} records for {symbol} {timeframe}"
+                    f"Successfully updated {records_updated} records for {symbol} {timeframe}"
                 )
             else:
                 logger.warning(f"No data received for {symbol} {timeframe}")
@@ -160,8 +239,8 @@ class TradingDataUpdatingService:
             return DataUpdateStatus(
                 symbol=symbol,
                 timeframe=timeframe,
-                last_update=datetime.now(),
-                records_updated=len(series.candles),
+                last_update=updated_at,
+                records_updated=records_updated,
                 success=True,
                 error_message=None,
             )
@@ -171,8 +250,8 @@ class TradingDataUpdatingService:
             return DataUpdateStatus(
                 symbol=symbol,
                 timeframe=timeframe,
-                last_update=datetime.now(),
-                records_updated=0,
+                last_update=updated_at,
+                records_updated=records_updated,
                 success=False,
                 error_message=f"Authentication error: {str(e)}",
             )
@@ -181,8 +260,8 @@ class TradingDataUpdatingService:
             return DataUpdateStatus(
                 symbol=symbol,
                 timeframe=timeframe,
-                last_update=datetime.now(),
-                records_updated=0,
+                last_update=updated_at,
+                records_updated=records_updated,
                 success=False,
                 error_message=f"Rate limit error: {str(e)}",
             )
@@ -191,11 +270,24 @@ class TradingDataUpdatingService:
             return DataUpdateStatus(
                 symbol=symbol,
                 timeframe=timeframe,
-                last_update=datetime.now(),
-                records_updated=0,
+                last_update=updated_at,
+                records_updated=records_updated,
                 success=False,
                 error_message=str(e),
             )
+        except DataStorageError as e:
+            logger.error(
+                f"Failed to store {symbol} {timeframe} after {records_updated} "
+                f"records: {e}"
+            )
+            return DataUpdateStatus(
+                symbol=symbol,
+                timeframe=timeframe,
+                last_update=updated_at,
+                records_updated=records_updated,
+                success=False,
+                error_message=f"Storage error: {str(e)}",
+            )
 
     def get_update_status(
         self, symbols: list[str], timeframes: list[str] | None = None
@@ -213,16 +305,20 @@ class TradingDataUpdatingService:
         if timeframes is None:
             timeframes = ["1min"]
 
-        status = {}
-        for symbol in symbols:
-            status[symbol] = {}
-            for timeframe in timeframes:
-                last_update = self.storage_service.get_last_update_date(
-                    symbol, timeframe
-                )
-                status[symbol][timeframe] = last_update
-
-        return status  # type: ignore[reportUnknownVariableType]
+        # One storage lookup per timeframe, transposed to {symbol: {timeframe: ...}}
+        by_timeframe = {
+            timeframe: self.storage_service.get_last_update_date_multi(
+                symbols, timeframe
+            )
+            for timeframe in timeframes
+        }
+        return {
+            symbol: {
+                timeframe: last_updates[symbol]
+                for timeframe, last_updates in by_timeframe.items()
+            }
+            for symbol in symbols
+        }
 
     def get_stored_symbols(self, timeframe: str = "1min") -> list[str]:
         """
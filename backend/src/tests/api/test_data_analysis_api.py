@@ -10,20 +10,12 @@ This module tests the data analysis API including:
 from typing import Any
 from unittest.mock import Mock, patch
 
-import pytest
 from fastapi.testclient import TestClient
 
-from main import app
-
 
 class TestDataAnalysisAPI:
     """Test data analysis API endpoints."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
-
     def test_analyze_data_completeness(self, client: TestClient) -> None:
         """Test data completeness analysis endpoint."""
         with patch(
@@ -11,10 +11,9 @@ from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from main import app
-
 
 class TestNightlyUpdateAPI:
     """Test cases for nightly update API endpoints."""
@@ -28,11 +27,6 @@ class TestNightlyUpdateAPI:
         yield
         reset_progress_service()
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create a test client for the API."""
-        return TestClient(app)
-
     @pytest.fixture
     def mock_nightly_service(self) -> Mock:
         """Create a mock nightly update service."""
@@ -85,7 +79,7 @@ class TestNightlyUpdateAPI:
             # Note: We don't assert on execute_nightly_update being called because
             # it runs as a background task and mocking background tasks is complex
 
-    def test_start_nightly_update_error(self, client: TestClient) -> None:
+    def test_start_nightly_update_error(self, client: TestClient, app: FastAPI) -> None:
         """Test error handling when starting nightly update fails."""
         from api.nightly_update import get_nightly_update_service
 
@@ -111,7 +105,7 @@ class TestNightlyUpdateAPI:
             # Clean up the override
             app.dependency_overrides.clear()
 
-    def test_get_update_status_active(self, client: TestClient) -> None:
+    def test_get_update_status_active(self, client: TestClient, app: FastAPI) -> None:
         """Test getting status of an active update."""
         from datetime import datetime
 
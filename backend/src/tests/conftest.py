@@ -3,8 +3,38 @@ Pytest configuration and shared fixtures.
 """
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
 # Add the src directory to Python path for imports
 src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    Get the FastAPI application, imported and warmed once per session.
+
+    The OpenAPI schema is built here, so no test pays for its lazy first build.
+    """
+    from main import app
+
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    """
+    Create a test client for the API, shared by the whole session.
+
+    The context-manager form runs the app lifespan once for the session
+    instead of building a client per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
@@ -9,6 +9,7 @@ standard UTC alignment, etc.
 import logging
 import sys
 import tempfile
+import warnings
 from collections.abc import Generator
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -321,3 +322,93 @@ class TestAssetAwareResampling:
                     f"Volume mismatch for {symbol}: expected {expected_volume}, "
                     f"got {first_5min_candle.volume}"
                 )
+
+    def test_chained_resampling_matches_direct(
+        self,
+        resampling_service: DataResamplingService,
+        sample_24h_data: list[PriceCandle],
+    ) -> None:
+        """Test that nesting timeframes built from shorter ones match direct resampling."""
+        for symbol in ["AAPL", "BTC-USD"]:
+            resampling_service.storage_service.store_data(
+                PriceDataSeries(
+                    symbol=symbol, timeframe=Timeframe.ONE_MIN, candles=sample_24h_data
+                )
+            )
+            source_df = resampling_service.load_source_frame(symbol, "1min")
+
+            chain = ["5min", "15min", "30min", "1h", "2h", "4h", "daily"]
+            previous_timeframe, previous_df = "1min", source_df
+            for timeframe in chain:
+                assert resampling_service.can_resample_from(
+                    symbol, previous_timeframe, timeframe
+                )
+                _, direct_df = resampling_service.resample_frame_and_store(
+                    symbol, source_df, "1min", timeframe
+                )
+                _, chained_df = resampling_service.resample_frame_and_store(
+                    symbol, previous_df, previous_timeframe, timeframe
+                )
+
+                pd.testing.assert_frame_equal(chained_df, direct_df)
+                previous_timeframe, previous_df = timeframe, chained_df
+
+    def test_bucket_aggregation_matches_pandas_resample(
+        self,
+        resampling_service: DataResamplingService,
+        sample_24h_data: list[PriceCandle],
+    ) -> None:
+        """Test that intraday bucket aggregation matches pandas resample().agg()."""
+        # Drop a stretch of candles so some periods have no data
+        source_df = resampling_service._candles_to_dataframe(  # type: ignore[reportPrivateUsage]
+            sample_24h_data[:600] + sample_24h_data[700:]
+        )
+        agg_rules = {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "volume": "sum",
+        }
+
+        for symbol in ["AAPL", "BTC-USD"]:
+            asset_type = resampling_service.asset_classifier.classify_symbol(symbol)
+            for timeframe, frequency in [("5min", "5min"), ("30min", "30min"), ("4h", "4h")]:
+                offset = resampling_service._resampling_offset(  # type: ignore[reportPrivateUsage]
+                    timeframe, asset_type
+                )
+                expected = (
+                    source_df.resample(frequency, offset=offset)  # type: ignore[arg-type]
+                    .agg(agg_rules)
+                    .dropna(subset=["open", "high", "low", "close"])
+                    .reset_index()
+                )
+
+                resampled_df = resampling_service._resample_dataframe(  # type: ignore[reportPrivateUsage]
+                    source_df, timeframe, symbol
+                )
+
+                pd.testing.assert_frame_equal(resampled_df, expected)
+
+    def test_daily_candles_cover_utc_days_stamped_at_close(
+        self,
+        resampling_service: DataResamplingService,
+        sample_24h_data: list[PriceCandle],
+    ) -> None:
+        """Test that daily buckets are UTC days and candles carry the 20:00 close."""
+        source_df = resampling_service._candles_to_dataframe(sample_24h_data)  # type: ignore[reportPrivateUsage]
+
+        for symbol in ["AAPL", "BTC-USD"]:
+            with warnings.catch_warnings():
+                # pandas warns when a bucket offset it was given is ignored
+                warnings.simplefilter("error")
+                daily_df = resampling_service._resample_dataframe(  # type: ignore[reportPrivateUsage]
+                    source_df, "daily", symbol
+                )
+
+            assert list(daily_df["date"]) == [pd.Timestamp("2024-01-15", tz="UTC")]
+            assert daily_df["volume"].sum() == source_df["volume"].sum()
+            candles = resampling_service._dataframe_to_candles(daily_df, "daily")  # type: ignore[reportPrivateUsage]
+            assert [candle.date for candle in candles] == [
+                datetime(2024, 1, 15, 20, 0, tzinfo=UTC)
+            ]
@@ -218,3 +218,200 @@ class TestTradingDataUpdatingServiceIntegration:
 
         assert service.provider_type == DataProvider.POLYGON
         assert service.storage_service is not None
+
+    @pytest.mark.asyncio
+    @patch("services.workflows.trading_data_updating_service.DataStorageService")
+    async def test_update_symbol_data_fetches_timeframes_concurrently(
+        self, _mock_storage_service  # type: ignore  # noqa: ARG002
+    ):
+        """Test timeframes are fetched concurrently and reported in request order."""
+        import asyncio
+        from collections.abc import AsyncIterator
+        from datetime import date
+
+        from simutrador_core.models.price_data import PriceDataSeries, Timeframe
+
+        from services.workflows.trading_data_updating_service import (
+            TradingDataUpdatingService,
+        )
+
+        both_started = asyncio.Event()
+        started: list[str] = []
+
+        async def fake_iter(
+            symbol: str, timeframe: str, **_kwargs: object
+        ) -> AsyncIterator[PriceDataSeries]:
+            started.append(timeframe)
+            if len(started) == 2:
+                both_started.set()
+            # Each fetch waits until the other one has started too
+            await asyncio.wait_for(both_started.wait(), timeout=2)
+            if timeframe == "5min":
+                raise RuntimeError("boom")
+            yield PriceDataSeries(
+                symbol=symbol, timeframe=Timeframe(timeframe), candles=[]
+            )
+
+        client = Mock(spec=DataProviderInterface)
+        client.iter_historical_data.side_effect = fake_iter
+
+        service = TradingDataUpdatingService()
+        statuses = await service.update_symbol_data(
+            "AAPL",
+            timeframes=["1min", "5min"],
+            start_date=date(2025, 1, 15),
+            end_date=date(2025, 1, 15),
+            client=client,
+        )
+
+        assert [status.timeframe for status in statuses] == ["1min", "5min"]
+        assert [status.success for status in statuses] == [True, False]
+        assert statuses[1].error_message == "boom"
+        # Success and failure report the same update time for one call
+        assert statuses[0].last_update == statuses[1].last_update
+
+    @pytest.mark.asyncio
+    @patch("services.workflows.trading_data_updating_service.DataStorageService")
+    async def test_update_symbol_data_stores_each_batch(self, mock_storage_service):  # type: ignore
+        """Test every fetched batch is stored and counted in the update status."""
+        from collections.abc import AsyncIterator
+        from datetime import UTC, date, datetime
+        from decimal import Decimal
+
+        from simutrador_core.models.price_data import (
+            PriceCandle,
+            PriceDataSeries,
+            Timeframe,
+        )
+
+        from services.workflows.trading_data_updating_service import (
+            TradingDataUpdatingService,
+        )
+
+        def batch(day: int) -> PriceDataSeries:
+            candle = PriceCandle(
+                date=datetime(2025, 1, day, 15, 0, tzinfo=UTC),
+                open=Decimal("100"),
+                high=Decimal("101"),
+                low=Decimal("99"),
+                close=Decimal("100.5"),
+                volume=Decimal("1000"),
+            )
+            return PriceDataSeries(
+                symbol="AAPL", timeframe=Timeframe.ONE_MIN, candles=[candle]
+            )
+
+        empty = PriceDataSeries(symbol="AAPL", timeframe=Timeframe.ONE_MIN, candles=[])
+        batches = [batch(14), empty, batch(15)]
+
+        async def fake_iter(**_kwargs: object) -> AsyncIterator[PriceDataSeries]:
+            for series in batches:
+                yield series
+
+        client = Mock(spec=DataProviderInterface)
+        client.iter_historical_data.side_effect = fake_iter
+
+        service = TradingDataUpdatingService()
+        statuses = await service.update_symbol_data(
+            "AAPL",
+            start_date=date(2025, 1, 14),
+            end_date=date(2025, 1, 15),
+            client=client,
+        )
+
+        store_data = mock_storage_service.return_value.store_data  # type: ignore
+        assert [call.args[0] for call in store_data.call_args_list] == [  # type: ignore
+            batches[0],
+            batches[2],
+        ]
+        assert statuses[0].success
+        assert statuses[0].records_updated == 2
+
+    @pytest.mark.asyncio
+    @patch("services.workflows.trading_data_updating_service.DataStorageService")
+    async def test_update_symbol_data_reports_batches_stored_before_failure(
+        self, mock_storage_service  # type: ignore
+    ):
+        """Test a storage failure reports the records earlier batches wrote."""
+        from collections.abc import AsyncIterator
+        from datetime import UTC, date, datetime
+        from decimal import Decimal
+
+        from simutrador_core.models.price_data import (
+            PriceCandle,
+            PriceDataSeries,
+            Timeframe,
+        )
+
+        from services.storage.data_storage_service import DataStorageError
+        from services.workflows.trading_data_updating_service import (
+            TradingDataUpdatingService,
+        )
+
+        def batch(day: int, count: int) -> PriceDataSeries:
+            return PriceDataSeries(
+                symbol="AAPL",
+                timeframe=Timeframe.ONE_MIN,
+                candles=[
+                    PriceCandle(
+                        date=datetime(2025, 1, day, 15, minute, tzinfo=UTC),
+                        open=Decimal("100"),
+                        high=Decimal("101"),
+                        low=Decimal("99"),
+                        close=Decimal("100.5"),
+                        volume=Decimal("1000"),
+                    )
+                    for minute in range(count)
+                ],
+            )
+
+        async def fake_iter(**_kwargs: object) -> AsyncIterator[PriceDataSeries]:
+            for series in (batch(13, 3), batch(14, 2), batch(15, 4)):
+                yield series
+
+        client = Mock(spec=DataProviderInterface)
+        client.iter_historical_data.side_effect = fake_iter
+        mock_storage_service.return_value.store_data.side_effect = [  # type: ignore
+            None,
+            DataStorageError("Failed to store data for AAPL: disk full"),
+        ]
+
+        service = TradingDataUpdatingService()
+        statuses = await service.update_symbol_data(
+            "AAPL",
+            start_date=date(2025, 1, 13),
+            end_date=date(2025, 1, 15),
+            client=client,
+        )
+
+        assert not statuses[0].success
+        assert statuses[0].records_updated == 3
+        assert statuses[0].error_message is not None
+        assert "disk full" in statuses[0].error_message
+
+    @pytest.mark.asyncio
+    @patch("services.workflows.trading_data_updating_service.DataStorageService")
+    async def test_update_symbol_data_skips_client_when_up_to_date(
+        self, mock_storage_service  # type: ignore
+    ):
+        """Test a symbol with current data is reported without opening a client."""
+        from datetime import UTC, date, datetime
+
+        from services.workflows.trading_data_updating_service import (
+            TradingDataUpdatingService,
+        )
+
+        mock_storage_service.return_value.get_last_update_date.return_value = (  # type: ignore
+            datetime(2025, 1, 15, 20, 59, tzinfo=UTC)
+        )
+
+        service = TradingDataUpdatingService()
+        with patch.object(service, "open_provider_client") as open_client:
+            statuses = await service.update_symbol_data(
+                "AAPL", timeframes=["1min", "5min"], end_date=date(2025, 1, 15)
+            )
+
+        open_client.assert_not_called()
+        assert [status.timeframe for status in statuses] == ["1min", "5min"]
+        assert all(status.success for status in statuses)
+        assert all(status.records_updated == 0 for status in statuses)
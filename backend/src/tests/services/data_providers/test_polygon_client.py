@@ -7,9 +7,10 @@ This module tests the Polygon API client, including:
 - Rate limiting and error handling
 """
 
-from datetime import UTC, datetime
+import asyncio
+from datetime import UTC, date, datetime
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -180,6 +181,47 @@ class TestPolygonClient:
             _, params = args
             assert params["limit"] == 50000
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_concurrent_requests(
+        self, polygon_client: PolygonClient
+    ) -> None:
+        """Test that concurrent callers reserve distinct request slots."""
+        polygon_client.polygon_settings.rate_limit_requests_per_second = 10
+
+        with patch(
+            "services.data_providers.polygon_client.asyncio.sleep"
+        ) as mock_sleep:
+            await asyncio.gather(
+                *(polygon_client._enforce_rate_limit() for _ in range(3))  # type: ignore
+            )
+
+        # The first request goes straight through, the others queue 0.1s apart
+        delays = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert delays == pytest.approx([0.1, 0.2], abs=0.05)
+        assert polygon_client._request_count == 3  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_fetch_url_goes_through_rate_limiter(
+        self, polygon_client: PolygonClient
+    ) -> None:
+        """Test that prebuilt URLs are rate limited and a 429 backs callers off."""
+        response = MagicMock(status_code=429)
+        with (
+            patch.object(polygon_client, "_enforce_rate_limit") as mock_limit,
+            patch.object(
+                polygon_client.client, "get", AsyncMock(return_value=response)
+            ) as mock_get,
+        ):
+            result = await polygon_client.fetch_url("https://api.polygon.io/v2/aggs")
+
+        assert result is response
+        mock_limit.assert_awaited_once()
+        mock_get.assert_awaited_once()
+        assert (
+            polygon_client._next_request_time  # type: ignore
+            > asyncio.get_running_loop().time()
+        )
+
     @pytest.mark.asyncio
     async def test_batch_size_prevents_50k_limit_breach(
         self, polygon_client: PolygonClient
@@ -200,6 +242,41 @@ class TestPolygonClient:
             estimated_candles < 45000
         ), f"Batch size {batch_size} should stay under safety margin of 45k candles"
 
+    @pytest.mark.asyncio
+    async def test_iter_historical_data_yields_each_batch(
+        self, polygon_client: PolygonClient
+    ) -> None:
+        """Test that batches are yielded as they arrive and failed ones skipped."""
+        fetched: list[tuple[date, date]] = []
+
+        async def fake_batch(
+            _symbol: str, _timeframe: str, batch_start: date, batch_end: date
+        ) -> list[Any]:
+            fetched.append((batch_start, batch_end))
+            if batch_start == date(2025, 1, 11):
+                raise PolygonError("boom")
+            return []
+
+        with (
+            patch.object(polygon_client, "_calculate_batch_size", return_value=5),
+            patch.object(
+                polygon_client, "_fetch_batch_with_retry", side_effect=fake_batch
+            ),
+        ):
+            batches = [
+                series
+                async for series in polygon_client.iter_historical_data(
+                    "AAPL", "1min", date(2025, 1, 1), date(2025, 1, 12)
+                )
+            ]
+
+        assert fetched == [
+            (date(2025, 1, 1), date(2025, 1, 5)),
+            (date(2025, 1, 6), date(2025, 1, 10)),
+            (date(2025, 1, 11), date(2025, 1, 12)),
+        ]
+        assert len(batches) == 2
+
 
 class TestPolygonUrlGenerator:
     """Test cases for Polygon URL generation with trades endpoint."""
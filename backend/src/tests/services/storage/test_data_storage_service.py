@@ -0,0 +1,741 @@
+"""
+Tests for the DataStorageService.
+"""
+
+import sys
+import tempfile
+from collections.abc import Generator
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from simutrador_core.models.price_data import PriceCandle, PriceDataSeries, Timeframe
+
+from services.storage.data_storage_service import DataStorageService
+
+
+class TestDataStorageService:
+    """Test cases for DataStorageService."""
+
+    @pytest.fixture
+    def temp_storage_dir(self) -> Generator[Path, None, None]:
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    @pytest.fixture
+    def mock_settings(self, temp_storage_dir: Path) -> MagicMock:
+        """Mock settings with temporary directory."""
+        mock_settings = MagicMock()
+        mock_settings.data_storage.base_path = str(temp_storage_dir)
+        mock_settings.data_storage.candles_path = "candles"
+        return mock_settings
+
+    @pytest.fixture
+    def storage_service(self, mock_settings: MagicMock) -> DataStorageService:
+        """Create a data storage service with temporary directory."""
+        with patch(
+            "services.storage.data_storage_service.get_settings",
+            return_value=mock_settings,
+        ):
+            service = DataStorageService()
+            return service
+
+    @pytest.fixture
+    def sample_candles(self) -> list[PriceCandle]:
+        """Create sample price candles for testing."""
+        return [
+            PriceCandle(
+                date=datetime(2025, 7, 1, 9, 30),
+                open=Decimal("100.0"),
+                high=Decimal("105.0"),
+                low=Decimal("99.0"),
+                close=Decimal("103.0"),
+                volume=Decimal("1000"),
+            ),
+            PriceCandle(
+                date=datetime(2025, 7, 1, 9, 31),
+                open=Decimal("103.0"),
+                high=Decimal("106.0"),
+                low=Decimal("102.0"),
+                close=Decimal("105.0"),
+                volume=Decimal("1200"),
+            ),
+        ]
+
+    @pytest.fixture
+    def sample_series(self, sample_candles: list[PriceCandle]) -> PriceDataSeries:
+        """Create a sample price data series."""
+        return PriceDataSeries(
+            symbol="AAPL", timeframe=Timeframe.ONE_MIN, candles=sample_candles
+        )
+
+    def test_service_initialization(self, storage_service: DataStorageService):
+        """Test that the service initializes correctly."""
+        assert storage_service is not None
+        assert storage_service.base_path.exists()
+        assert storage_service.candles_path.exists()
+
+    def test_store_empty_data(self, storage_service: DataStorageService):
+        """Test storing empty data series."""
+        empty_series = PriceDataSeries(
+            symbol="AAPL", timeframe=Timeframe.ONE_MIN, candles=[]
+        )
+
+        # Should not raise an exception
+        storage_service.store_data(empty_series)
+
+    def test_store_and_load_intraday_data(
+        self, storage_service: DataStorageService, sample_series: PriceDataSeries
+    ):
+        """Test storing and loading intraday data."""
+        # Store the data
+        storage_service.store_data(sample_series)
+
+        # Load the data back in ascending order (oldest first)
+        loaded_series = storage_service.load_data(
+            "AAPL", Timeframe.ONE_MIN.value, order_by="asc"
+        )
+
+        assert loaded_series.symbol == "AAPL"
+        assert loaded_series.timeframe == Timeframe.ONE_MIN
+        assert len(loaded_series.candles) == 2
+
+        # Check first candle (oldest)
+        first_candle = loaded_series.candles[0]
+        assert first_candle.open == Decimal("100.0")
+        assert first_candle.close == Decimal("103.0")
+
+    def test_store_and_load_daily_data(self, storage_service: DataStorageService):
+        """Test storing and loading daily data."""
+        daily_candles = [
+            PriceCandle(
+                date=datetime(2025, 7, 1),
+                open=Decimal("100.0"),
+                high=Decimal("110.0"),
+                low=Decimal("95.0"),
+                close=Decimal("108.0"),
+                volume=Decimal("50000"),
+            )
+        ]
+
+        daily_series = PriceDataSeries(
+            symbol="AAPL", timeframe=Timeframe.DAILY, candles=daily_candles
+        )
+
+        # Store the data
+        storage_service.store_data(daily_series)
+
+        # Load the data back
+        loaded_series = storage_service.load_data("AAPL", Timeframe.DAILY.value)
+
+        assert loaded_series.symbol == "AAPL"
+        assert loaded_series.timeframe == Timeframe.DAILY
+        assert len(loaded_series.candles) == 1
+        assert loaded_series.candles[0].close == Decimal("108.0")
+
+    def test_get_last_update_date(
+        self, storage_service: DataStorageService, sample_series: PriceDataSeries
+    ):
+        """Test getting the last update date."""
+        # Initially should be None
+        last_date = storage_service.get_last_update_date(
+            "AAPL", Timeframe.ONE_MIN.value
+        )
+        assert last_date is None
+
+        # Store data and check again
+        storage_service.store_data(sample_series)
+        last_date = storage_service.get_last_update_date(
+            "AAPL", Timeframe.ONE_MIN.value
+        )
+
+        assert last_date is not None
+        # Convert to naive datetime for comparison (pandas returns timezone-aware)
+        from pandas import Timestamp
+
+        if isinstance(last_date, Timestamp):
+            # Convert pandas Timestamp to naive datetime
+            last_date_naive: datetime = datetime(
+                last_date.year,
+                last_date.month,
+                last_date.day,
+                last_date.hour,
+                last_date.minute,
+                last_date.second,
+            )
+        else:
+            last_date_naive = (
+                last_date.replace(tzinfo=None) if last_date.tzinfo else last_date
+            )
+        assert last_date_naive == datetime(2025, 7, 1, 9, 31)  # Latest candle
+
+    def test_get_last_update_date_performance(
+        self, storage_service: DataStorageService
+    ):
+        """Test that get_last_update_date is performant with larger datasets."""
+        import time
+        from datetime import timedelta
+
+        # Create 10 days of 1-minute data (3,900 candles)
+        base_date = datetime(2024, 1, 1, 9, 30)
+
+        for day in range(10):
+            current_date = base_date + timedelta(days=day)
+            candles: list[PriceCandle] = []
+
+            # Create 390 candles per day (6.5 hours * 60 minutes)
+            for minute in range(390):
+                candle_time = current_date + timedelta(minutes=minute)
+                base_price = Decimal("150.0") + (Decimal(str(minute)) * Decimal("0.01"))
+
+                candle = PriceCandle(
+                    date=candle_time,
+                    open=base_price,
+                    high=base_price + Decimal("0.50"),
+                    low=base_price - Decimal("0.50"),
+                    close=base_price + Decimal("0.25"),
+                    volume=Decimal(str(1000 + minute)),
+                )
+                candles.append(candle)  # type: ignore[reportUnknownMemberType]
+
+            # Store each day's data
+            series = PriceDataSeries(
+                symbol="PERF_TEST", timeframe=Timeframe.ONE_MIN, candles=candles  # type: ignore[reportUnknownArgumentType]
+            )
+            storage_service.store_data(series)
+
+        # Measure performance of get_last_update_date
+        start_time = time.perf_counter()
+        last_date = storage_service.get_last_update_date(
+            "PERF_TEST", Timeframe.ONE_MIN.value
+        )
+        end_time = time.perf_counter()
+
+        elapsed_ms = (end_time - start_time) * 1000
+
+        # Should be very fast (under 100ms for 3,900 candles)
+        assert (
+            elapsed_ms < 100
+        ), f"get_last_update_date took {elapsed_ms:.2f}ms, expected < 100ms"
+        assert last_date is not None
+
+        # Should return the latest date from the last day
+        expected_latest = base_date + timedelta(days=9, minutes=389)
+        # Convert to naive datetime for comparison (pandas returns timezone-aware)
+        from pandas import Timestamp
+
+        if isinstance(last_date, Timestamp):
+            # Convert pandas Timestamp to naive datetime
+            last_date_naive: datetime = datetime(
+                last_date.year,
+                last_date.month,
+                last_date.day,
+                last_date.hour,
+                last_date.minute,
+                last_date.second,
+            )
+        else:
+            last_date_naive = (
+                last_date.replace(tzinfo=None) if last_date.tzinfo else last_date
+            )
+        assert last_date_naive == expected_latest
+
+        print(f"✅ Performance test passed: {elapsed_ms:.2f}ms for 3,900 candles")
+
+    def test_list_stored_symbols(
+        self, storage_service: DataStorageService, sample_series: PriceDataSeries
+    ):
+        """Test listing stored symbols."""
+        # Initially should be empty
+        symbols = storage_service.list_stored_symbols(Timeframe.ONE_MIN.value)
+        assert symbols == []
+
+        # Store data and check again
+        storage_service.store_data(sample_series)
+        symbols = storage_service.list_stored_symbols(Timeframe.ONE_MIN.value)
+
+        assert "AAPL" in symbols
+
+    def test_data_deduplication(
+        self, storage_service: DataStorageService, sample_candles: list[PriceCandle]
+    ):
+        """Test that duplicate data is properly handled."""
+        # Create series with duplicate candles
+        duplicate_candles = sample_candles + [sample_candles[0]]  # Add duplicate
+
+        series = PriceDataSeries(
+            symbol="AAPL", timeframe=Timeframe.ONE_MIN, candles=duplicate_candles
+        )
+
+        storage_service.store_data(series)
+        loaded_series = storage_service.load_data("AAPL", Timeframe.ONE_MIN.value)
+
+        # Should have only 2 unique candles, not 3
+        assert len(loaded_series.candles) == 2
+
+    def test_store_data_keep_existing(
+        self, storage_service: DataStorageService, sample_candles: list[PriceCandle]
+    ):
+        """Test that keep_existing only adds candles for dates not stored yet."""
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="AAPL", timeframe=Timeframe.ONE_MIN, candles=sample_candles[:1]
+            )
+        )
+
+        replacement = sample_candles[0].model_copy(update={"close": Decimal("1.0")})
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="AAPL",
+                timeframe=Timeframe.ONE_MIN,
+                candles=[replacement, sample_candles[1]],
+            ),
+            keep_existing=True,
+        )
+
+        loaded_series = storage_service.load_data(
+            "AAPL", Timeframe.ONE_MIN.value, order_by="asc"
+        )
+        assert [candle.close for candle in loaded_series.candles] == [
+            sample_candles[0].close,
+            sample_candles[1].close,
+        ]
+
+    def test_load_nonexistent_data(self, storage_service: DataStorageService):
+        """Test loading data that doesn't exist."""
+        loaded_series = storage_service.load_data(
+            "NONEXISTENT", Timeframe.ONE_MIN.value
+        )
+
+        assert loaded_series.symbol == "NONEXISTENT"
+        assert loaded_series.timeframe == Timeframe.ONE_MIN
+        assert len(loaded_series.candles) == 0
+
+    def test_pagination_with_limit_and_offset(
+        self, storage_service: DataStorageService
+    ):
+        """Test pagination functionality with limit and offset parameters."""
+        # Create test data with multiple days
+        base_date = datetime(2025, 7, 1, 9, 30, tzinfo=UTC)
+        all_candles: list[PriceCandle] = []
+
+        # Create 100 candles across 2 days (50 each day)
+        for day in range(2):
+            for minute in range(50):
+                candle_time = base_date + timedelta(days=day, minutes=minute)
+                candle = PriceCandle(
+                    date=candle_time,
+                    open=Decimal(f"{100 + day + minute * 0.1:.1f}"),
+                    high=Decimal(f"{101 + day + minute * 0.1:.1f}"),
+                    low=Decimal(f"{99 + day + minute * 0.1:.1f}"),
+                    close=Decimal(f"{100.5 + day + minute * 0.1:.1f}"),
+                    volume=Decimal(str(1000 + minute)),
+                )
+                all_candles.append(candle)
+
+        # Store the data
+        series = PriceDataSeries(
+            symbol="PAGINATE_TEST", timeframe=Timeframe.ONE_MIN, candles=all_candles
+        )
+        storage_service.store_data(series)
+
+        # Test pagination: Get first 10 records
+        page1 = storage_service.load_data(
+            "PAGINATE_TEST", Timeframe.ONE_MIN.value, limit=10, offset=0, order_by="asc"
+        )
+        assert len(page1.candles) == 10
+        assert page1.candles[0].open == Decimal("100.0")  # First record
+
+        # Test pagination: Get next 10 records
+        page2 = storage_service.load_data(
+            "PAGINATE_TEST",
+            Timeframe.ONE_MIN.value,
+            limit=10,
+            offset=10,
+            order_by="asc",
+        )
+        assert len(page2.candles) == 10
+        assert page2.candles[0].open == Decimal("101.0")  # 11th record
+
+        # Test pagination: Get last few records
+        last_page = storage_service.load_data(
+            "PAGINATE_TEST",
+            Timeframe.ONE_MIN.value,
+            limit=10,
+            offset=90,
+            order_by="asc",
+        )
+        assert len(last_page.candles) == 10  # Should get exactly 10 (records 91-100)
+
+        # Test pagination beyond available data
+        beyond_page = storage_service.load_data(
+            "PAGINATE_TEST",
+            Timeframe.ONE_MIN.value,
+            limit=10,
+            offset=100,
+            order_by="asc",
+        )
+        assert len(beyond_page.candles) == 0  # No more data
+
+    def test_pagination_with_descending_order(
+        self, storage_service: DataStorageService
+    ):
+        """Test pagination with descending order (newest first)."""
+        # Create test data
+        base_date = datetime(2025, 7, 1, 9, 30, tzinfo=UTC)
+        candles: list[PriceCandle] = []
+
+        for minute in range(20):
+            candle_time = base_date + timedelta(minutes=minute)
+            candle = PriceCandle(
+                date=candle_time,
+                open=Decimal(f"{100 + minute:.0f}"),
+                high=Decimal(f"{101 + minute:.0f}"),
+                low=Decimal(f"{99 + minute:.0f}"),
+                close=Decimal(f"{100 + minute:.0f}"),
+                volume=Decimal(str(1000 + minute)),
+            )
+            candles.append(candle)
+
+        series = PriceDataSeries(
+            symbol="DESC_TEST", timeframe=Timeframe.ONE_MIN, candles=candles
+        )
+        storage_service.store_data(series)
+
+        # Get first 5 records in descending order (newest first)
+        desc_page = storage_service.load_data(
+            "DESC_TEST", Timeframe.ONE_MIN.value, limit=5, offset=0, order_by="desc"
+        )
+
+        assert len(desc_page.candles) == 5
+        # First record should be the newest (highest open price)
+        assert desc_page.candles[0].open == Decimal("119")  # Last candle (minute 19)
+        assert desc_page.candles[4].open == Decimal("115")  # 5th newest (minute 15)
+
+    def test_get_total_count_method(self, storage_service: DataStorageService):
+        """Test the get_total_count method for efficient counting."""
+        # Create test data
+        base_date = datetime(2025, 7, 1, 9, 30, tzinfo=UTC)
+        candles: list[PriceCandle] = []
+
+        for minute in range(50):
+            candle_time = base_date + timedelta(minutes=minute)
+            candle = PriceCandle(
+                date=candle_time,
+                open=Decimal("100.0"),
+                high=Decimal("101.0"),
+                low=Decimal("99.0"),
+                close=Decimal("100.5"),
+                volume=Decimal("1000"),
+            )
+            candles.append(candle)
+
+        series = PriceDataSeries(
+            symbol="COUNT_TEST", timeframe=Timeframe.ONE_MIN, candles=candles
+        )
+        storage_service.store_data(series)
+
+        # Test total count
+        total_count = storage_service.get_total_count(
+            "COUNT_TEST", Timeframe.ONE_MIN.value
+        )
+        assert total_count == 50
+
+        # Test count for non-existent symbol
+        zero_count = storage_service.get_total_count(
+            "NONEXISTENT", Timeframe.ONE_MIN.value
+        )
+        assert zero_count == 0
+
+    def test_pagination_with_date_filters(self, storage_service: DataStorageService):
+        """Test pagination combined with date filtering."""
+        # Create test data across multiple days
+        base_date = datetime(2025, 7, 1, 9, 30, tzinfo=UTC)
+        candles: list[PriceCandle] = []
+
+        # Create 30 candles per day for 3 days (90 total)
+        for day in range(3):
+            for minute in range(30):
+                candle_time = base_date + timedelta(days=day, minutes=minute)
+                candle = PriceCandle(
+                    date=candle_time,
+                    open=Decimal(f"{100 + day:.0f}"),
+                    high=Decimal(f"{101 + day:.0f}"),
+                    low=Decimal(f"{99 + day:.0f}"),
+                    close=Decimal(f"{100 + day:.0f}"),
+                    volume=Decimal("1000"),
+                )
+                candles.append(candle)
+
+        series = PriceDataSeries(
+            symbol="DATE_FILTER_TEST", timeframe=Timeframe.ONE_MIN, candles=candles
+        )
+        storage_service.store_data(series)
+
+        # Test pagination with date filter (only middle day)
+        middle_day = date(2025, 7, 2)
+        filtered_page = storage_service.load_data(
+            "DATE_FILTER_TEST",
+            Timeframe.ONE_MIN.value,
+            start_date=middle_day,
+            end_date=middle_day,
+            limit=10,
+            offset=0,
+            order_by="asc",
+        )
+
+        assert len(filtered_page.candles) == 10  # First 10 of the 30 from middle day
+        # All candles should be from the middle day (open price = 101)
+        for candle in filtered_page.candles:
+            assert candle.open == Decimal("101")
+
+        # Test total count with date filter
+        filtered_count = storage_service.get_total_count(
+            "DATE_FILTER_TEST",
+            Timeframe.ONE_MIN.value,
+            start_date=middle_day,
+            end_date=middle_day,
+        )
+        assert filtered_count == 30  # Only middle day's data
+
+    def test_pagination_after_day_file_rewrite(
+        self, storage_service: DataStorageService
+    ):
+        """Test that cached row counts are refreshed when a day file is rewritten."""
+        base_date = datetime(2025, 7, 1, 9, 30, tzinfo=UTC)
+
+        def make_candles(start: int, count: int) -> list[PriceCandle]:
+            return [
+                PriceCandle(
+                    date=base_date + timedelta(minutes=minute),
+                    open=Decimal(f"{100 + minute:.0f}"),
+                    high=Decimal(f"{101 + minute:.0f}"),
+                    low=Decimal(f"{99 + minute:.0f}"),
+                    close=Decimal(f"{100 + minute:.0f}"),
+                    volume=Decimal("1000"),
+                )
+                for minute in range(start, start + count)
+            ]
+
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="REWRITE_TEST",
+                timeframe=Timeframe.ONE_MIN,
+                candles=make_candles(0, 10),
+            )
+        )
+        first_page = storage_service.load_data(
+            "REWRITE_TEST", Timeframe.ONE_MIN.value, limit=5, offset=5, order_by="asc"
+        )
+        assert len(first_page.candles) == 5
+
+        # Append more candles to the same day file
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="REWRITE_TEST",
+                timeframe=Timeframe.ONE_MIN,
+                candles=make_candles(10, 10),
+            )
+        )
+        later_page = storage_service.load_data(
+            "REWRITE_TEST", Timeframe.ONE_MIN.value, limit=5, offset=15, order_by="asc"
+        )
+        assert len(later_page.candles) == 5
+        assert later_page.candles[0].open == Decimal("115")
+        assert (
+            storage_service.get_total_count("REWRITE_TEST", Timeframe.ONE_MIN.value)
+            == 20
+        )
+
+    def test_row_counts_refresh_after_write_by_other_instance(
+        self, storage_service: DataStorageService, mock_settings: MagicMock
+    ):
+        """Test that a day file grown by another instance is not counted stale."""
+        base_date = datetime(2025, 7, 1, 9, 30, tzinfo=UTC)
+        candles = [
+            PriceCandle(
+                date=base_date + timedelta(minutes=minute),
+                open=Decimal("100"),
+                high=Decimal("101"),
+                low=Decimal("99"),
+                close=Decimal("100"),
+                volume=Decimal("1000"),
+            )
+            for minute in range(390)
+        ]
+        with patch(
+            "services.storage.data_storage_service.get_settings",
+            return_value=mock_settings,
+        ):
+            writer = DataStorageService()
+
+        writer.store_data(
+            PriceDataSeries(
+                symbol="SHARED_TEST", timeframe=Timeframe.ONE_MIN, candles=candles[:100]
+            )
+        )
+        assert storage_service.get_total_count("SHARED_TEST", "1min") == 100
+
+        writer.store_data(
+            PriceDataSeries(
+                symbol="SHARED_TEST", timeframe=Timeframe.ONE_MIN, candles=candles
+            )
+        )
+        assert storage_service.get_total_count("SHARED_TEST", "1min") == 390
+        page = storage_service.load_data(
+            "SHARED_TEST", "1min", limit=1000, offset=0, order_by="asc"
+        )
+        assert len(page.candles) == 390
+
+    def test_load_daily_data_with_date_filters(
+        self, storage_service: DataStorageService
+    ):
+        """Test that daily loads honour inclusive start and end dates."""
+        daily_candles = [
+            PriceCandle(
+                date=datetime(2025, 7, day, tzinfo=UTC),
+                open=Decimal(f"{100 + day}"),
+                high=Decimal(f"{110 + day}"),
+                low=Decimal(f"{90 + day}"),
+                close=Decimal(f"{105 + day}"),
+                volume=Decimal("50000"),
+            )
+            for day in range(1, 11)
+        ]
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="DAILY_FILTER", timeframe=Timeframe.DAILY, candles=daily_candles
+            )
+        )
+
+        loaded_series = storage_service.load_data(
+            "DAILY_FILTER",
+            Timeframe.DAILY.value,
+            start_date=date(2025, 7, 3),
+            end_date=date(2025, 7, 5),
+            order_by="asc",
+        )
+
+        assert [candle.open for candle in loaded_series.candles] == [
+            Decimal("103"),
+            Decimal("104"),
+            Decimal("105"),
+        ]
+
+    def test_get_total_count_daily_with_date_filters(
+        self, storage_service: DataStorageService
+    ):
+        """Test daily record counts with and without date filters."""
+        daily_candles = [
+            PriceCandle(
+                date=datetime(2025, 7, day, tzinfo=UTC),
+                open=Decimal("100"),
+                high=Decimal("110"),
+                low=Decimal("90"),
+                close=Decimal("105"),
+                volume=Decimal("50000"),
+            )
+            for day in range(1, 11)
+        ]
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="DAILY_COUNT", timeframe=Timeframe.DAILY, candles=daily_candles
+            )
+        )
+
+        assert storage_service.get_total_count("DAILY_COUNT", Timeframe.DAILY.value) == 10
+        assert (
+            storage_service.get_total_count(
+                "DAILY_COUNT",
+                Timeframe.DAILY.value,
+                start_date=date(2025, 7, 3),
+                end_date=date(2025, 7, 5),
+            )
+            == 3
+        )
+
+    def test_load_data_multi(
+        self, storage_service: DataStorageService, sample_series: PriceDataSeries
+    ):
+        """Test loading several symbols at once matches per-symbol loads."""
+        storage_service.store_data(sample_series)
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="MSFT",
+                timeframe=Timeframe.ONE_MIN,
+                candles=sample_series.candles[:1],
+            )
+        )
+
+        loaded = storage_service.load_data_multi(
+            ["AAPL", "MSFT", "MISSING"],
+            Timeframe.ONE_MIN.value,
+            start_date=date(2025, 7, 1),
+            end_date=date(2025, 7, 1),
+        )
+
+        assert set(loaded) == {"AAPL", "MSFT", "MISSING"}
+        assert loaded["AAPL"].candles == storage_service.load_data(
+            "AAPL", Timeframe.ONE_MIN.value, order_by="asc"
+        ).candles
+        assert len(loaded["MSFT"].candles) == 1
+        assert loaded["MISSING"].candles == []
+
+    def test_get_total_count_multi(
+        self, storage_service: DataStorageService, sample_series: PriceDataSeries
+    ):
+        """Test counting several symbols at once matches per-symbol counts."""
+        storage_service.store_data(sample_series)
+
+        counts = storage_service.get_total_count_multi(
+            ["AAPL", "MISSING"],
+            Timeframe.ONE_MIN.value,
+            start_date=date(2025, 7, 1),
+            end_date=date(2025, 7, 1),
+        )
+
+        assert counts == {
+            "AAPL": storage_service.get_total_count(
+                "AAPL",
+                Timeframe.ONE_MIN.value,
+                start_date=date(2025, 7, 1),
+                end_date=date(2025, 7, 1),
+            ),
+            "MISSING": 0,
+        }
+        assert counts["AAPL"] > 0
+
+    def test_get_last_update_date_multi(self, storage_service: DataStorageService):
+        """Test looking up last update dates for several daily symbols at once."""
+        daily_candles = [
+            PriceCandle(
+                date=datetime(2025, 7, day),
+                open=Decimal("100.0"),
+                high=Decimal("110.0"),
+                low=Decimal("95.0"),
+                close=Decimal("108.0"),
+                volume=Decimal("50000"),
+            )
+            for day in (1, 2, 3)
+        ]
+        storage_service.store_data(
+            PriceDataSeries(
+                symbol="AAPL", timeframe=Timeframe.DAILY, candles=daily_candles
+            )
+        )
+
+        last_dates = storage_service.get_last_update_date_multi(
+            ["AAPL", "MISSING"], Timeframe.DAILY.value
+        )
+
+        assert last_dates == {
+            "AAPL": storage_service.get_last_update_date("AAPL", Timeframe.DAILY.value),
+            "MISSING": None,
+        }
+        assert last_dates["AAPL"] == datetime(2025, 7, 3, tzinfo=UTC)
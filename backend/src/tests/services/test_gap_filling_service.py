@@ -7,7 +7,8 @@ This module tests the gap filling service, including:
 - Integration with Polygon trades API
 """
 
-from datetime import UTC, datetime
+import asyncio
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -136,6 +137,7 @@ class TestGapFillingService:
         ) as mock_factory:
             mock_client = AsyncMock(spec=PolygonClient)
             mock_client.fetch_trades_data.return_value = []  # No trades data
+            mock_client.fetch_url.return_value = mock_response
             mock_factory.return_value.__aenter__.return_value = mock_client
 
             # Mock trading activity check to return True
@@ -179,6 +181,7 @@ class TestGapFillingService:
         ) as mock_factory:
             mock_client = AsyncMock(spec=PolygonClient)
             mock_client.fetch_trades_data.return_value = []  # No trades data
+            mock_client.fetch_url.return_value = mock_response
             mock_factory.return_value.__aenter__.return_value = mock_client
 
             # Mock trading activity check to return False
@@ -241,30 +244,24 @@ class TestGapFillingService:
                     "exchange_id": 4,
                 }
             ]  # Mock trades data
+            # Aggregates are fetched through the same rate-limited client
+            mock_client.fetch_url.return_value = mock_response
             mock_factory.return_value.__aenter__.return_value = mock_client
 
-            # Mock the fallback HTTP client for aggregates
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_http_client = AsyncMock()
-                mock_http_client.get.return_value = mock_response
-                mock_client_class.return_value.__aenter__.return_value = (
-                    mock_http_client
-                )
-
-                # Mock storage service methods
+            # Mock storage service methods
+            with patch.object(
+                gap_filling_service.storage_service,
+                "load_data",
+                return_value=MagicMock(),
+            ):
                 with patch.object(
                     gap_filling_service.storage_service,
-                    "load_data",
-                    return_value=MagicMock(),
+                    "store_data",
+                    return_value=None,
                 ):
-                    with patch.object(
-                        gap_filling_service.storage_service,
-                        "store_data",
-                        return_value=None,
-                    ):
-                        result = await gap_filling_service._fill_single_gap(  # pyright: ignore[reportPrivateUsage]
-                            "AAPL", start_time, end_time
-                        )
+                    result = await gap_filling_service._fill_single_gap(  # pyright: ignore[reportPrivateUsage]
+                        "AAPL", start_time, end_time
+                    )
 
             assert isinstance(result, GapFillResult)
             assert result.success is True
@@ -283,8 +280,12 @@ class TestGapFillingService:
         start_time = datetime(2024, 1, 1, 14, 30, tzinfo=UTC)
         end_time = datetime(2024, 1, 1, 15, 30, tzinfo=UTC)
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client_class.side_effect = Exception("Network error")
+        with patch(
+            "services.gap_filling_service.DataProviderFactory.create_provider"
+        ) as mock_factory:
+            mock_client = AsyncMock(spec=PolygonClient)
+            mock_client.fetch_url.side_effect = Exception("Network error")
+            mock_factory.return_value.__aenter__.return_value = mock_client
 
             result = await gap_filling_service._fill_single_gap(  # pyright: ignore[reportPrivateUsage]
                 "AAPL", start_time, end_time
@@ -300,6 +301,105 @@ class TestGapFillingService:
             assert result.error_message is not None
             assert "Network error" in result.error_message
 
+    @pytest.mark.asyncio
+    async def test_fill_gaps_stream_limits_attempts_and_concurrency(
+        self, gap_filling_service: GapFillingService
+    ) -> None:
+        """Test streaming gap filling caps both attempts and concurrent fills."""
+        base_time = datetime(2024, 1, 2, 14, 30, tzinfo=UTC)
+        periods = [
+            (base_time + timedelta(minutes=i), base_time + timedelta(minutes=i + 1))
+            for i in range(10)
+        ]
+        running = 0
+        max_running = 0
+
+        async def fake_fill(
+            _symbol: str,
+            start_time: datetime,
+            end_time: datetime,
+            _client: PolygonClient,
+        ) -> GapFillResult:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return GapFillResult(
+                start_time=start_time.isoformat(),
+                end_time=end_time.isoformat(),
+                attempted=True,
+                success=True,
+            )
+
+        with patch.object(gap_filling_service, "_fill_single_gap", fake_fill):
+            results = [
+                result
+                async for result in gap_filling_service.fill_gaps_stream(
+                    "AAPL",
+                    periods,
+                    max_attempts=6,
+                    max_concurrent=2,
+                    client=AsyncMock(spec=PolygonClient),
+                )
+            ]
+
+        assert sorted(result.start_time for result in results) == [
+            start.isoformat() for start, _ in periods[:6]
+        ]
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_fill_gaps_streams_share_fill_slots_and_client(
+        self, gap_filling_service: GapFillingService
+    ) -> None:
+        """Test concurrent streams stay under one shared limit and client."""
+        base_time = datetime(2024, 1, 2, 14, 30, tzinfo=UTC)
+        periods = [
+            (base_time + timedelta(minutes=i), base_time + timedelta(minutes=i + 1))
+            for i in range(8)
+        ]
+        shared_client = AsyncMock(spec=PolygonClient)
+        clients_used: set[int] = set()
+        running = 0
+        max_running = 0
+
+        async def fake_fill(
+            _symbol: str,
+            start_time: datetime,
+            end_time: datetime,
+            client: PolygonClient,
+        ) -> GapFillResult:
+            nonlocal running, max_running
+            clients_used.add(id(client))
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return GapFillResult(
+                start_time=start_time.isoformat(),
+                end_time=end_time.isoformat(),
+                attempted=True,
+                success=True,
+            )
+
+        fill_slots = asyncio.Semaphore(3)
+
+        async def collect(symbol: str) -> list[GapFillResult]:
+            return [
+                result
+                async for result in gap_filling_service.fill_gaps_stream(
+                    symbol, periods, client=shared_client, fill_slots=fill_slots
+                )
+            ]
+
+        with patch.object(gap_filling_service, "_fill_single_gap", fake_fill):
+            results = await asyncio.gather(*(collect(s) for s in ("AAPL", "MSFT")))
+
+        assert [len(symbol_results) for symbol_results in results] == [8, 8]
+        assert max_running == 3
+        assert clients_used == {id(shared_client)}
+
     def test_gap_fill_result_model_fields(self) -> None:
         """Test that GapFillResult model has the new fields."""
         start_time = datetime(2024, 1, 1, 14, 30, tzinfo=UTC)
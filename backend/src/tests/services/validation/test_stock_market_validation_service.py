@@ -8,8 +8,9 @@ This module tests the validation of stock market data including:
 - Volume and price data integrity
 """
 
-from datetime import date, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -120,6 +121,37 @@ class TestStockMarketValidationService:
         july_4th = date(2025, 7, 4)
         assert validation_service.is_trading_day(july_4th) is False
 
+    def test_previous_trading_day(
+        self, validation_service: StockMarketValidationService
+    ) -> None:
+        """Test that the previous trading day skips weekends and holidays."""
+        # Thursday, January 16, 2025 -> Wednesday, January 15
+        assert validation_service.previous_trading_day(date(2025, 1, 16)) == date(
+            2025, 1, 15
+        )
+
+        # Monday, January 20, 2025 is MLK Day -> Friday, January 17
+        assert validation_service.previous_trading_day(date(2025, 1, 21)) == date(
+            2025, 1, 17
+        )
+
+    def test_official_sessions_saved_to_calendar_cache(
+        self, validation_service: StockMarketValidationService, tmp_path: Path
+    ) -> None:
+        """Test that official sessions are written to and read back from disk."""
+        if not validation_service.use_official_calendar:
+            pytest.skip("Only the official calendar is cached on disk")
+
+        validation_service._calendar_cache_path = tmp_path / "sessions.pickle"  # type: ignore
+        validation_service._official_sessions_by_year.clear()  # type: ignore
+
+        sessions = validation_service._official_sessions_for_year(2025)  # type: ignore
+        trading_days, half_days = sessions
+        assert date(2025, 7, 4) not in trading_days
+        assert date(2025, 11, 28) in half_days
+
+        assert validation_service._load_calendar_cache() == {2025: sessions}  # type: ignore
+
     def test_get_expected_candle_count_full_day(
         self, validation_service: StockMarketValidationService
     ) -> None:
@@ -318,13 +350,14 @@ class TestStockMarketValidationService:
         with patch.object(
             validation_service, "validate_trading_day_data"
         ) as mock_validate:
-            # Mock validation results
-            mock_validate.side_effect = [
-                ValidationResult("AAPL", date(2025, 1, 15), True, 390, 390),
-                ValidationResult(
+            # Mock validation results (keyed by symbol, symbols run concurrently)
+            mock_results = {
+                "AAPL": ValidationResult("AAPL", date(2025, 1, 15), True, 390, 390),
+                "MSFT": ValidationResult(
                     "MSFT", date(2025, 1, 15), False, 390, 300, errors=["Missing data"]
                 ),
-            ]
+            }
+            mock_validate.side_effect = lambda symbol, *_: mock_results[symbol]  # type: ignore
 
             results = validation_service.validate_multiple_symbols(
                 ["AAPL", "MSFT"], date(2025, 1, 15)
@@ -335,18 +368,82 @@ class TestStockMarketValidationService:
             assert results["MSFT"].is_valid is False
             assert len(results["MSFT"].errors) > 0
 
+    def test_calculate_symbol_summary(
+        self, validation_service: StockMarketValidationService
+    ) -> None:
+        """Test symbol summary statistics, including a repeated (cached) summary."""
+        validation_results = [
+            ValidationResult("AAPL", date(2025, 1, 15), True, 390, 390),
+            ValidationResult("AAPL", date(2025, 1, 16), False, 390, 195),
+            ValidationResult("AAPL", date(2025, 11, 28), True, 210, 210),
+        ]
+
+        summary = validation_service._calculate_symbol_summary(  # type: ignore
+            "AAPL", validation_results
+        )
+
+        assert summary["total_trading_days"] == 3
+        assert summary["valid_days"] == 2
+        assert summary["invalid_days"] == 1
+        assert summary["missing_candles"] == 195
+        assert summary["completeness_percentage"] == 80.3
+        assert summary["full_days_count"] == 2
+        assert summary["half_days_count"] == 1
+        assert summary["days_with_gaps"] == 1
+        assert summary["worst_day_completeness"] == 50.0
+        assert summary["best_day_completeness"] == 100.0
+        assert summary["validation_results"] is validation_results
+
+        # Same figures for another symbol reuse the statistics, not the results
+        other_results = [
+            ValidationResult(
+                "MSFT",
+                result.validation_date,
+                result.is_valid,
+                result.expected_candles,
+                result.actual_candles,
+            )
+            for result in validation_results
+        ]
+        other_summary = validation_service._calculate_symbol_summary(  # type: ignore
+            "MSFT", other_results
+        )
+        assert other_summary == {**summary, "validation_results": other_results}
+        assert other_summary["validation_results"] is other_results
+
+    def test_formatted_missing_periods(self) -> None:
+        """Test missing periods render as "start to end" strings."""
+        start = datetime(2025, 1, 15, 14, 30, tzinfo=UTC)
+        end = datetime(2025, 1, 15, 15, 0, tzinfo=UTC)
+        result = ValidationResult(
+            "AAPL", date(2025, 1, 15), False, 390, 360, missing_periods=[(start, end)]
+        )
+
+        assert result.formatted_missing_periods() == [f"{start} to {end}"]
+        assert ValidationResult(
+            "AAPL", date(2025, 1, 16), True, 390, 390
+        ).formatted_missing_periods() == []
+
     def test_find_symbols_needing_update(
         self, validation_service: StockMarketValidationService
     ) -> None:
         """Test finding symbols that need updates."""
-        with patch.object(
-            validation_service, "validate_trading_day_data"
-        ) as mock_validate:
+        with (
+            patch.object(
+                validation_service, "validate_trading_day_data"
+            ) as mock_validate,
+            patch.object(
+                validation_service.storage_service,
+                "get_total_count_multi",
+                return_value={"AAPL": 390, "MSFT": 390},
+            ),
+        ):
             # Mock validation results - AAPL is valid, MSFT needs update
-            mock_validate.side_effect = [
-                ValidationResult("AAPL", date(2025, 1, 15), True, 390, 390),
-                ValidationResult("MSFT", date(2025, 1, 15), False, 390, 0),
-            ]
+            mock_results = {
+                "AAPL": ValidationResult("AAPL", date(2025, 1, 15), True, 390, 390),
+                "MSFT": ValidationResult("MSFT", date(2025, 1, 15), False, 390, 0),
+            }
+            mock_validate.side_effect = lambda symbol, *_: mock_results[symbol]  # type: ignore
 
             symbols_needing_update = validation_service.find_symbols_needing_update(
                 ["AAPL", "MSFT"], date(2025, 1, 15)
@@ -355,6 +452,83 @@ class TestStockMarketValidationService:
             assert "AAPL" not in symbols_needing_update
             assert "MSFT" in symbols_needing_update
 
+    def test_find_symbols_needing_update_short_stored_count(
+        self, validation_service: StockMarketValidationService
+    ) -> None:
+        """Test that symbols with too few stored candles skip full validation."""
+        with (
+            patch.object(
+                validation_service, "validate_trading_day_data"
+            ) as mock_validate,
+            patch.object(
+                validation_service.storage_service,
+                "get_total_count_multi",
+                return_value={"AAPL": 390, "MSFT": 120},
+            ),
+        ):
+            mock_validate.return_value = ValidationResult(
+                "AAPL", date(2025, 1, 15), True, 390, 390
+            )
+
+            symbols_needing_update = validation_service.find_symbols_needing_update(
+                ["AAPL", "MSFT"], date(2025, 1, 15)
+            )
+
+            assert symbols_needing_update == ["MSFT"]
+            mock_validate.assert_called_once()
+            assert mock_validate.call_args.args[0] == "AAPL"
+
+    def test_find_symbols_needing_update_sees_refilled_day(
+        self,
+        validation_service: StockMarketValidationService,
+        sample_trading_day_candles: list[PriceCandle],
+        tmp_path: Path,
+    ) -> None:
+        """Test that a day refilled by another storage instance is not reported."""
+        from services.storage.data_storage_service import DataStorageService
+
+        settings = Mock()
+        settings.data_storage.base_path = str(tmp_path)
+        settings.data_storage.candles_path = "candles"
+        with patch(
+            "services.storage.data_storage_service.get_settings",
+            return_value=settings,
+        ):
+            validation_service.storage_service = DataStorageService()
+            writer = DataStorageService()
+
+        writer.store_data(
+            PriceDataSeries(
+                symbol="MSFT",
+                timeframe=Timeframe.ONE_MIN,
+                candles=sample_trading_day_candles[:120],
+            )
+        )
+        with patch.object(
+            validation_service,
+            "validate_trading_day_data",
+            return_value=ValidationResult("MSFT", date(2025, 1, 15), True, 390, 390),
+        ) as mock_validate:
+            assert validation_service.find_symbols_needing_update(
+                ["MSFT"], date(2025, 1, 15)
+            ) == ["MSFT"]
+
+            # The nightly update fills the day through its own storage instance
+            writer.store_data(
+                PriceDataSeries(
+                    symbol="MSFT",
+                    timeframe=Timeframe.ONE_MIN,
+                    candles=sample_trading_day_candles,
+                )
+            )
+            assert (
+                validation_service.find_symbols_needing_update(
+                    ["MSFT"], date(2025, 1, 15)
+                )
+                == []
+            )
+            mock_validate.assert_called_once()
+
     @pytest.mark.skipif(
         not _has_custom_calendar,
         reason="Custom calendar not available when using pandas_market_calendars",
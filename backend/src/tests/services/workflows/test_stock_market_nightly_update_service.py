@@ -7,12 +7,16 @@ This module tests the stock market nightly update service including:
 - Integration with storage and validation services
 """
 
+import asyncio
+import threading
 from datetime import date, datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from simutrador_core.models.price_data import DataUpdateStatus
 
 from services.workflows.stock_market_nightly_update_service import (
+    NightlyUpdateResult,
     StockMarketNightlyUpdateService,
 )
 
@@ -140,3 +144,134 @@ class TestStockMarketNightlyUpdateService:
         # End date should be adjusted to the last trading day before today
         # This depends on what "today" is in the test, but the logic should filter non-trading days
         assert nightly_service.validation_service.is_trading_day.called  # type: ignore
+
+    def test_get_update_date_range_reuses_trading_day_walk(
+        self, nightly_service: StockMarketNightlyUpdateService
+    ) -> None:
+        """Test that symbols sharing a date range walk the calendar only once."""
+        nightly_service.validation_service.is_trading_day.side_effect = (  # type: ignore
+            lambda check_date: check_date.weekday() < 5  # type: ignore
+        )
+
+        # Saturday to Sunday a week later: both ends move to weekdays
+        first = nightly_service.get_update_date_range(
+            "AAPL", date(2025, 1, 18), date(2025, 1, 26)
+        )
+        calls = nightly_service.validation_service.is_trading_day.call_count  # type: ignore
+        second = nightly_service.get_update_date_range(
+            "MSFT", date(2025, 1, 18), date(2025, 1, 26)
+        )
+
+        assert first == second == (date(2025, 1, 20), date(2025, 1, 24))
+        assert nightly_service.validation_service.is_trading_day.call_count == calls  # type: ignore
+
+    def test_get_update_date_range_skips_calendar_when_current(
+        self, nightly_service: StockMarketNightlyUpdateService
+    ) -> None:
+        """Test the empty and single-trading-day ranges short-circuit."""
+        nightly_service.validation_service.is_trading_day.return_value = True  # type: ignore
+
+        empty = nightly_service.get_update_date_range(
+            "AAPL", date(2025, 1, 22), date(2025, 1, 21)
+        )
+        assert empty == (date(2025, 1, 22), date(2025, 1, 21))
+        nightly_service.validation_service.is_trading_day.assert_not_called()  # type: ignore
+
+        single = nightly_service.get_update_date_range(
+            "AAPL", date(2025, 1, 21), date(2025, 1, 21)
+        )
+        assert single == (date(2025, 1, 21), date(2025, 1, 21))
+        nightly_service.validation_service.is_trading_day.assert_called_once()  # type: ignore
+
+    async def test_update_multiple_symbols_with_progress_overlaps_stages(
+        self, nightly_service: StockMarketNightlyUpdateService
+    ) -> None:
+        """Test that one symbol downloads while another is still resampling."""
+        nightly_service.validation_service.is_trading_day.return_value = True  # type: ignore
+        resampling_started = threading.Event()
+        release_resampling = threading.Event()
+        downloads_during_resampling: list[str] = []
+        resampling_released: list[bool] = []
+        provider_client = MagicMock()
+        clients_used: list[object] = []
+
+        async def fake_update_symbol_data(
+            symbol: str, client: object = None, **_kwargs: object
+        ) -> list[DataUpdateStatus]:
+            clients_used.append(client)
+            if resampling_started.is_set():
+                downloads_during_resampling.append(symbol)
+                release_resampling.set()
+            return [
+                DataUpdateStatus(
+                    symbol=symbol,
+                    timeframe="1min",
+                    last_update=datetime.now(),
+                    records_updated=390,
+                    success=True,
+                    error_message=None,
+                )
+            ]
+
+        def fake_resample(symbol: str, **_kwargs: object) -> Mock:
+            if symbol == "AAPL":
+                resampling_started.set()
+                # Stays busy until the next symbol's download has run
+                resampling_released.append(release_resampling.wait(timeout=2))
+            return Mock(results={"5min": 78}, errors={})
+
+        nightly_service.updating_service.update_symbol_data = fake_update_symbol_data  # type: ignore
+        nightly_service.updating_service.open_provider_client.return_value = (  # type: ignore
+            provider_client
+        )
+        nightly_service.resampling_workflow = Mock()
+        nightly_service.resampling_workflow.resample_symbol_complete_workflow.side_effect = (
+            fake_resample
+        )
+
+        results = await asyncio.wait_for(
+            nightly_service.update_multiple_symbols_with_progress(
+                symbols=["AAPL", "MSFT"],
+                max_concurrent=1,
+                custom_start_date=date(2025, 1, 15),
+                custom_end_date=date(2025, 1, 15),
+                force_validation=False,
+            ),
+            timeout=10,
+        )
+
+        assert resampling_released == [True]
+        assert downloads_during_resampling == ["MSFT"]
+        assert all(result.success for result in results.values())
+        assert results["AAPL"].resampling_results == {"5min": 78}
+        assert results["MSFT"].total_candles_updated == 390
+
+        # Both downloads went through the one client opened for the run
+        entered_client = provider_client.__aenter__.return_value
+        assert clients_used == [entered_client, entered_client]
+        provider_client.__aexit__.assert_awaited_once()
+
+    async def test_run_symbol_updates_keeps_request_order(
+        self, nightly_service: StockMarketNightlyUpdateService
+    ) -> None:
+        """Test that results follow the requested order and errors are skipped."""
+        delays = {"AAPL": 0.02, "MSFT": 0.0, "GOOGL": 0.01}
+
+        async def fake_update_one(symbol: str) -> tuple[str, NightlyUpdateResult]:
+            await asyncio.sleep(delays[symbol])
+            if symbol == "GOOGL":
+                raise RuntimeError("unexpected")
+            return symbol, NightlyUpdateResult(
+                symbol=symbol,
+                start_date=date(2025, 1, 15),
+                end_date=date(2025, 1, 15),
+                success=True,
+                resampling_results={"5min": 78},
+            )
+
+        results = await nightly_service._run_symbol_updates(  # type: ignore
+            ["AAPL", "GOOGL", "MSFT"], fake_update_one, 2, "Nightly update completed"
+        )
+
+        assert list(results) == ["AAPL", "MSFT"]
+        assert all(result.total_resampled_candles == 78 for result in results.values())
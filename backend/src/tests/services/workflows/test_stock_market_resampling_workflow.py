@@ -0,0 +1,244 @@
+"""
+Tests for the stock market resampling workflow.
+
+This module tests the resampling workflow including:
+- Resampling every target timeframe from a single source load
+- Building longer timeframes from shorter resampled ones
+- Error reporting per target timeframe
+"""
+
+import logging
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+from simutrador_core.models.price_data import PriceCandle, PriceDataSeries, Timeframe
+
+from services.storage.data_resampling_service import DataResamplingError
+from services.storage.data_storage_service import DataStorageService
+from services.workflows.stock_market_resampling_workflow import (
+    ResamplingWorkflowResult,
+    StockMarketResamplingWorkflow,
+)
+
+
+class TestStockMarketResamplingWorkflow:
+    """Test cases for stock market resampling workflow."""
+
+    @pytest.fixture
+    def mock_resampling_service(self) -> Mock:
+        """Create a mock resampling service."""
+        return Mock()
+
+    @pytest.fixture
+    def workflow(self, mock_resampling_service: Mock) -> StockMarketResamplingWorkflow:
+        """Create a resampling workflow with a mocked resampling service."""
+        workflow = StockMarketResamplingWorkflow()
+        workflow.resampling_service = mock_resampling_service
+        return workflow
+
+    def test_get_target_timeframes_orders_custom_timeframes(
+        self, workflow: StockMarketResamplingWorkflow
+    ) -> None:
+        """Test that custom timeframes are filtered and put in resampling order."""
+        assert workflow.get_target_timeframes(["daily", "1h", "weekly", "5min"]) == [
+            "5min",
+            "1h",
+            "daily",
+        ]
+        # The configured default is returned as a fresh list each call
+        assert workflow.get_target_timeframes() is not workflow.get_target_timeframes()
+
+    def test_source_data_loaded_once_for_all_timeframes(
+        self, workflow: StockMarketResamplingWorkflow, mock_resampling_service: Mock
+    ) -> None:
+        """Test that every target timeframe is resampled from one source load."""
+        source_df = pd.DataFrame({"open": [1.0]})
+        mock_resampling_service.load_source_frame.return_value = source_df
+        mock_resampling_service.can_resample_from.return_value = False
+        mock_resampling_service.resample_frame_and_store.side_effect = [
+            (78, pd.DataFrame()),
+            (26, pd.DataFrame()),
+            (1, pd.DataFrame()),
+        ]
+
+        result = workflow.resample_symbol_complete_workflow(
+            "AAPL",
+            target_timeframes=["5min", "15min", "daily"],
+            start_date=date(2025, 1, 15),
+            end_date=date(2025, 1, 15),
+        )
+
+        mock_resampling_service.load_source_frame.assert_called_once_with(
+            symbol="AAPL",
+            timeframe="1min",
+            start_date=date(2025, 1, 15),
+            end_date=date(2025, 1, 15),
+        )
+        calls = mock_resampling_service.resample_frame_and_store.call_args_list
+        assert all(call.kwargs["source_df"] is source_df for call in calls)
+        assert result.success
+        assert result.results == {"5min": 78, "15min": 26, "daily": 1}
+
+    def test_longer_timeframes_chain_from_shorter_ones(
+        self, workflow: StockMarketResamplingWorkflow, mock_resampling_service: Mock
+    ) -> None:
+        """Test that each target is built from the longest nesting timeframe."""
+        frames = {tf: pd.DataFrame({"open": [1.0]}) for tf in ("1min", "5min", "1h")}
+        mock_resampling_service.load_source_frame.return_value = frames["1min"]
+        # 1h buckets do not nest into offset-aligned 5min ones in this test
+        mock_resampling_service.can_resample_from.side_effect = (
+            lambda _symbol, from_tf, to_tf: (from_tf, to_tf) != ("5min", "1h")  # type: ignore
+        )
+        mock_resampling_service.resample_frame_and_store.side_effect = [
+            (78, frames["5min"]),
+            (7, frames["1h"]),
+            (1, pd.DataFrame()),
+        ]
+
+        result = workflow.resample_symbol_complete_workflow(
+            "AAPL", target_timeframes=["5min", "1h", "daily"]
+        )
+
+        calls = mock_resampling_service.resample_frame_and_store.call_args_list
+        assert [call.kwargs["from_timeframe"] for call in calls] == [
+            "1min",
+            "1min",
+            "1h",
+        ]
+        sources = [frames["1min"], frames["1min"], frames["1h"]]
+        assert all(
+            call.kwargs["source_df"] is source
+            for call, source in zip(calls, sources, strict=True)
+        )
+        assert result.results == {"5min": 78, "1h": 7, "daily": 1}
+
+    def test_source_load_failure_fails_every_timeframe(
+        self, workflow: StockMarketResamplingWorkflow, mock_resampling_service: Mock
+    ) -> None:
+        """Test that a failed source load is reported for each target timeframe."""
+        mock_resampling_service.load_source_frame.side_effect = DataResamplingError(
+            "Failed to load 1min data for AAPL: disk error"
+        )
+
+        result = workflow.resample_symbol_complete_workflow(
+            "AAPL", target_timeframes=["5min", "1h"]
+        )
+
+        assert not result.success
+        assert result.failed_timeframes == ["5min", "1h"]
+        mock_resampling_service.resample_frame_and_store.assert_not_called()
+
+    def test_multiple_symbols_stop_on_symbol_error(
+        self, workflow: StockMarketResamplingWorkflow, mock_resampling_service: Mock
+    ) -> None:
+        """Test that symbols after a failed one are skipped when asked to stop."""
+        workflow.nightly_settings = Mock(max_concurrent_symbols=1)
+        mock_resampling_service.load_source_frame.side_effect = [
+            pd.DataFrame(),
+            DataResamplingError("Failed to load 1min data for MSFT: disk error"),
+        ]
+        mock_resampling_service.resample_frame_and_store.return_value = (
+            0,
+            pd.DataFrame(),
+        )
+
+        results = workflow.resample_multiple_symbols_complete_workflow(
+            ["AAPL", "MSFT", "NVDA"],
+            target_timeframes=["5min"],
+            stop_on_symbol_error=True,
+        )
+
+        assert list(results) == ["AAPL", "MSFT"]
+        assert results["AAPL"].success
+        assert not results["MSFT"].success
+
+    def test_multiple_symbols_in_worker_processes_use_this_workflow(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that pool workers resample with this workflow and log through it."""
+        storage_settings = Mock()
+        storage_settings.data_storage.base_path = str(tmp_path)
+        storage_settings.data_storage.candles_path = "candles"
+        with patch(
+            "services.storage.data_storage_service.get_settings",
+            return_value=storage_settings,
+        ):
+            storage = DataStorageService()
+            # Only this instance points at the temporary storage; a workflow
+            # built from scratch in a worker would find no source data
+            workflow = StockMarketResamplingWorkflow()
+        workflow.nightly_settings = workflow.nightly_settings.model_copy(
+            update={"max_concurrent_symbols": 2}
+        )
+
+        session_open = datetime(2025, 1, 6, 14, 30, tzinfo=UTC)
+        for symbol in ("AAPL", "MSFT"):
+            storage.store_data(
+                PriceDataSeries(
+                    symbol=symbol,
+                    timeframe=Timeframe.ONE_MIN,
+                    candles=[
+                        PriceCandle(
+                            date=session_open + timedelta(minutes=minute),
+                            open=Decimal("100"),
+                            high=Decimal("101"),
+                            low=Decimal("99"),
+                            close=Decimal("100"),
+                            volume=Decimal("1000"),
+                        )
+                        for minute in range(390)
+                    ],
+                )
+            )
+
+        caplog.set_level(logging.INFO)
+        results = workflow.resample_multiple_symbols_complete_workflow(
+            ["AAPL", "MSFT"], target_timeframes=["5min", "1h"]
+        )
+
+        assert list(results) == ["AAPL", "MSFT"]
+        for result in results.values():
+            assert result.success, result.errors
+            assert result.results["5min"] == 78
+        assert len(storage.load_data("MSFT", "5min").candles) == 78
+        # Per-symbol info lines from the workers reach this process's handlers
+        worker_records = [
+            record
+            for record in caplog.records
+            if record.getMessage().startswith("Completed resampling workflow for ")
+        ]
+        assert sorted(record.getMessage()[34:38] for record in worker_records) == [
+            "AAPL",
+            "MSFT",
+        ]
+
+    def test_get_workflow_summary(self, workflow: StockMarketResamplingWorkflow) -> None:
+        """Test that per-symbol results are summed by timeframe and errors grouped."""
+        workflow_results = {
+            "AAPL": ResamplingWorkflowResult(
+                "AAPL", "1min", ["5min", "1h"], True, results={"5min": 78, "1h": 7}
+            ),
+            "MSFT": ResamplingWorkflowResult(
+                "MSFT",
+                "1min",
+                ["5min", "1h"],
+                False,
+                results={"5min": 78, "1h": 0},
+                errors={"1h": "disk error"},
+            ),
+        }
+
+        summary = workflow.get_workflow_summary(workflow_results)
+
+        assert summary == {
+            "total_symbols": 2,
+            "successful_symbols": 1,
+            "failed_symbols": 1,
+            "total_candles_created": 163,
+            "timeframe_summary": {"5min": 156, "1h": 7},
+            "error_summary": {"1h": ["MSFT: disk error"]},
+        }